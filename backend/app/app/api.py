@@ -4,13 +4,19 @@ from django.http import HttpResponse
 from django.views.decorators.csrf import ensure_csrf_cookie
 
 from board.api import board_router
+from board.async_api import async_board_router
 from card.api import card_router
+from card.async_api import async_card_router
 from user.api import me_router, logout_router, session_router
-from user.auth import AuthHandler
+from user.auth import AsyncAuthHandler, AuthHandler
 
 
 api = NinjaAPI(urls_namespace='api', auth=AuthHandler())
 
+# Async board and card handlers, for ASGI servers.
+async_api = NinjaAPI(
+    urls_namespace='async-api', auth=AsyncAuthHandler(), version='async')
+
 
 api.add_router('boards/', board_router)
 api.add_router('cards/', card_router)
@@ -18,6 +24,9 @@ api.add_router('me/', me_router)
 api.add_router('logout/', logout_router)
 api.add_router('session/', session_router)
 
+async_api.add_router('boards/', async_board_router)
+async_api.add_router('cards/', async_card_router)
+
 
 @api.get("csrf/", auth=None)
 @ensure_csrf_cookie
@@ -32,3 +41,12 @@ def on_integrity_error(request, exc):
         {"detail": "Invalid data. Please check your input."},
         status=400,
     )
+
+
+@async_api.exception_handler(IntegrityError)
+def on_async_integrity_error(request, exc):
+    return async_api.create_response(
+        request,
+        {"detail": "Invalid data. Please check your input."},
+        status=400,
+    )
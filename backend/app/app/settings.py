@@ -13,6 +13,8 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 import os
 from pathlib import Path
 
+from django.core.exceptions import ImproperlyConfigured
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -56,10 +58,44 @@ MIDDLEWARE = [
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'user.middleware.VirtualGuestCookieMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
+# Set SERVER_TIMING=1 to report the query count, database time and
+# serialization time of each request in a Server-Timing header and the logs.
+SERVER_TIMING = bool(int(os.environ.get('SERVER_TIMING', 0)))
+if SERVER_TIMING:
+    MIDDLEWARE.insert(0, 'core.timing.ServerTimingMiddleware')
+
+# Set PROFILER_ENABLED=1 to let staff users, or holders of a token from
+# `manage.py profile_token`, profile single requests by sending an
+# X-Profile header. Stats are written to PROFILER_DIRECTORY. They include
+# every thread of the worker, so profile with GUNICORN_THREADS=1.
+PROFILER = {
+    'ENABLED': bool(int(os.environ.get('PROFILER_ENABLED', 0))),
+    'DIRECTORY': os.environ.get('PROFILER_DIRECTORY', '/tmp/kanban-profiles'),
+    'TOKEN_MAX_AGE': int(os.environ.get('PROFILER_TOKEN_MAX_AGE', 3600)),
+}
+if PROFILER['ENABLED']:
+    MIDDLEWARE.append('core.profiling.ProfilerMiddleware')
+
+# Set METRICS_ENABLED=1 to serve Prometheus metrics at /metrics, guarded by
+# METRICS_TOKEN, which is required unless DEBUG is on. Like the API,
+# metrics must be scraped over HTTPS. Set PROMETHEUS_MULTIPROC_DIR to
+# aggregate the metrics of every gunicorn worker and management command.
+METRICS = {
+    'ENABLED': bool(int(os.environ.get('METRICS_ENABLED', 0))),
+    'TOKEN': os.environ.get('METRICS_TOKEN'),
+}
+if METRICS['ENABLED'] and not (METRICS['TOKEN'] or DEBUG):
+    raise ImproperlyConfigured(
+        'METRICS_TOKEN must be set when METRICS_ENABLED is on and DEBUG '
+        'is off.')
+if METRICS['ENABLED']:
+    MIDDLEWARE.insert(0, 'core.metrics.MetricsMiddleware')
+
 ROOT_URLCONF = 'app.urls'
 
 TEMPLATES = [
@@ -90,9 +126,37 @@ DATABASES = {
         'NAME': os.environ.get('DB_NAME'),
         'USER': os.environ.get('DB_USER'),
         'PASSWORD': os.environ.get('DB_PASS'),
+        # Reuse connections across requests instead of reconnecting for
+        # each one, and check reused connections before handing them out.
+        'CONN_MAX_AGE': int(os.environ.get('DB_CONN_MAX_AGE', 60)),
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
+# Under ASGI the queries of async views run in threads that each hold their
+# own connection, so persistent connections would pile up until
+# max_connections. SERVER_INTERFACE=asgi, which also makes gunicorn.conf.py
+# serve app.asgi, closes them after each request.
+if os.environ.get('SERVER_INTERFACE', 'wsgi') == 'asgi':
+    DATABASES['default']['CONN_MAX_AGE'] = 0
+
+# Set DB_POOL=1 to share connections between the threads of a worker through
+# psycopg's connection pool (requires psycopg[pool]). Pooled connections are
+# returned to the pool after each request, so CONN_MAX_AGE must be 0;
+# CONN_HEALTH_CHECKS makes the pool check connections before lending them.
+if bool(int(os.environ.get('DB_POOL', 0))):
+    DATABASES['default']['CONN_MAX_AGE'] = 0
+    DATABASES['default']['OPTIONS'] = {
+        'pool': {
+            'min_size': int(os.environ.get('DB_POOL_MIN_SIZE', 2)),
+            'max_size': int(os.environ.get('DB_POOL_MAX_SIZE', 10)),
+            'timeout': float(os.environ.get('DB_POOL_TIMEOUT', 10)),
+            'max_idle': float(os.environ.get('DB_POOL_MAX_IDLE', 300)),
+            'max_lifetime': float(
+                os.environ.get('DB_POOL_MAX_LIFETIME', 1800)),
+        },
+    }
+
 # Custom User Model
 AUTH_USER_MODEL = 'user.User'
 
@@ -161,7 +225,84 @@ SOCIAL_AUTH_PIPELINE = (
     'social_core.pipeline.user.user_details',
 )
 
+# Caches
+# Set REDIS_URL to share cached data between workers and hosts (requires
+# the redis package); each process keeps its own local memory otherwise.
+if os.environ.get('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ['REDIS_URL'],
+        },
+        'sessions': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ['REDIS_URL'],
+        },
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        },
+        # Kept apart from the default cache, so cached boards cannot evict
+        # sessions. Local memory is not shared between workers, so it only
+        # backs sessions when SESSION_ENGINE is set explicitly, e.g. with a
+        # single worker.
+        'sessions': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'sessions',
+            'OPTIONS': {
+                'MAX_ENTRIES': int(
+                    os.environ.get('SESSION_CACHE_MAX_ENTRIES', 10000)),
+            },
+        },
+    }
+
+# Rendered board JSON, keyed by board version
+BOARD_CACHE = {
+    'CACHE_ALIAS': os.environ.get('BOARD_CACHE_ALIAS', 'default'),
+    'TIMEOUT': int(os.environ.get('BOARD_CACHE_TIMEOUT', 300)),
+}
+
+# Board change feed
+# Set EVENT_BROKER_BACKEND to 'core.pubsub.PostgresBroker' to fan changes
+# out to the streams of every worker through LISTEN/NOTIFY.
+EVENT_BROKER = {
+    'BACKEND': os.environ.get(
+        'EVENT_BROKER_BACKEND', 'core.pubsub.LocalBroker'),
+    'CHANNEL': os.environ.get('EVENT_BROKER_CHANNEL', 'kanban_events'),
+}
+
+# Guest user cache
+# Set GUEST_USER_CACHE_BACKEND to 'user.cache.DjangoUserCache' to share
+# resolved guests between workers through the GUEST_USER_CACHE_ALIAS cache.
+GUEST_USER_CACHE = {
+    'BACKEND': os.environ.get(
+        'GUEST_USER_CACHE_BACKEND', 'user.cache.LocalUserCache'),
+    'CACHE_ALIAS': os.environ.get('GUEST_USER_CACHE_ALIAS', 'default'),
+    'TIMEOUT': int(os.environ.get('GUEST_USER_CACHE_TIMEOUT', 300)),
+    'MAX_ENTRIES': int(os.environ.get('GUEST_USER_CACHE_MAX_ENTRIES', 10000)),
+}
+
+# Serve read-only requests of new visitors with a virtual guest and only
+# persist the guest and its default board on their first write. Until then
+# the guest id is kept in a signed cookie instead of the session.
+LAZY_GUEST_USERS = bool(int(os.environ.get('LAZY_GUEST_USERS', 0)))
+
 # Session Settings
+# With REDIS_URL set, sessions are read through the shared
+# SESSION_CACHE_ALIAS cache and only hit the database on a cache miss.
+# Otherwise they are read from the database, as a per-process cache would
+# keep serving sessions flushed or changed by other workers. SESSION_ENGINE
+# may also be set to 'django.contrib.sessions.backends.cache' to skip the
+# database entirely (sessions are lost when the cache is), or to
+# 'django.contrib.sessions.backends.signed_cookies' to keep sessions in the
+# client.
+SESSION_ENGINE = os.environ.get(
+    'SESSION_ENGINE',
+    'django.contrib.sessions.backends.cached_db' if os.environ.get('REDIS_URL')
+    else 'django.contrib.sessions.backends.db')
+SESSION_CACHE_ALIAS = os.environ.get('SESSION_CACHE_ALIAS', 'sessions')
 SESSION_COOKIE_SAMESITE = 'None'
 SESSION_COOKIE_SECURE = True
 SESSION_COOKIE_HTTPONLY = False
@@ -173,6 +314,7 @@ SECURE_PROXY_SSL_HEADER = ('HTTP_X_FORWARDED_PROTO', 'https')
 CORS_ALLOWED_ORIGINS = os.environ.get('CORS_ALLOWED_ORIGINS', '').split(',')
 CORS_ALLOWED_ORIGINS = [] if CORS_ALLOWED_ORIGINS == [''] else CORS_ALLOWED_ORIGINS
 CORS_ALLOW_CREDENTIALS = True
+CORS_EXPOSE_HEADERS = ['X-Next-Cursor']
 
 # CSRF settings
 CSRF_TRUSTED_ORIGINS = os.environ.get('CSRF_TRUSTED_ORIGINS', '').split(',')
@@ -18,11 +18,17 @@ from django.contrib import admin
 from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
-from .api import api
+from board.feed import board_events
+from core.metrics import metrics
+from .api import api, async_api
 
 urlpatterns = [
     path('admin/', admin.site.urls),
+    path('api/boards/<uuid:board_id>/events/', board_events,
+         name='board-events'),
+    path('api/async/', async_api.urls),
     path('api/', api.urls),
+    path('metrics', metrics, name='metrics'),
     path('social-auth/', include('social_django.urls', namespace='social')),
 ]
 
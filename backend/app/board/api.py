@@ -1,56 +1,150 @@
 from typing import List
-from ninja import Router
+from django.db.models import Prefetch
+from django.http import HttpResponse
+from ninja import Query, Router
 
 from board.schemas import (
     ColumnBase,
     BoardIn,
     BoardOut,
     BoardListSchema,
+    BoardSnapshotOut,
     BoardUpdate,
     ColumnMoveBeforeIn,
 )
+from board.cache import cached_board_response
 from board.models import Board, Column
+from board.services import delete_board_tree, insert_board
+from card.models import Card
+from core.conditional import conditional_response
+from core.pagination import (
+    NEXT_CURSOR_HEADER,
+    ListQuery,
+    paginate,
+    parse_fields,
+    select_fields,
+    sparse_schema,
+)
 
 
 board_router = Router()
 
 
-@board_router.get('/', response=List[BoardListSchema],
-                  url_name='boards')
-def list_boards(request):
-    """Retrieve list of user's boards."""
-    queryset = Board.objects.filter(user=request.auth)
-    return queryset
+def _virtual_board(user, board_id=None):
+    """
+    Return the virtual default board of a virtual guest, if it matches
+    `board_id` when given.
+    """
+    if not user.is_virtual:
+        return None
+    board = user.default_board
+    if board_id is not None and board_id != str(board.id):
+        return None
+    return board
+
+
+@board_router.get('/', response={
+                      200: List[sparse_schema(BoardListSchema)],
+                      400: dict,
+                  }, url_name='boards', exclude_unset=True)
+def list_boards(request, response: HttpResponse,
+                query: ListQuery = Query(...)):
+    """
+    Retrieve list of user's boards.
+
+    Paginated by `(order, id)` when `limit` or `cursor` is given, with the
+    next page's cursor in the `X-Next-Cursor` header.
+    """
+    try:
+        fields = parse_fields(query.fields, BoardListSchema)
+        virtual_board = _virtual_board(request.auth)
+        if virtual_board:
+            return select_fields([virtual_board], fields)
+        boards, next_cursor = paginate(
+            Board.objects.filter(user=request.auth), query, fields)
+    except ValueError as e:
+        return 400, {"detail": str(e)}
+    if next_cursor:
+        response[NEXT_CURSOR_HEADER] = next_cursor
+    return boards
 
 
 @board_router.post('/', response={201: BoardOut})
 def create_board(request, payload: BoardIn):
     """Create a new board."""
-    board = Board.objects.create(
-        user=request.auth,
-        title=payload.title,
+    board = insert_board(
+        Board(user=request.auth, title=payload.title),
+        [Column(title=column_title) for column_title in payload.columns],
     )
-    for column_title in payload.columns:
-        Column.objects.create(board=board, title=column_title)
     return 201, board
 
 
 @board_router.get('/latest/', response={200: BoardOut, 404: dict},
                   url_name='latest-board')
-def retrieve_latest_board(request):
+def retrieve_latest_board(request, response: HttpResponse):
     """Retrieve the latest updated board."""
+    virtual_board = _virtual_board(request.auth)
+    if virtual_board:
+        return virtual_board
     board = Board.objects.filter(
         user=request.auth).order_by('-updated_at').first()
     if not board:
         return 404, {"detail": "No boards found."}
-    return board
+    not_modified = conditional_response(
+        request, response, board.id, board.updated_at)
+    if not_modified:
+        return not_modified
+    return cached_board_response(
+        request, response, 'detail', board.id, board.updated_at,
+        lambda: BoardOut.from_orm(board).model_dump())
 
 
 @board_router.get('/{board_id}/', response=BoardOut, url_name='board-detail')
-def retrieve_board(request, board_id: str):
+def retrieve_board(request, response: HttpResponse, board_id: str):
     """Retrieve a board."""
+    virtual_board = _virtual_board(request.auth, board_id)
+    if virtual_board:
+        return virtual_board
     board = Board.objects.get(id=board_id, user=request.auth)
-    return board
+    not_modified = conditional_response(
+        request, response, board.id, board.updated_at)
+    if not_modified:
+        return not_modified
+    return cached_board_response(
+        request, response, 'detail', board.id, board.updated_at,
+        lambda: BoardOut.from_orm(board).model_dump())
+
+
+@board_router.get('/{board_id}/snapshot/',
+                  response={200: BoardSnapshotOut, 404: dict},
+                  url_name='board-snapshot')
+def retrieve_board_snapshot(request, response: HttpResponse, board_id: str):
+    """Retrieve a board with its ordered columns and cards."""
+    virtual_board = _virtual_board(request.auth, board_id)
+    if virtual_board:
+        return virtual_board
+    # Check the version before the prefetch fetches the whole tree.
+    updated_at = Board.objects.filter(
+        id=board_id, user=request.auth).values_list(
+            'updated_at', flat=True).first()
+    if updated_at is None:
+        return 404, {"detail": "Board not found."}
+    not_modified = conditional_response(
+        request, response, board_id, updated_at)
+    if not_modified:
+        return not_modified
+    return cached_board_response(
+        request, response, 'snapshot', board_id, updated_at,
+        lambda: BoardSnapshotOut.from_orm(
+            _board_tree(board_id)).model_dump())
+
+
+def _board_tree(board_id):
+    """Fetch a board with its ordered columns and cards."""
+    return Board.objects.prefetch_related(
+        Prefetch('columns', queryset=Column.objects.order_by('order')),
+        Prefetch('columns__cards', queryset=Card.objects.order_by('order')),
+    ).get(id=board_id)
 
 
 @board_router.patch('/{board_id}/', response=BoardOut)
@@ -67,7 +161,7 @@ def update_board(request, board_id: str, payload: BoardUpdate):
 def delete_board(request, board_id: str):
     """Delete a board."""
     board = Board.objects.get(id=board_id, user=request.auth)
-    board.delete()
+    delete_board_tree(board)
     return 204, None
 
 
@@ -118,7 +212,7 @@ def move_column_before(
             return 404, {"detail": "Target column must be in the same board."}
     except Column.DoesNotExist:
         return 404, {"detail": "Column not found."}
-    column.above(target_column)
+    column.place_above(target_column)
     return 200, None
 
 
@@ -132,5 +226,5 @@ def move_column_to_end(request, board_id: str, column_id: str):
             id=column_id, board__user=request.auth)
     except Column.DoesNotExist:
         return 404, {"detail": "Column not found."}
-    column.bottom()
+    column.place_bottom()
     return 200, None
@@ -0,0 +1,225 @@
+from typing import List
+from asgiref.sync import sync_to_async
+from django.db.models import Prefetch, aprefetch_related_objects
+from django.http import HttpResponse
+from ninja import Query, Router
+
+from board.api import _virtual_board
+from board.cache import acached_board_response
+from board.schemas import (
+    ColumnBase,
+    BoardIn,
+    BoardOut,
+    BoardListSchema,
+    BoardSnapshotOut,
+    BoardUpdate,
+    ColumnMoveBeforeIn,
+)
+from board.models import Board, Column
+from board.services import delete_board_tree, insert_board
+from card.models import Card
+from core.conditional import conditional_response
+from core.pagination import (
+    NEXT_CURSOR_HEADER,
+    ListQuery,
+    apaginate,
+    parse_fields,
+    select_fields,
+    sparse_schema,
+)
+
+
+async_board_router = Router()
+
+
+async def _board_out(board):
+    """Load the columns `BoardOut` renders, as serialization is sync."""
+    await aprefetch_related_objects([board], 'columns')
+    return board
+
+
+async def _board_with_columns(**lookup):
+    return await Board.objects.prefetch_related('columns').aget(**lookup)
+
+
+@async_board_router.get('/', response={
+                            200: List[sparse_schema(BoardListSchema)],
+                            400: dict,
+                        }, url_name='boards', exclude_unset=True)
+async def list_boards(request, response: HttpResponse,
+                      query: ListQuery = Query(...)):
+    """Retrieve list of user's boards."""
+    try:
+        fields = parse_fields(query.fields, BoardListSchema)
+        virtual_board = _virtual_board(request.auth)
+        if virtual_board:
+            return select_fields([virtual_board], fields)
+        boards, next_cursor = await apaginate(
+            Board.objects.filter(user=request.auth), query, fields)
+    except ValueError as e:
+        return 400, {"detail": str(e)}
+    if next_cursor:
+        response[NEXT_CURSOR_HEADER] = next_cursor
+    return boards
+
+
+@async_board_router.post('/', response={201: BoardOut})
+async def create_board(request, payload: BoardIn):
+    """Create a new board."""
+    board = await sync_to_async(insert_board)(
+        Board(user=request.auth, title=payload.title),
+        [Column(title=column_title) for column_title in payload.columns],
+    )
+    return 201, await _board_out(board)
+
+
+@async_board_router.get('/latest/', response={200: BoardOut, 404: dict},
+                        url_name='latest-board')
+async def retrieve_latest_board(request, response: HttpResponse):
+    """Retrieve the latest updated board."""
+    virtual_board = _virtual_board(request.auth)
+    if virtual_board:
+        return virtual_board
+    board = await Board.objects.filter(
+        user=request.auth).order_by('-updated_at').afirst()
+    if not board:
+        return 404, {"detail": "No boards found."}
+    return await _cached_board(request, response, board)
+
+
+@async_board_router.get('/{board_id}/', response=BoardOut,
+                        url_name='board-detail')
+async def retrieve_board(request, response: HttpResponse, board_id: str):
+    """Retrieve a board."""
+    virtual_board = _virtual_board(request.auth, board_id)
+    if virtual_board:
+        return virtual_board
+    board = await Board.objects.aget(id=board_id, user=request.auth)
+    return await _cached_board(request, response, board)
+
+
+async def _cached_board(request, response, board):
+    not_modified = conditional_response(
+        request, response, board.id, board.updated_at)
+    if not_modified:
+        return not_modified
+
+    async def build():
+        board_with_columns = await _board_with_columns(pk=board.pk)
+        return BoardOut.from_orm(board_with_columns).model_dump()
+
+    return await acached_board_response(
+        request, response, 'detail', board.id, board.updated_at, build)
+
+
+@async_board_router.get('/{board_id}/snapshot/',
+                        response={200: BoardSnapshotOut, 404: dict},
+                        url_name='board-snapshot')
+async def retrieve_board_snapshot(
+        request, response: HttpResponse, board_id: str):
+    """Retrieve a board with its ordered columns and cards."""
+    virtual_board = _virtual_board(request.auth, board_id)
+    if virtual_board:
+        return virtual_board
+    updated_at = await Board.objects.filter(
+        id=board_id, user=request.auth).values_list(
+            'updated_at', flat=True).afirst()
+    if updated_at is None:
+        return 404, {"detail": "Board not found."}
+    not_modified = conditional_response(
+        request, response, board_id, updated_at)
+    if not_modified:
+        return not_modified
+
+    async def build():
+        board = await Board.objects.prefetch_related(
+            Prefetch('columns', queryset=Column.objects.order_by('order')),
+            Prefetch('columns__cards',
+                     queryset=Card.objects.order_by('order')),
+        ).aget(id=board_id)
+        return BoardSnapshotOut.from_orm(board).model_dump()
+
+    return await acached_board_response(
+        request, response, 'snapshot', board_id, updated_at, build)
+
+
+@async_board_router.patch('/{board_id}/', response=BoardOut)
+async def update_board(request, board_id: str, payload: BoardUpdate):
+    """Update a board."""
+    board = await _board_with_columns(id=board_id, user=request.auth)
+    for field, value in payload.dict(exclude_unset=True).items():
+        setattr(board, field, value)
+    await board.asave()
+    return board
+
+
+@async_board_router.delete('/{board_id}/', response={204: None})
+async def delete_board(request, board_id: str):
+    """Delete a board."""
+    board = await Board.objects.aget(id=board_id, user=request.auth)
+    await sync_to_async(delete_board_tree)(board)
+    return 204, None
+
+
+@async_board_router.post('/{board_id}/columns/', response=BoardOut,
+                         url_name='columns')
+async def add_column(request, board_id: str, payload: ColumnBase):
+    """Add a new column to a board."""
+    board = await Board.objects.aget(id=board_id, user=request.auth)
+    await Column.objects.acreate(board=board, title=payload.title)
+    return await _board_out(board)
+
+
+@async_board_router.delete('/{board_id}/columns/{column_id}/',
+                           response={204: None}, url_name='column-detail')
+async def delete_column(request, board_id: str, column_id: str):
+    """Delete a column from a board."""
+    board = await Board.objects.aget(id=board_id, user=request.auth)
+    column = await Column.objects.aget(id=column_id, board=board)
+    await column.adelete()
+    return 204, None
+
+
+@async_board_router.patch('/{board_id}/columns/{column_id}/',
+                          response=BoardOut, url_name='column-detail')
+async def update_column(
+        request, board_id: str, column_id: str, payload: ColumnBase):
+    """Update a column from a board."""
+    board = await Board.objects.aget(id=board_id, user=request.auth)
+    column = await Column.objects.aget(id=column_id, board=board)
+    for field, value in payload.dict(exclude_unset=True).items():
+        setattr(column, field, value)
+    await column.asave()
+    return await _board_out(board)
+
+
+@async_board_router.post('/{board_id}/columns/{column_id}/move-before/',
+                         response={200: None, 404: dict},
+                         url_name='column-move-before')
+async def move_column_before(
+        request, board_id: str, column_id: str, payload: ColumnMoveBeforeIn):
+    """Move a column before another column."""
+    try:
+        column = await Column.objects.aget(
+            id=column_id, board__id=board_id, board__user=request.auth)
+        target_column = await Column.objects.aget(
+            id=payload.target_column_id, board__id=board_id,
+            board__user=request.auth)
+    except Column.DoesNotExist:
+        return 404, {"detail": "Column not found."}
+    await sync_to_async(column.place_above)(target_column)
+    return 200, None
+
+
+@async_board_router.post('/{board_id}/columns/{column_id}/move-end/',
+                         response={200: None, 404: dict},
+                         url_name='column-move-end')
+async def move_column_to_end(request, board_id: str, column_id: str):
+    """Move a column to the end of its board."""
+    try:
+        column = await Column.objects.aget(
+            id=column_id, board__user=request.auth)
+    except Column.DoesNotExist:
+        return 404, {"detail": "Column not found."}
+    await sync_to_async(column.place_bottom)()
+    return 200, None
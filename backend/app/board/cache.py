@@ -0,0 +1,70 @@
+from django.conf import settings
+from django.core.cache import caches
+from ninja.renderers import JSONRenderer
+
+from core.timing import serialization_timer
+
+_renderer = JSONRenderer()
+
+
+def board_cache_key(kind, board_id, updated_at):
+    """
+    Return the cache key of one serialized version of a board.
+
+    Every column and card write bumps `Board.updated_at` through the board
+    touch, so stale versions are never read again and just expire.
+    """
+    version = int(updated_at.timestamp() * 1000000)
+    return f'board:{kind}:{board_id}:{version}'
+
+
+def cached_board_response(request, response, kind, board_id, updated_at,
+                          build):
+    """
+    Fill the temporal `response` with the JSON of a board version.
+
+    The rendered bytes are read from the `BOARD_CACHE` cache; on a miss
+    `build()` returns the response data, which is rendered like
+    django-ninja would and stored. Returns `response`.
+    """
+    cache, timeout = _board_cache()
+    key = board_cache_key(kind, board_id, updated_at)
+    content = cache.get(key)
+    if content is None:
+        with serialization_timer():
+            content = _renderer.render(
+                request, build(), response_status=200)
+        cache.set(key, content, timeout)
+    return _fill(response, content)
+
+
+async def acached_board_response(request, response, kind, board_id,
+                                 updated_at, build):
+    """
+    Async version of `cached_board_response`, where `build()` returns an
+    awaitable.
+    """
+    cache, timeout = _board_cache()
+    key = board_cache_key(kind, board_id, updated_at)
+    content = await cache.aget(key)
+    if content is None:
+        with serialization_timer():
+            content = _renderer.render(
+                request, await build(), response_status=200)
+        await cache.aset(key, content, timeout)
+    return _fill(response, content)
+
+
+def _board_cache():
+    options = getattr(settings, 'BOARD_CACHE', {})
+    return (
+        caches[options.get('CACHE_ALIAS', 'default')],
+        options.get('TIMEOUT', 300),
+    )
+
+
+def _fill(response, content):
+    response.content = content
+    response.headers['Content-Type'] = (
+        f'{_renderer.media_type}; charset={_renderer.charset}')
+    return response
@@ -0,0 +1,49 @@
+import json
+
+from django.db import transaction
+from ninja.responses import NinjaJSONEncoder
+
+from core.pubsub import get_broker
+
+
+def board_channel(board_id):
+    """Return the broker channel carrying the changes of a board."""
+    return f'board:{board_id}'
+
+
+def publish_change(board_id, kind, action, object_id, data=None):
+    """
+    Announce that a board, column or card of a board was saved or deleted.
+
+    The message is published once the current transaction commits, so
+    subscribers never see changes that are rolled back.
+    """
+    message = {
+        'type': f'{kind}.{action}',
+        'id': str(object_id),
+        'board_id': str(board_id),
+    }
+    if data is not None:
+        message['data'] = data
+    transaction.on_commit(
+        lambda: get_broker().publish(board_channel(board_id), message))
+
+
+def publish_saved(board_id, kind, instance):
+    """
+    Announce a saved board, column or card with its `data` as the API
+    returns it, so subscribers can apply the change without refetching.
+    """
+    # The schemas import the models publishing the changes.
+    from board.schemas import BoardListSchema, ColumnSchema
+    from card.schemas import CardOut
+
+    if kind == 'board':
+        schema = BoardListSchema.from_orm(instance)
+    elif kind == 'column':
+        schema = ColumnSchema(id=str(instance.pk), title=instance.title)
+    else:
+        schema = CardOut.from_orm(instance)
+    # Encoded like API responses, e.g. datetimes in milliseconds.
+    data = json.loads(json.dumps(schema, cls=NinjaJSONEncoder))
+    publish_change(board_id, kind, 'saved', instance.pk, data=data)
@@ -0,0 +1,64 @@
+import asyncio
+import json
+
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views.decorators.http import require_GET
+
+from board.events import board_channel
+from board.models import Board
+from core.pubsub import get_broker
+from user.auth import AuthHandler
+
+# Seconds between comment lines keeping idle connections open through
+# proxies, and the reconnection delay suggested to clients.
+KEEPALIVE_INTERVAL = 15
+RETRY_MILLISECONDS = 3000
+
+
+async def _event_stream(board_id):
+    async with get_broker().subscribe(board_channel(board_id)) as queue:
+        yield f'retry: {RETRY_MILLISECONDS}\n\n'
+        while True:
+            try:
+                message = await asyncio.wait_for(
+                    queue.get(), timeout=KEEPALIVE_INTERVAL)
+            except TimeoutError:
+                yield ': keepalive\n\n'
+                continue
+            yield f"event: {message['type']}\ndata: {json.dumps(message)}\n\n"
+
+
+@sync_to_async
+def _can_subscribe(request, board_id):
+    # A guest is never created here, so anonymous subscribers cannot make
+    # guests pile up.
+    user = AuthHandler().get_existing_user(request)
+    if user is None:
+        return False
+    if user.is_virtual:
+        return str(user.default_board.id) == str(board_id)
+    return Board.objects.filter(id=board_id, user=user).exists()
+
+
+@require_GET
+async def board_events(request, board_id):
+    """
+    Stream the changes of a board as Server-Sent Events.
+
+    Each event is named after the change, e.g. `card.saved`, and carries the
+    `type`, `id` and `board_id` of the changed object. Saved objects also
+    carry their `data` as the API returns it. Needs an ASGI server,
+    since the connection stays open.
+    """
+    if not isinstance(request, ASGIRequest):
+        return JsonResponse(
+            {"detail": "Event streams require an ASGI server."}, status=501)
+    if not await _can_subscribe(request, board_id):
+        return JsonResponse({"detail": "Board not found."}, status=404)
+    response = StreamingHttpResponse(
+        _event_stream(board_id), content_type='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:22
+
+import core.deletion
+import django.db.models.deletion
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('board', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='column',
+            name='board',
+            field=core.deletion.CascadeForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='columns', to='board.board'),
+        ),
+        # Django cannot declare ON DELETE CASCADE, so the constraint it
+        # created is replaced under the same name. An AlterField of the
+        # field recreates the constraint without it; core.W001 flags that.
+        migrations.RunSQL(
+            sql=(
+                'ALTER TABLE "board_column" DROP CONSTRAINT "board_column_board_id_567562b6_fk_board_board_id", '
+                'ADD CONSTRAINT "board_column_board_id_567562b6_fk_board_board_id" '
+                'FOREIGN KEY ("board_id") REFERENCES "board_board" ("id") ON DELETE CASCADE DEFERRABLE INITIALLY DEFERRED;'
+            ),
+            reverse_sql=(
+                'ALTER TABLE "board_column" DROP CONSTRAINT "board_column_board_id_567562b6_fk_board_board_id", '
+                'ADD CONSTRAINT "board_column_board_id_567562b6_fk_board_board_id" '
+                'FOREIGN KEY ("board_id") REFERENCES "board_board" ("id") DEFERRABLE INITIALLY DEFERRED;'
+            ),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:34
+
+import core.deletion
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('board', '0003_column_board_db_cascade'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='board',
+            name='user',
+            field=core.deletion.CascadeForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL),
+        ),
+        # Django cannot declare ON DELETE CASCADE, so the constraint it
+        # created is replaced under the same name. An AlterField of the
+        # field recreates the constraint without it; core.W001 flags that.
+        migrations.RunSQL(
+            sql=(
+                'ALTER TABLE "board_board" DROP CONSTRAINT "board_board_user_id_d066aaa7_fk_user_user_id", '
+                'ADD CONSTRAINT "board_board_user_id_d066aaa7_fk_user_user_id" '
+                'FOREIGN KEY ("user_id") REFERENCES "user_user" ("id") ON DELETE CASCADE DEFERRABLE INITIALLY DEFERRED;'
+            ),
+            reverse_sql=(
+                'ALTER TABLE "board_board" DROP CONSTRAINT "board_board_user_id_d066aaa7_fk_user_user_id", '
+                'ADD CONSTRAINT "board_board_user_id_d066aaa7_fk_user_user_id" '
+                'FOREIGN KEY ("user_id") REFERENCES "user_user" ("id") DEFERRABLE INITIALLY DEFERRED;'
+            ),
+        ),
+    ]
@@ -1,8 +1,13 @@
 import uuid
-from django.db import models
+from django.db import models, transaction
 from ordered_model.models import OrderedModel  # type: ignore
 from django.contrib.auth import get_user_model
 
+from board.events import publish_change, publish_saved
+from board.touch import touch_boards
+from core.deletion import CascadeForeignKey
+from core.ordering import GapOrderedMixin, OrderedManager
+
 User = get_user_model()
 
 
@@ -10,7 +15,7 @@ class Board(OrderedModel):
     id = models.UUIDField(
         primary_key=True, default=uuid.uuid4, editable=False
     )
-    user = models.ForeignKey(User, on_delete=models.CASCADE)
+    user = CascadeForeignKey(User, on_delete=models.CASCADE)
     title = models.CharField(max_length=255)
     starred = models.BooleanField(default=False)
     is_default = models.BooleanField(default=False)
@@ -29,30 +34,50 @@ class Board(OrderedModel):
     def __str__(self):
         return self.title
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        publish_saved(self.pk, 'board', self)
+
+    def delete(self, *args, **kwargs):
+        publish_change(self.pk, 'board', 'deleted', self.pk)
+        return super().delete(*args, **kwargs)
+
 
-class Column(OrderedModel):
+class Column(GapOrderedMixin, OrderedModel):
     id = models.UUIDField(
         primary_key=True, default=uuid.uuid4, editable=False
     )
-    board = models.ForeignKey(
+    board = CascadeForeignKey(
         Board, on_delete=models.CASCADE, related_name="columns"
     )
     title = models.CharField(max_length=255)
     order_with_respect_to = 'board'
 
+    objects = OrderedManager()
+
     def __str__(self):
         return self.title
 
     def _touch_board(self):
-        self.board.save(update_fields=['updated_at'])
+        now = touch_boards(board_ids=[self.board_id])
+        if Column.board.is_cached(self):
+            self.board.updated_at = now
 
+    # The board is touched after the row is written, in the same
+    # transaction, so no reader sees the new board version with old rows.
     def save(self, *args, **kwargs):
-        self._touch_board()
-        super().save(*args, **kwargs)
+        with transaction.atomic(savepoint=False):
+            super().save(*args, **kwargs)
+            self._touch_board()
+        publish_saved(self.board_id, 'column', self)
 
     def delete(self, *args, **kwargs):
-        self._touch_board()
-        super().delete(*args, **kwargs)
+        pk = self.pk
+        with transaction.atomic(savepoint=False):
+            result = super().delete(*args, **kwargs)
+            self._touch_board()
+            publish_change(self.board_id, 'column', 'deleted', pk)
+        return result
 
     class Meta(OrderedModel.Meta):
         constraints = [
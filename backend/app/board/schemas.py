@@ -2,6 +2,7 @@ from ninja import ModelSchema, Schema
 from typing import List
 
 from board.models import Board
+from card.schemas import CardListSchema
 
 
 class ColumnBase(Schema):
@@ -64,6 +65,26 @@ class BoardOut(ModelSchema):
         ]
 
 
+class ColumnSnapshotSchema(ColumnSchema):
+    cards: List[CardListSchema]
+
+
+class BoardSnapshotOut(BoardOut):
+    """Schema for a board with its ordered columns and cards."""
+    columns: List[ColumnSnapshotSchema]
+
+    @staticmethod
+    def resolve_columns(board):
+        return [
+            ColumnSnapshotSchema(
+                id=str(c.id),
+                title=c.title,
+                cards=[CardListSchema.from_orm(k) for k in c.cards.all()],
+            )
+            for c in board.columns.all()
+        ]
+
+
 class ColumnMoveBeforeIn(Schema):
     """Schema for moving a column before another column."""
     target_column_id: str
@@ -0,0 +1,7 @@
+from .delete_board_tree import delete_board_tree
+from .insert_board import insert_board
+
+__all__ = [
+    'delete_board_tree',
+    'insert_board',
+]
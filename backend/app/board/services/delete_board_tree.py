@@ -0,0 +1,19 @@
+from django.db import transaction
+
+from board.events import publish_change
+from board.models import Board
+from core.deletion import raw_delete
+
+
+def delete_board_tree(board):
+    """
+    Delete a board together with its columns and cards.
+
+    The board row is removed with a raw DELETE and the database cascades it
+    to columns and cards, so no child row is loaded. The following boards of
+    the owner are shifted up like `OrderedModel.delete` would.
+    """
+    with transaction.atomic():
+        raw_delete(Board.objects.filter(pk=board.pk))
+        board.get_ordering_queryset().above_instance(board).decrease_order()
+        publish_change(board.pk, 'board', 'deleted', board.pk)
@@ -0,0 +1,21 @@
+from django.db import transaction
+
+from board.models import Column
+from core.ordering import ORDER_GAP
+
+
+def insert_board(board, columns):
+    """
+    Save an unsaved board and its unsaved columns.
+
+    Column orders are assigned in memory and all columns are written with a
+    single INSERT, so the cost does not depend on the number of columns and
+    no board touch is issued for a board that was just created.
+    """
+    with transaction.atomic():
+        board.save()
+        for position, column in enumerate(columns, start=1):
+            column.board = board
+            column.order = position * ORDER_GAP
+        Column.objects.bulk_create(columns)
+    return board
@@ -1,10 +1,13 @@
 import json
 
 from django.contrib.auth import get_user_model
+from django.db import connection
 from django.test import Client, TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from board.models import Board, Column
+from card.models import Card
 
 User = get_user_model()
 BOARD_URL = reverse('api:boards')
@@ -16,6 +19,11 @@ def board_detail_url(board_id: int) -> str:
     return reverse('api:board-detail', args=[str(board_id)])
 
 
+def board_snapshot_url(board_id: int) -> str:
+    """Return the snapshot URL for a board."""
+    return reverse('api:board-snapshot', args=[str(board_id)])
+
+
 def column_url(board_id: int) -> str:
     return reverse('api:columns', args=[board_id])
 
@@ -64,6 +72,44 @@ class PrivateBoardsApiTests(TestCase):
             self.assertEqual(board_data['starred'], expected_board.starred)
             self.assertIn('updated_at', board_data)
 
+    def test_retrieve_boards_paginated(self):
+        """Test paging through boards with a cursor."""
+        boards = [
+            Board.objects.create(title=f'b{i}', user=self.user)
+            for i in range(5)
+        ]
+        seen = []
+        params = {'limit': 2}
+        while True:
+            res = self.client.get(BOARD_URL, params)
+            self.assertEqual(res.status_code, 200)
+            seen += [board['id'] for board in res.json()]
+            cursor = res.headers.get('X-Next-Cursor')
+            if not cursor:
+                break
+            params = {'limit': 2, 'cursor': cursor}
+        self.assertEqual(seen, [str(board.id) for board in boards])
+
+    def test_retrieve_boards_sparse_fields(self):
+        """Test only the requested fields are returned, in one list query."""
+        boards = [
+            Board.objects.create(title=f'b{i}', user=self.user)
+            for i in range(5)
+        ]
+        # Session, user and boards.
+        with self.assertNumQueries(3):
+            res = self.client.get(BOARD_URL, {'fields': 'id,title'})
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.json(), [
+            {'id': str(board.id), 'title': board.title} for board in boards])
+
+    def test_retrieve_boards_invalid_query(self):
+        """Test unknown fields and malformed cursors are rejected."""
+        res = self.client.get(BOARD_URL, {'fields': 'id,user'})
+        self.assertEqual(res.status_code, 400)
+        res = self.client.get(BOARD_URL, {'cursor': 'not-a-cursor'})
+        self.assertEqual(res.status_code, 400)
+
     def test_create_board(self):
         """Test creating a new board with columns."""
         payload = {
@@ -113,6 +159,138 @@ class PrivateBoardsApiTests(TestCase):
         self.assertIn('updated_at', content)
         self.assertIn('starred', content)
 
+    def test_retrieve_board_not_modified(self):
+        """Test a matching If-None-Match is answered with 304."""
+        board = Board.objects.create(user=self.user, title='A Board')
+        res = self.client.get(board_detail_url(board.id))
+        self.assertEqual(res.status_code, 200)
+        etag = res.headers['ETag']
+
+        res = self.client.get(
+            board_detail_url(board.id), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.status_code, 304)
+        self.assertEqual(res.content, b'')
+
+    def test_retrieve_board_modified_after_card_change(self):
+        """Test the ETag changes when a card of the board changes."""
+        board = Board.objects.create(user=self.user, title='A Board')
+        column = Column.objects.create(board=board, title='To Do')
+        etag = self.client.get(board_detail_url(board.id)).headers['ETag']
+
+        Card.objects.create(column=column, title='Card')
+        res = self.client.get(
+            board_detail_url(board.id), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.status_code, 200)
+        self.assertNotEqual(res.headers['ETag'], etag)
+
+    def test_retrieve_board_if_modified_since_ignored(self):
+        """
+        Test If-Modified-Since is not honoured, as it cannot tell apart
+        changes made within the same second.
+        """
+        board = Board.objects.create(user=self.user, title='A Board')
+        last_modified = self.client.get(
+            board_detail_url(board.id)).headers['Last-Modified']
+        Column.objects.create(board=board, title='To Do')
+        res = self.client.get(
+            board_detail_url(board.id),
+            HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(
+            [column['title'] for column in res.json()['columns']], ['To Do'])
+
+    def test_retrieve_board_snapshot_not_modified(self):
+        """Test a 304 snapshot does not fetch the board tree."""
+        board = Board.objects.create(user=self.user, title='A Board')
+        Column.objects.create(board=board, title='To Do')
+        etag = self.client.get(board_snapshot_url(board.id)).headers['ETag']
+
+        with CaptureQueriesContext(connection) as ctx:
+            res = self.client.get(
+                board_snapshot_url(board.id), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.status_code, 304)
+        self.assertFalse(any(
+            'board_column' in q['sql'] for q in ctx.captured_queries))
+
+    def test_retrieve_board_snapshot_served_from_cache(self):
+        """Test a repeated snapshot read skips the tree fetch."""
+        board = Board.objects.create(user=self.user, title='A Board')
+        column = Column.objects.create(board=board, title='To Do')
+        Card.objects.create(column=column, title='Card')
+        first = self.client.get(board_snapshot_url(board.id))
+
+        with CaptureQueriesContext(connection) as ctx:
+            second = self.client.get(board_snapshot_url(board.id))
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.content, first.content)
+        self.assertFalse(any(
+            'board_column' in q['sql'] for q in ctx.captured_queries))
+
+    def test_retrieve_board_cache_follows_board_touch(self):
+        """Test a cached board is not served after its columns change."""
+        board = Board.objects.create(user=self.user, title='A Board')
+        self.client.get(board_detail_url(board.id))
+        Column.objects.create(board=board, title='To Do')
+
+        res = self.client.get(board_detail_url(board.id))
+        self.assertEqual(
+            [column['title'] for column in res.json()['columns']], ['To Do'])
+
+    def test_retrieve_board_snapshot(self):
+        """Test retrieving a board with its ordered columns and cards."""
+        board = Board.objects.create(user=self.user, title='A Board')
+        col1 = Column.objects.create(board=board, title='To Do')
+        col2 = Column.objects.create(board=board, title='Done')
+        col2.above(col1)
+        card1 = Card.objects.create(title='Card 1', column=col1)
+        card2 = Card.objects.create(title='Card 2', column=col1)
+        card2.above(card1)
+        res = self.client.get(board_snapshot_url(board.id))
+        self.assertEqual(res.status_code, 200)
+        content = json.loads(res.content.decode('utf-8'))
+        self.assertEqual(content['id'], str(board.id))
+        self.assertEqual(
+            [col['id'] for col in content['columns']],
+            [str(col2.id), str(col1.id)]
+        )
+        self.assertEqual(content['columns'][0]['cards'], [])
+        self.assertEqual(
+            content['columns'][1]['cards'],
+            [
+                {'id': str(c.id), 'title': c.title, 'priority': c.priority}
+                for c in (card2, card1)
+            ]
+        )
+
+    def test_retrieve_board_snapshot_query_count_is_constant(self):
+        """
+        Test that the snapshot query count does not grow with the number of
+        columns and cards.
+        """
+        board = Board.objects.create(user=self.user, title='A Board')
+        column = Column.objects.create(board=board, title='Column 0')
+        Card.objects.create(title='Card', column=column)
+        with CaptureQueriesContext(connection) as small:
+            self.client.get(board_snapshot_url(board.id))
+
+        for i in range(1, 5):
+            column = Column.objects.create(board=board, title=f'Column {i}')
+            for j in range(3):
+                Card.objects.create(title=f'Card {j}', column=column)
+        with CaptureQueriesContext(connection) as large:
+            res = self.client.get(board_snapshot_url(board.id))
+
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(len(large.captured_queries),
+                         len(small.captured_queries))
+
+    def test_retrieve_board_snapshot_not_owned(self):
+        """Test that retrieving a snapshot of another user's board fails."""
+        another_user = User.objects.create_user('anotheruser@example.com')
+        board = Board.objects.create(user=another_user, title='A Board')
+        res = self.client.get(board_snapshot_url(board.id))
+        self.assertEqual(res.status_code, 404)
+
     def test_retrieve_latest_updated_board(self):
         """Test retrieving the latest updated board."""
         Board.objects.create(
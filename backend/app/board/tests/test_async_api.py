@@ -0,0 +1,100 @@
+import json
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from board.models import Board, Column
+from card.models import Card
+
+User = get_user_model()
+BOARD_URL = reverse('async-api:boards')
+
+
+def board_detail_url(board_id) -> str:
+    """Return the async detail URL for a board."""
+    return reverse('async-api:board-detail', args=[str(board_id)])
+
+
+def board_snapshot_url(board_id) -> str:
+    """Return the async snapshot URL for a board."""
+    return reverse('async-api:board-snapshot', args=[str(board_id)])
+
+
+def column_url(board_id) -> str:
+    return reverse('async-api:columns', args=[str(board_id)])
+
+
+class AsyncBoardsApiTests(TestCase):
+    """Test authenticated requests to the async boards API."""
+
+    def setUp(self):
+        self.user = User.objects.create_user('testuser@example.com')
+        self.async_client.force_login(self.user)
+
+    async def test_list_boards(self):
+        """Test retrieving the list of the user's boards."""
+        board = await Board.objects.acreate(user=self.user, title='b1')
+        other = await User.objects.acreate(username='other@example.com')
+        await Board.objects.acreate(user=other, title='b2')
+        res = await self.async_client.get(BOARD_URL)
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual([b['id'] for b in res.json()], [str(board.id)])
+
+    async def test_create_board(self):
+        """Test creating a board with columns."""
+        payload = {'title': 'New Board', 'columns': ['To Do', 'Done']}
+        res = await self.async_client.post(
+            BOARD_URL, json.dumps(payload), content_type='application/json')
+        self.assertEqual(res.status_code, 201)
+        self.assertEqual(
+            [column['title'] for column in res.json()['columns']],
+            payload['columns'],
+        )
+
+    async def test_retrieve_board(self):
+        """Test retrieving a board with its columns, and its 304."""
+        board = await Board.objects.acreate(user=self.user, title='b1')
+        await Column.objects.acreate(board=board, title='To Do')
+        res = await self.async_client.get(board_detail_url(board.id))
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.json()['columns'][0]['title'], 'To Do')
+
+        res = await self.async_client.get(
+            board_detail_url(board.id), headers={'If-None-Match': res['ETag']})
+        self.assertEqual(res.status_code, 304)
+
+    async def test_retrieve_board_snapshot(self):
+        """Test retrieving a board with its columns and cards."""
+        board = await Board.objects.acreate(user=self.user, title='b1')
+        column = await Column.objects.acreate(board=board, title='To Do')
+        card = await Card.objects.acreate(column=column, title='Card')
+        res = await self.async_client.get(board_snapshot_url(board.id))
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(
+            res.json()['columns'][0]['cards'][0]['id'], str(card.id))
+
+    async def test_add_column(self):
+        """Test adding a column to a board."""
+        board = await Board.objects.acreate(user=self.user, title='b1')
+        res = await self.async_client.post(
+            column_url(board.id), json.dumps({'title': 'To Do'}),
+            content_type='application/json')
+        self.assertEqual(res.status_code, 200)
+        self.assertTrue(
+            await Column.objects.filter(board=board, title='To Do').aexists())
+
+    async def test_delete_board(self):
+        """Test deleting a board."""
+        board = await Board.objects.acreate(user=self.user, title='b1')
+        res = await self.async_client.delete(board_detail_url(board.id))
+        self.assertEqual(res.status_code, 204)
+        self.assertFalse(await Board.objects.filter(id=board.id).aexists())
+
+
+class AsyncGuestApiTests(TestCase):
+    async def test_anonymous_request_gets_guest(self):
+        """Test that unauthenticated requests are served as a guest."""
+        res = await self.async_client.get(BOARD_URL)
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(len(res.json()), 1)
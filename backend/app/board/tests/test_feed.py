@@ -0,0 +1,197 @@
+import asyncio
+import json
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.db import connections
+from django.test import Client, TestCase, TransactionTestCase
+from django.urls import reverse
+
+from board.events import board_channel
+from board.models import Board, Column
+from card.models import Card
+from core.pubsub import (
+    MAX_NOTIFY_PAYLOAD,
+    LocalBroker,
+    PostgresBroker,
+    get_broker,
+)
+
+User = get_user_model()
+
+
+def board_events_url(board_id) -> str:
+    """Return the event stream URL of a board."""
+    return reverse('board-events', args=[board_id])
+
+
+class PublishChangeTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='testuser@example.com')
+        self.board = Board.objects.create(user=self.user, title='Board')
+        self.column = Column.objects.create(board=self.board, title='To Do')
+
+    def test_card_save_is_published_on_commit(self):
+        """Test that saving a card publishes a change after commit."""
+        with patch.object(get_broker(), 'publish') as publish:
+            with self.captureOnCommitCallbacks(execute=True):
+                card = Card.objects.create(column=self.column, title='Card')
+                publish.assert_not_called()
+        self.client.force_login(self.user)
+        publish.assert_any_call(board_channel(self.board.id), {
+            'type': 'card.saved',
+            'id': str(card.id),
+            'board_id': str(self.board.id),
+            'data': json.loads(self.client.get(
+                reverse('api:card-detail', args=[card.id])).content),
+        })
+
+    def test_column_save_carries_data(self):
+        """Test that a saved column is published with its payload."""
+        with patch.object(get_broker(), 'publish') as publish:
+            with self.captureOnCommitCallbacks(execute=True):
+                self.column.title = 'Backlog'
+                self.column.save()
+        message = publish.call_args.args[1]
+        self.assertEqual(message['data'], {
+            'id': str(self.column.id), 'title': 'Backlog'})
+
+    def test_deleted_change_carries_ids_only(self):
+        """Test that deletions are published without a payload."""
+        card = Card.objects.create(column=self.column, title='Card')
+        card_id = card.id
+        with patch.object(get_broker(), 'publish') as publish:
+            with self.captureOnCommitCallbacks(execute=True):
+                card.delete()
+        publish.assert_any_call(board_channel(self.board.id), {
+            'type': 'card.deleted',
+            'id': str(card_id),
+            'board_id': str(self.board.id),
+        })
+
+    def test_rolled_back_change_is_not_published(self):
+        """Test that nothing is published when the transaction fails."""
+        with patch.object(get_broker(), 'publish') as publish:
+            with self.captureOnCommitCallbacks(execute=False) as callbacks:
+                Card.objects.create(column=self.column, title='Card')
+        self.assertTrue(callbacks)
+        publish.assert_not_called()
+
+
+class LocalBrokerTests(TestCase):
+    def test_subscribers_receive_their_channel_only(self):
+        """Test that messages reach the subscribers of their channel."""
+        broker = LocalBroker({})
+
+        async def receive():
+            async with broker.subscribe('a') as queue:
+                broker.publish('b', {'n': 1})
+                broker.publish('a', {'n': 2})
+                return await asyncio.wait_for(queue.get(), timeout=1)
+
+        self.assertEqual(asyncio.run(receive()), {'n': 2})
+
+    def test_slow_subscriber_drops_messages(self):
+        """Test that a full queue drops messages instead of growing."""
+        broker = LocalBroker({'MAX_QUEUED': 1})
+
+        async def receive():
+            async with broker.subscribe('a') as queue:
+                broker.publish('a', {'n': 1})
+                broker.publish('a', {'n': 2})
+                await asyncio.sleep(0)
+                return queue.qsize()
+
+        self.assertEqual(asyncio.run(receive()), 1)
+
+
+class BoardEventsApiTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='testuser@example.com')
+        self.board = Board.objects.create(user=self.user, title='Board')
+        self.column = Column.objects.create(board=self.board, title='To Do')
+
+    async def test_stream_pushes_board_changes(self):
+        """Test that a subscribed client receives card changes."""
+        await self.async_client.aforce_login(self.user)
+        res = await self.async_client.get(board_events_url(self.board.id))
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res['Content-Type'], 'text/event-stream')
+        stream = aiter(res.streaming_content)
+        self.assertTrue((await anext(stream)).startswith(b'retry:'))
+
+        message = {'type': 'card.saved', 'id': '1',
+                   'board_id': str(self.board.id)}
+        get_broker().publish(board_channel(self.board.id), message)
+        chunk = await asyncio.wait_for(anext(stream), timeout=1)
+        self.assertEqual(
+            chunk.decode(),
+            f'event: card.saved\ndata: {json.dumps(message)}\n\n',
+        )
+        await stream.aclose()
+
+    async def test_stream_of_other_users_board(self):
+        """Test that boards of other users cannot be subscribed to."""
+        other = await User.objects.acreate(username='other@example.com')
+        await self.async_client.aforce_login(other)
+        res = await self.async_client.get(board_events_url(self.board.id))
+        self.assertEqual(res.status_code, 404)
+
+    async def test_stream_without_session_creates_no_guest(self):
+        """Test that anonymous subscribers get 404 without a new guest."""
+        users = await User.objects.acount()
+        res = await self.async_client.get(board_events_url(self.board.id))
+        self.assertEqual(res.status_code, 404)
+        self.assertEqual(await User.objects.acount(), users)
+
+    async def test_stream_of_guest_board(self):
+        """Test that a guest can subscribe to its own board."""
+        res = await self.async_client.get(reverse('api:latest-board'))
+        board_id = res.json()['id']
+        res = await self.async_client.get(board_events_url(board_id))
+        self.assertEqual(res.status_code, 200)
+        await res.streaming_content.aclose()
+
+    def test_stream_requires_asgi(self):
+        """Test that WSGI requests are refused instead of blocking."""
+        client = Client()
+        client.force_login(self.user)
+        res = client.get(board_events_url(self.board.id))
+        self.assertEqual(res.status_code, 501)
+
+
+class PostgresBrokerTests(TransactionTestCase):
+    def test_notifications_reach_subscribers(self):
+        """Test that messages round-trip through LISTEN/NOTIFY."""
+        broker = PostgresBroker({'CHANNEL': 'kanban_events_test'})
+
+        def publish():
+            try:
+                broker.publish('a', {'n': 1})
+            finally:
+                # Worker threads do not close their connections on exit.
+                connections.close_all()
+
+        async def receive():
+            async with broker.subscribe('a') as queue:
+                for _ in range(50):
+                    await asyncio.to_thread(publish)
+                    try:
+                        return await asyncio.wait_for(queue.get(), 0.1)
+                    except TimeoutError:
+                        continue
+
+        self.assertEqual(asyncio.run(receive()), {'n': 1})
+
+    def test_oversized_data_is_dropped(self):
+        """
+        Test that a message too large for NOTIFY is sent without its data.
+        """
+        broker = PostgresBroker({})
+        message = {'type': 'card.saved', 'id': '1', 'data': {
+            'body': 'x' * MAX_NOTIFY_PAYLOAD}}
+        with patch.object(connections['default'], 'cursor') as cursor:
+            broker.publish('a', message)
+        payload = cursor.return_value.__enter__.return_value.execute.call_args
+        self.assertEqual(json.loads(payload.args[1][1]), {
+            'channel': 'a', 'message': {'type': 'card.saved', 'id': '1'}})
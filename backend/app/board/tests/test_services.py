@@ -0,0 +1,83 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from board.models import Board, Column
+from board.services import delete_board_tree, insert_board
+from card.models import Card
+from core.ordering import ORDER_GAP
+
+User = get_user_model()
+
+
+class InsertBoardTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='testuser@example.com')
+
+    def _insert(self, column_count):
+        return insert_board(
+            Board(user=self.user, title='A Board'),
+            [Column(title=f'Column {i}') for i in range(column_count)],
+        )
+
+    def test_insert_board_with_columns(self):
+        """Test inserting a board with its ordered columns."""
+        board = self._insert(3)
+        self.assertEqual(
+            list(Column.objects.filter(board=board).values_list(
+                'title', 'order')),
+            [(f'Column {i}', (i + 1) * ORDER_GAP) for i in range(3)]
+        )
+
+    def test_insert_board_query_count_is_constant(self):
+        """Test that inserting a board does not depend on column count."""
+        with self.assertNumQueries(5):
+            self._insert(1)
+        with self.assertNumQueries(5):
+            self._insert(10)
+
+    def test_new_columns_are_appended_after_inserted_ones(self):
+        """Test that columns added later go after the inserted columns."""
+        board = self._insert(2)
+        column = Column.objects.create(board=board, title='Later')
+        self.assertEqual(column.order, 3 * ORDER_GAP)
+
+
+class DeleteBoardTreeTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='testuser@example.com')
+        self.board = insert_board(
+            Board(user=self.user, title='A Board'),
+            [Column(title=f'Column {i}') for i in range(3)],
+        )
+        for column in self.board.columns.all():
+            for i in range(5):
+                Card.objects.create(
+                    column=column, title=f'Card {i}', priority='low')
+
+    def test_deletes_columns_and_cards(self):
+        """Test the board's columns and cards are deleted with it."""
+        other = Board.objects.create(user=self.user, title='Other')
+        Column.objects.create(board=other, title='Kept')
+
+        delete_board_tree(self.board)
+
+        self.assertFalse(Board.objects.filter(pk=self.board.pk).exists())
+        self.assertEqual(list(Column.objects.values_list('title', flat=True)),
+                         ['Kept'])
+        self.assertFalse(Card.objects.exists())
+
+    def test_query_count_does_not_depend_on_children(self):
+        """Test no query is issued per column or card."""
+        with self.assertNumQueries(4):
+            delete_board_tree(self.board)
+
+    def test_shifts_following_boards(self):
+        """Test the owner's following boards keep a dense order."""
+        second = Board.objects.create(user=self.user, title='Second')
+        third = Board.objects.create(user=self.user, title='Third')
+
+        delete_board_tree(self.board)
+
+        second.refresh_from_db()
+        third.refresh_from_db()
+        self.assertEqual((second.order, third.order), (0, 1))
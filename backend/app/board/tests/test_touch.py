@@ -0,0 +1,115 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from board.models import Board, Column
+from board.touch import deferred_board_touches, touch_boards
+from card.models import Card
+
+User = get_user_model()
+
+
+class TouchBoardsTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='testuser@example.com')
+        self.board = Board.objects.create(user=self.user, title='Board 1')
+        self.other_board = Board.objects.create(
+            user=self.user, title='Board 2')
+        self.column = Column.objects.create(board=self.board, title='To Do')
+        self.other_column = Column.objects.create(
+            board=self.other_board, title='To Do')
+        self.board.refresh_from_db()
+        self.other_board.refresh_from_db()
+
+    def test_touch_boards_updates_immediately(self):
+        """Test that touching outside a deferred block issues one UPDATE."""
+        original_updated_at = self.board.updated_at
+        with self.assertNumQueries(1):
+            touch_boards(board_ids=[self.board.id])
+        self.board.refresh_from_db()
+        self.assertGreater(self.board.updated_at, original_updated_at)
+
+    def test_touch_boards_by_column(self):
+        """Test touching the board that owns a column."""
+        original_updated_at = self.board.updated_at
+        other_updated_at = self.other_board.updated_at
+        with self.assertNumQueries(1):
+            touch_boards(column_ids=[self.column.id])
+        self.board.refresh_from_db()
+        self.other_board.refresh_from_db()
+        self.assertGreater(self.board.updated_at, original_updated_at)
+        self.assertEqual(self.other_board.updated_at, other_updated_at)
+
+    def test_deferred_touches_are_coalesced(self):
+        """Test that touches in a deferred block are flushed in one UPDATE."""
+        original_updated_at = self.board.updated_at
+        other_updated_at = self.other_board.updated_at
+        with self.assertNumQueries(1):
+            with deferred_board_touches():
+                touch_boards(board_ids=[self.board.id])
+                touch_boards(board_ids=[self.board.id])
+                touch_boards(column_ids=[self.other_column.id])
+        self.board.refresh_from_db()
+        self.other_board.refresh_from_db()
+        self.assertGreater(self.board.updated_at, original_updated_at)
+        self.assertGreater(self.other_board.updated_at, other_updated_at)
+
+    def test_nested_deferred_blocks_flush_once(self):
+        """Test that nested deferred blocks join the outermost one."""
+        with self.assertNumQueries(1):
+            with deferred_board_touches():
+                with deferred_board_touches():
+                    touch_boards(board_ids=[self.board.id])
+                touch_boards(board_ids=[self.other_board.id])
+
+    def test_deferred_touches_skipped_on_error(self):
+        """Test that a failing deferred block does not flush its touches."""
+        original_updated_at = self.board.updated_at
+        with self.assertRaises(ValueError):
+            with deferred_board_touches():
+                touch_boards(board_ids=[self.board.id])
+                raise ValueError
+        self.board.refresh_from_db()
+        self.assertEqual(self.board.updated_at, original_updated_at)
+
+    def test_card_save_touches_board_without_loading_it(self):
+        """Test that saving a card touches its board with a single UPDATE."""
+        card = Card.objects.create(title='Card', column=self.column)
+        card = Card.objects.get(pk=card.pk)
+        self.board.refresh_from_db()
+        original_updated_at = self.board.updated_at
+        card.title = 'Updated Card'
+        with self.assertNumQueries(2):
+            card.save()
+        self.board.refresh_from_db()
+        self.assertGreater(self.board.updated_at, original_updated_at)
+
+    def _write_order(self, write):
+        with CaptureQueriesContext(connection) as queries:
+            write()
+        return [
+            table for query in queries
+            for table in ('"card_card"', '"board_column"', '"board_board"')
+            if query['sql'].startswith(('INSERT', 'UPDATE', 'DELETE'))
+            and table in query['sql'].split(' WHERE ')[0]
+        ]
+
+    def test_card_writes_precede_board_touch(self):
+        """Test that card rows are written before their board is touched."""
+        card = Card.objects.create(title='Card', column=self.column)
+        card = Card.objects.get(pk=card.pk)
+        card.title = 'Updated Card'
+        self.assertEqual(self._write_order(card.save),
+                         ['"card_card"', '"board_board"'])
+        self.assertEqual(self._write_order(card.delete),
+                         ['"card_card"', '"board_board"'])
+
+    def test_column_writes_precede_board_touch(self):
+        """Test that column rows are written before their board is touched."""
+        column = Column.objects.get(pk=self.column.pk)
+        column.title = 'Doing'
+        self.assertEqual(self._write_order(column.save),
+                         ['"board_column"', '"board_board"'])
+        self.assertEqual(self._write_order(column.delete),
+                         ['"board_column"', '"board_board"'])
@@ -0,0 +1,67 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.db.models import Q
+from django.utils import timezone
+
+_pending_touches = ContextVar('pending_board_touches', default=None)
+
+
+class _PendingTouches:
+    """Board and column ids whose boards await an `updated_at` bump."""
+
+    def __init__(self):
+        self.board_ids = set()
+        self.column_ids = set()
+
+
+def touch_boards(board_ids=(), column_ids=()):
+    """
+    Bump `updated_at` of the given boards and of the boards owning the given
+    columns.
+
+    Inside `deferred_board_touches` the ids are collected and flushed once
+    when the block exits; otherwise a single UPDATE is issued right away.
+    Returns the timestamp callers may mirror on in-memory instances.
+    """
+    pending = _pending_touches.get()
+    if pending is None:
+        return _flush(set(board_ids), set(column_ids))
+    pending.board_ids.update(board_ids)
+    pending.column_ids.update(column_ids)
+    return timezone.now()
+
+
+@contextmanager
+def deferred_board_touches():
+    """
+    Coalesce every board touch issued inside the block into one UPDATE.
+
+    Nested blocks join the outermost one. The flush only runs when the block
+    exits without an exception.
+    """
+    if _pending_touches.get() is not None:
+        yield
+        return
+    pending = _PendingTouches()
+    token = _pending_touches.set(pending)
+    try:
+        yield
+    finally:
+        _pending_touches.reset(token)
+    _flush(pending.board_ids, pending.column_ids)
+
+
+def _flush(board_ids, column_ids):
+    from board.models import Board, Column
+
+    now = timezone.now()
+    condition = Q()
+    if board_ids:
+        condition |= Q(pk__in=board_ids)
+    if column_ids:
+        condition |= Q(pk__in=Column.objects.filter(
+            pk__in=column_ids).values('board_id'))
+    if condition:
+        Board.objects.filter(condition).update(updated_at=now)
+    return now
@@ -1,28 +1,74 @@
 from typing import List
+from django.db import transaction
+from django.db.models import Count, Max
+from django.http import HttpResponse
 from ninja import Query, Router, PatchDict
 
+from board.models import Board, Column
+from board.touch import deferred_board_touches, touch_boards
 from card.schemas import (
+    CardBulkIn,
+    CardBulkOut,
     CardFilter,
     CardListSchema,
     CardIn,
     CardMoveAboveIn,
+    CardMoveIn,
     CardOut,
+    CardSearchQuery,
 )
 from card.models import Card
+from card.services import apply_card_operations, search_cards
+from core.conditional import conditional_response
+from core.pagination import (
+    NEXT_CURSOR_HEADER,
+    ListQuery,
+    paginate,
+    paginate_offset,
+    parse_fields,
+    sparse_schema,
+)
 
 
 card_router = Router()
 
 
-@card_router.get('/', response=List[CardListSchema],
-                 url_name='cards')
-def list_cards(request, filters: CardFilter = Query(...)):
-    """Retrieve list of user's cards."""
-    queryset = Card.objects.all()
-    if filters:
-        queryset = filters.filter(queryset)
-    queryset = queryset.filter(column__board__user=request.auth)
-    return queryset
+@card_router.get('/', response={
+                     200: List[sparse_schema(CardListSchema)],
+                     400: dict,
+                 }, url_name='cards', exclude_unset=True)
+def list_cards(request, response: HttpResponse,
+               filters: CardFilter = Query(...),
+               query: ListQuery = Query(...)):
+    """
+    Retrieve list of user's cards.
+
+    Paginated by `(order, id)` when `limit` or `cursor` is given, with the
+    next page's cursor in the `X-Next-Cursor` header. Answers conditional
+    requests from the latest `updated_at` of the user's boards.
+    """
+    try:
+        fields = parse_fields(query.fields, CardListSchema)
+        if request.auth.is_virtual:
+            return []
+        version = Board.objects.filter(user=request.auth).aggregate(
+            updated_at=Max('updated_at'), count=Count('id'))
+        if version['updated_at']:
+            not_modified = conditional_response(
+                request, response, f"cards-{version['count']}",
+                version['updated_at'])
+            if not_modified:
+                return not_modified
+        queryset = Card.objects.all()
+        if filters:
+            queryset = filters.filter(queryset)
+        queryset = queryset.filter(owner=request.auth)
+        cards, next_cursor = paginate(queryset, query, fields)
+    except ValueError as e:
+        return 400, {"detail": str(e)}
+    if next_cursor:
+        response[NEXT_CURSOR_HEADER] = next_cursor
+    return cards
 
 
 @card_router.post('/', response={201: CardOut})
@@ -32,13 +78,48 @@ def create_card(request, payload: CardIn):
     return 201, card
 
 
+@card_router.post('/bulk/', response={200: CardBulkOut, 404: dict},
+                  url_name='cards-bulk')
+def bulk_cards(request, payload: CardBulkIn):
+    """Apply a batch of card operations in one transaction."""
+    try:
+        cards, deleted = apply_card_operations(
+            request.auth, payload.operations)
+    except Column.DoesNotExist:
+        return 404, {"detail": "Column not found."}
+    except Card.DoesNotExist:
+        return 404, {"detail": "Card not found."}
+    return {"cards": cards, "deleted": deleted}
+
+
+@card_router.get('/search/', response={200: List[CardOut], 400: dict},
+                 url_name='cards-search')
+def find_cards(request, response: HttpResponse,
+               query: CardSearchQuery = Query(...)):
+    """
+    Search the user's cards by title and body, best matches first.
+
+    Paginated like the lists, with the next page's cursor in the
+    `X-Next-Cursor` header.
+    """
+    if request.auth.is_virtual:
+        return []
+    try:
+        cards, next_cursor = paginate_offset(
+            search_cards(request.auth, query.q), query)
+    except ValueError as e:
+        return 400, {"detail": str(e)}
+    if next_cursor:
+        response[NEXT_CURSOR_HEADER] = next_cursor
+    return cards
+
+
 @card_router.get('/{card_id}/', response={200: CardOut, 404: dict},
                  url_name='card-detail')
 def retrieve_card(request, card_id: str):
     """Retrieve a card by ID."""
     try:
-        card = Card.objects.get(
-            id=card_id, column__board__user=request.auth)
+        card = Card.objects.get(id=card_id, owner=request.auth)
     except Card.DoesNotExist:
         return 404, {"detail": "Card not found."}
     return card
@@ -49,8 +130,7 @@ def retrieve_card(request, card_id: str):
 def update_card(request, card_id: str, payload: PatchDict[CardIn]):
     """Update a card by ID."""
     try:
-        card = Card.objects.get(
-            id=card_id, column__board__user=request.auth)
+        card = Card.objects.get(id=card_id, owner=request.auth)
     except Card.DoesNotExist:
         return 404, {"detail": "Card not found."}
     for attr, value in payload.items():
@@ -64,8 +144,7 @@ def update_card(request, card_id: str, payload: PatchDict[CardIn]):
 def delete_card(request, card_id: str):
     """Delete a card by ID."""
     try:
-        card = Card.objects.get(
-            id=card_id, column__board__user=request.auth)
+        card = Card.objects.get(id=card_id, owner=request.auth)
     except Card.DoesNotExist:
         return 404, {"detail": "Card not found."}
     card.delete()
@@ -78,15 +157,13 @@ def move_card_above(request, card_id: str, payload: CardMoveAboveIn):
     """Move a card above another card."""
     target_card_id = payload.target_card_id
     try:
-        card = Card.objects.get(
-            id=card_id, column__board__user=request.auth)
-        target_card = Card.objects.get(
-            id=target_card_id, column__board__user=request.auth)
+        card = Card.objects.get(id=card_id, owner=request.auth)
+        target_card = Card.objects.get(id=target_card_id, owner=request.auth)
         if card.column != target_card.column:
             return 404, {"detail": "Target card must be in the same column."}
     except Card.DoesNotExist:
         return 404, {"detail": "Card not found."}
-    card.above(target_card)
+    card.place_above(target_card)
     return 200, None
 
 
@@ -95,9 +172,42 @@ def move_card_above(request, card_id: str, payload: CardMoveAboveIn):
 def move_card_to_bottom(request, card_id: str):
     """Move a card to the bottom of its column."""
     try:
-        card = Card.objects.get(
-            id=card_id, column__board__user=request.auth)
+        card = Card.objects.get(id=card_id, owner=request.auth)
     except Card.DoesNotExist:
         return 404, {"detail": "Card not found."}
-    card.bottom()
+    card.place_bottom()
     return 200, None
+
+
+@card_router.post('/{card_id}/move/', response={200: CardOut, 404: dict},
+                  url_name='card-move')
+def move_card(request, card_id: str, payload: CardMoveIn):
+    """
+    Move a card into a column, above a target card in that column or at its
+    bottom.
+    """
+    try:
+        card = Card.objects.get(id=card_id, owner=request.auth)
+        column = Column.objects.get(
+            id=payload.column_id, board__user=request.auth)
+        target_card = None
+        if payload.target_card_id:
+            target_card = Card.objects.get(
+                id=payload.target_card_id, column=column)
+    except Column.DoesNotExist:
+        return 404, {"detail": "Column not found."}
+    except Card.DoesNotExist:
+        return 404, {"detail": "Card not found."}
+    _move_card(card, column, target_card)
+    return card
+
+
+def _move_card(card, column, target_card):
+    """Place `card` above `target_card`, or at the bottom of `column`."""
+    with transaction.atomic(), deferred_board_touches():
+        touch_boards(column_ids=[card.column_id])
+        if target_card:
+            card.place_above(target_card)
+        else:
+            card.place_bottom(wrt={'column': column.pk})
+    card.column = column
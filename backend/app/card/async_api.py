@@ -0,0 +1,198 @@
+from typing import List
+from asgiref.sync import sync_to_async
+from django.db.models import Count, Max
+from django.http import HttpResponse
+from ninja import Query, Router, PatchDict
+
+from board.models import Board, Column
+from card.api import _move_card
+from card.schemas import (
+    CardBulkIn,
+    CardBulkOut,
+    CardFilter,
+    CardListSchema,
+    CardIn,
+    CardMoveAboveIn,
+    CardMoveIn,
+    CardOut,
+    CardSearchQuery,
+)
+from card.models import Card
+from card.services import apply_card_operations, search_cards
+from core.conditional import conditional_response
+from core.pagination import (
+    NEXT_CURSOR_HEADER,
+    ListQuery,
+    apaginate,
+    apaginate_offset,
+    parse_fields,
+    sparse_schema,
+)
+
+
+async_card_router = Router()
+
+
+@async_card_router.get('/', response={
+                           200: List[sparse_schema(CardListSchema)],
+                           400: dict,
+                       }, url_name='cards', exclude_unset=True)
+async def list_cards(request, response: HttpResponse,
+                     filters: CardFilter = Query(...),
+                     query: ListQuery = Query(...)):
+    """Retrieve list of user's cards."""
+    try:
+        fields = parse_fields(query.fields, CardListSchema)
+        if request.auth.is_virtual:
+            return []
+        version = await Board.objects.filter(user=request.auth).aaggregate(
+            updated_at=Max('updated_at'), count=Count('id'))
+        if version['updated_at']:
+            not_modified = conditional_response(
+                request, response, f"cards-{version['count']}",
+                version['updated_at'])
+            if not_modified:
+                return not_modified
+        queryset = Card.objects.all()
+        if filters:
+            queryset = filters.filter(queryset)
+        queryset = queryset.filter(owner=request.auth)
+        cards, next_cursor = await apaginate(queryset, query, fields)
+    except ValueError as e:
+        return 400, {"detail": str(e)}
+    if next_cursor:
+        response[NEXT_CURSOR_HEADER] = next_cursor
+    return cards
+
+
+@async_card_router.post('/', response={201: CardOut})
+async def create_card(request, payload: CardIn):
+    """Create a new card."""
+    card = await Card.objects.acreate(**payload.dict())
+    return 201, card
+
+
+@async_card_router.post('/bulk/', response={200: CardBulkOut, 404: dict},
+                        url_name='cards-bulk')
+async def bulk_cards(request, payload: CardBulkIn):
+    """Apply a batch of card operations in one transaction."""
+    try:
+        cards, deleted = await sync_to_async(apply_card_operations)(
+            request.auth, payload.operations)
+    except Column.DoesNotExist:
+        return 404, {"detail": "Column not found."}
+    except Card.DoesNotExist:
+        return 404, {"detail": "Card not found."}
+    return {"cards": cards, "deleted": deleted}
+
+
+@async_card_router.get('/search/', response={200: List[CardOut], 400: dict},
+                       url_name='cards-search')
+async def find_cards(request, response: HttpResponse,
+                     query: CardSearchQuery = Query(...)):
+    """
+    Search the user's cards by title and body, best matches first.
+
+    Paginated like the lists, with the next page's cursor in the
+    `X-Next-Cursor` header.
+    """
+    if request.auth.is_virtual:
+        return []
+    try:
+        cards, next_cursor = await apaginate_offset(
+            search_cards(request.auth, query.q), query)
+    except ValueError as e:
+        return 400, {"detail": str(e)}
+    if next_cursor:
+        response[NEXT_CURSOR_HEADER] = next_cursor
+    return cards
+
+
+@async_card_router.get('/{card_id}/', response={200: CardOut, 404: dict},
+                       url_name='card-detail')
+async def retrieve_card(request, card_id: str):
+    """Retrieve a card by ID."""
+    try:
+        card = await Card.objects.aget(id=card_id, owner=request.auth)
+    except Card.DoesNotExist:
+        return 404, {"detail": "Card not found."}
+    return card
+
+
+@async_card_router.patch('/{card_id}/', response={200: CardOut, 404: dict},
+                         url_name='card-detail')
+async def update_card(request, card_id: str, payload: PatchDict[CardIn]):
+    """Update a card by ID."""
+    try:
+        card = await Card.objects.aget(id=card_id, owner=request.auth)
+    except Card.DoesNotExist:
+        return 404, {"detail": "Card not found."}
+    for attr, value in payload.items():
+        setattr(card, attr, value)
+    await card.asave()
+    return card
+
+
+@async_card_router.delete('/{card_id}/', response={204: None, 404: dict},
+                          url_name='card-detail')
+async def delete_card(request, card_id: str):
+    """Delete a card by ID."""
+    try:
+        card = await Card.objects.aget(id=card_id, owner=request.auth)
+    except Card.DoesNotExist:
+        return 404, {"detail": "Card not found."}
+    await card.adelete()
+    return 204, None
+
+
+@async_card_router.post('/{card_id}/move-above/',
+                        response={200: None, 404: dict},
+                        url_name='card-move-above')
+async def move_card_above(request, card_id: str, payload: CardMoveAboveIn):
+    """Move a card above another card."""
+    try:
+        card = await Card.objects.aget(id=card_id, owner=request.auth)
+        target_card = await Card.objects.aget(
+            id=payload.target_card_id, owner=request.auth)
+    except Card.DoesNotExist:
+        return 404, {"detail": "Card not found."}
+    if card.column_id != target_card.column_id:
+        return 404, {"detail": "Target card must be in the same column."}
+    await sync_to_async(card.place_above)(target_card)
+    return 200, None
+
+
+@async_card_router.post('/{card_id}/move-bottom/',
+                        response={200: None, 404: dict},
+                        url_name='card-move-bottom')
+async def move_card_to_bottom(request, card_id: str):
+    """Move a card to the bottom of its column."""
+    try:
+        card = await Card.objects.aget(id=card_id, owner=request.auth)
+    except Card.DoesNotExist:
+        return 404, {"detail": "Card not found."}
+    await sync_to_async(card.place_bottom)()
+    return 200, None
+
+
+@async_card_router.post('/{card_id}/move/', response={200: CardOut, 404: dict},
+                        url_name='card-move')
+async def move_card(request, card_id: str, payload: CardMoveIn):
+    """
+    Move a card into a column, above a target card in that column or at its
+    bottom.
+    """
+    try:
+        card = await Card.objects.aget(id=card_id, owner=request.auth)
+        column = await Column.objects.aget(
+            id=payload.column_id, board__user=request.auth)
+        target_card = None
+        if payload.target_card_id:
+            target_card = await Card.objects.aget(
+                id=payload.target_card_id, column=column)
+    except Column.DoesNotExist:
+        return 404, {"detail": "Column not found."}
+    except Card.DoesNotExist:
+        return 404, {"detail": "Card not found."}
+    await sync_to_async(_move_card)(card, column, target_card)
+    return card
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:22
+
+import core.deletion
+import django.db.models.deletion
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('board', '0003_column_board_db_cascade'),
+        ('card', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='card',
+            name='column',
+            field=core.deletion.CascadeForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='cards', to='board.column'),
+        ),
+        # Django cannot declare ON DELETE CASCADE, so the constraint it
+        # created is replaced under the same name. An AlterField of the
+        # field recreates the constraint without it; core.W001 flags that.
+        migrations.RunSQL(
+            sql=(
+                'ALTER TABLE "card_card" DROP CONSTRAINT "card_card_column_id_29cce7d8_fk_board_column_id", '
+                'ADD CONSTRAINT "card_card_column_id_29cce7d8_fk_board_column_id" '
+                'FOREIGN KEY ("column_id") REFERENCES "board_column" ("id") ON DELETE CASCADE DEFERRABLE INITIALLY DEFERRED;'
+            ),
+            reverse_sql=(
+                'ALTER TABLE "card_card" DROP CONSTRAINT "card_card_column_id_29cce7d8_fk_board_column_id", '
+                'ADD CONSTRAINT "card_card_column_id_29cce7d8_fk_board_column_id" '
+                'FOREIGN KEY ("column_id") REFERENCES "board_column" ("id") DEFERRABLE INITIALLY DEFERRED;'
+            ),
+        ),
+    ]
@@ -0,0 +1,81 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:28
+
+import core.deletion
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def copy_board_and_owner(apps, schema_editor):
+    Card = apps.get_model('card', 'Card')
+    Column = apps.get_model('board', 'Column')
+    column = Column.objects.filter(pk=models.OuterRef('column_id'))
+    Card.objects.update(
+        board_id=models.Subquery(column.values('board_id')[:1]),
+        owner_id=models.Subquery(column.values('board__user_id')[:1]),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('board', '0003_column_board_db_cascade'),
+        ('card', '0002_card_column_db_cascade'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='card',
+            name='board',
+            field=core.deletion.CascadeForeignKey(editable=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='board.board'),
+        ),
+        migrations.AddField(
+            model_name='card',
+            name='owner',
+            field=core.deletion.CascadeForeignKey(db_index=False, editable=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.RunPython(
+            copy_board_and_owner, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='card',
+            name='board',
+            field=core.deletion.CascadeForeignKey(editable=False, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='board.board'),
+        ),
+        migrations.AlterField(
+            model_name='card',
+            name='owner',
+            field=core.deletion.CascadeForeignKey(db_index=False, editable=False, on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL),
+        ),
+        # Django cannot declare ON DELETE CASCADE, so the constraint it
+        # created is replaced under the same name. An AlterField of the
+        # field recreates the constraint without it; core.W001 flags that.
+        migrations.RunSQL(
+            sql=(
+                'ALTER TABLE "card_card" DROP CONSTRAINT "card_card_board_id_fd304fbe_fk_board_board_id", '
+                'ADD CONSTRAINT "card_card_board_id_fd304fbe_fk_board_board_id" '
+                'FOREIGN KEY ("board_id") REFERENCES "board_board" ("id") ON DELETE CASCADE DEFERRABLE INITIALLY DEFERRED;'
+            ),
+            reverse_sql=(
+                'ALTER TABLE "card_card" DROP CONSTRAINT "card_card_board_id_fd304fbe_fk_board_board_id", '
+                'ADD CONSTRAINT "card_card_board_id_fd304fbe_fk_board_board_id" '
+                'FOREIGN KEY ("board_id") REFERENCES "board_board" ("id") DEFERRABLE INITIALLY DEFERRED;'
+            ),
+        ),
+        migrations.RunSQL(
+            sql=(
+                'ALTER TABLE "card_card" DROP CONSTRAINT "card_card_owner_id_1b2ddf32_fk_user_user_id", '
+                'ADD CONSTRAINT "card_card_owner_id_1b2ddf32_fk_user_user_id" '
+                'FOREIGN KEY ("owner_id") REFERENCES "user_user" ("id") ON DELETE CASCADE DEFERRABLE INITIALLY DEFERRED;'
+            ),
+            reverse_sql=(
+                'ALTER TABLE "card_card" DROP CONSTRAINT "card_card_owner_id_1b2ddf32_fk_user_user_id", '
+                'ADD CONSTRAINT "card_card_owner_id_1b2ddf32_fk_user_user_id" '
+                'FOREIGN KEY ("owner_id") REFERENCES "user_user" ("id") DEFERRABLE INITIALLY DEFERRED;'
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='card',
+            index=models.Index(fields=['owner', 'board'], name='card_owner_board_idx'),
+        ),
+    ]
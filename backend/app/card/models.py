@@ -1,8 +1,21 @@
 import uuid
-from django.db import models
+from django.contrib.auth import get_user_model
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
+from django.db import models, transaction
 from ordered_model.models import OrderedModel
 
-from board.models import Column
+from board.models import Board, Column
+from board.events import publish_change, publish_saved
+from board.touch import touch_boards
+from core.deletion import CascadeForeignKey
+from core.ordering import GapOrderedMixin, OrderedManager
+
+User = get_user_model()
+
+# Text search configuration of `Card.search_vector`; queries must use the
+# same one to match the stored lexemes.
+SEARCH_CONFIG = 'english'
 
 
 class PriorityChoices(models.TextChoices):
@@ -11,13 +24,28 @@ class PriorityChoices(models.TextChoices):
     HIGH = 'high', 'High'
 
 
-class Card(OrderedModel):
+class CardManager(OrderedManager):
+    def get_queryset(self):
+        # The search vector is only ever read by the database.
+        return super().get_queryset().defer('search_vector')
+
+
+class Card(GapOrderedMixin, OrderedModel):
     id = models.UUIDField(
         primary_key=True, default=uuid.uuid4, editable=False
     )
-    column = models.ForeignKey(
+    column = CascadeForeignKey(
         Column, on_delete=models.CASCADE, related_name="cards"
     )
+    # Copied from `column` on save, so ownership checks and board lookups
+    # need no join.
+    board = CascadeForeignKey(
+        Board, on_delete=models.CASCADE, related_name="+", editable=False
+    )
+    owner = CascadeForeignKey(
+        User, on_delete=models.CASCADE, related_name="+", editable=False,
+        db_index=False,
+    )
     title = models.CharField(max_length=255)
     body = models.TextField(blank=True, default='')
     priority = models.CharField(
@@ -27,20 +55,88 @@ class Card(OrderedModel):
     )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    # Maintained by the database on every write, titles ranking above
+    # bodies.
+    search_vector = models.GeneratedField(
+        expression=(
+            SearchVector('title', weight='A', config=SEARCH_CONFIG)
+            + SearchVector('body', weight='B', config=SEARCH_CONFIG)
+        ),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
     order_with_respect_to = 'column'
 
-    def _touch_board(self):
-        self.column.board.save(update_fields=['updated_at'])
+    objects = CardManager()
 
+    # Column that `board` and `owner` were last copied from.
+    _board_column_id = None
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        if instance.__dict__.get('board_id'):
+            instance._board_column_id = instance.__dict__.get('column_id')
+        return instance
+
+    def _sync_board(self, kwargs):
+        """
+        Copy `board` and `owner` from the column if it has changed.
+
+        Returns the board the card leaves, if it moves to another board.
+        """
+        if self.board_id and self.column_id == self._board_column_id:
+            return None
+        previous_board_id = self.board_id
+        if Card.column.is_cached(self) and Column.board.is_cached(
+                self.column):
+            self.board_id = self.column.board_id
+            self.owner_id = self.column.board.user_id
+        else:
+            self.board_id, self.owner_id = Column.objects.filter(
+                pk=self.column_id).values_list(
+                    'board_id', 'board__user_id').get()
+        self._board_column_id = self.column_id
+        if kwargs.get('update_fields') is not None:
+            kwargs['update_fields'] = {
+                *kwargs['update_fields'], 'board', 'owner'}
+        if previous_board_id and previous_board_id != self.board_id:
+            publish_change(previous_board_id, 'card', 'deleted', self.pk)
+            return previous_board_id
+        return None
+
+    def _touch_board(self, previous_board_id=None):
+        if self.board_id:
+            touch_boards(board_ids={self.board_id, previous_board_id} - {None})
+        else:
+            touch_boards(column_ids=[self.column_id])
+
+    # The board is touched after the row is written, in the same
+    # transaction, so no reader sees the new board version with old rows.
     def save(self, *args, **kwargs):
-        self._touch_board()
-        super().save(*args, **kwargs)
+        with transaction.atomic(savepoint=False):
+            previous_board_id = self._sync_board(kwargs)
+            super().save(*args, **kwargs)
+            self._touch_board(previous_board_id)
+        publish_saved(self.board_id, 'card', self)
 
     def delete(self, *args, **kwargs):
-        self._touch_board()
-        super().delete(*args, **kwargs)
+        pk = self.pk
+        with transaction.atomic(savepoint=False):
+            result = super().delete(*args, **kwargs)
+            self._touch_board()
+            if self.board_id:
+                publish_change(self.board_id, 'card', 'deleted', pk)
+        return result
 
     class Meta(OrderedModel.Meta):
+        indexes = [
+            models.Index(
+                fields=['owner', 'board'],
+                name='card_owner_board_idx',
+            ),
+            GinIndex(fields=['search_vector'], name='card_search_idx'),
+        ]
         constraints = [
             models.CheckConstraint(
                 condition=models.Q(priority__in=PriorityChoices.values),
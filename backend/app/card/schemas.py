@@ -1,6 +1,9 @@
+from typing import Annotated, List, Literal, Union
+from uuid import UUID
 from ninja import Field, FilterSchema, ModelSchema, Schema
 
 from card.models import Card
+from core.pagination import MAX_PAGE_SIZE
 
 
 class CardIn(Schema):
@@ -49,7 +52,7 @@ class CardOut(ModelSchema):
 
     @staticmethod
     def resolve_board_id(card):
-        return str(card.column.board_id) if card.column_id else None
+        return str(card.board_id) if card.board_id else None
 
 
 class CardFilter(FilterSchema):
@@ -57,6 +60,70 @@ class CardFilter(FilterSchema):
     column_id: str | None = Field(None, q='column__id')
 
 
+class CardSearchQuery(Schema):
+    """Query parameters for card search."""
+    q: str = Field(..., min_length=1, max_length=256)
+    cursor: str | None = None
+    limit: int = Field(20, ge=1, le=MAX_PAGE_SIZE)
+
+
 class CardMoveAboveIn(Schema):
     """Schema for moving a card above another card."""
     target_card_id: str
+
+
+class CardMoveIn(Schema):
+    """
+    Schema for moving a card into a column, above a target card or at the
+    bottom when no target is given.
+    """
+    column_id: str
+    target_card_id: str | None = None
+
+
+class CardBulkCreate(Schema):
+    """Bulk operation creating a card at the bottom of a column."""
+    op: Literal['create']
+    title: str
+    body: str = ''
+    priority: str | None = None
+    column_id: UUID
+
+
+class CardBulkUpdate(Schema):
+    """Bulk operation updating the fields of a card."""
+    op: Literal['update']
+    id: UUID
+    title: str | None = None
+    body: str | None = None
+    priority: str | None = None
+
+
+class CardBulkMove(Schema):
+    """Bulk operation moving a card to the bottom of a column."""
+    op: Literal['move']
+    id: UUID
+    column_id: UUID
+
+
+class CardBulkDelete(Schema):
+    """Bulk operation deleting a card."""
+    op: Literal['delete']
+    id: UUID
+
+
+CardBulkOperation = Annotated[
+    Union[CardBulkCreate, CardBulkUpdate, CardBulkMove, CardBulkDelete],
+    Field(discriminator='op'),
+]
+
+
+class CardBulkIn(Schema):
+    """Schema for a batch of card operations applied in order."""
+    operations: List[CardBulkOperation] = Field(..., max_length=1000)
+
+
+class CardBulkOut(Schema):
+    """Schema for the cards written by a batch and the deleted card ids."""
+    cards: List[CardOut]
+    deleted: List[str]
@@ -0,0 +1,7 @@
+from .apply_card_operations import apply_card_operations
+from .search_cards import search_cards
+
+__all__ = [
+    'apply_card_operations',
+    'search_cards',
+]
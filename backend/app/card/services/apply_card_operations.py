@@ -0,0 +1,143 @@
+from collections import Counter
+
+from django.db import transaction
+from django.db.models import Max
+from django.utils import timezone
+
+from board.models import Column
+from board.events import publish_change, publish_saved
+from board.touch import touch_boards
+from card.models import Card
+from core.ordering import MAX_ORDER, ORDER_GAP, rebalance
+
+
+def apply_card_operations(user, operations):
+    """
+    Apply create, update, move and delete operations to the user's cards in
+    one transaction.
+
+    The target columns are locked while orders are computed in memory from
+    a single max-order query, writes go through `bulk_create`/`bulk_update`
+    and every affected board is touched once. Raises `Column.DoesNotExist`
+    or `Card.DoesNotExist` when an operation references a column or card the
+    user does not own.
+
+    Returns the created and updated cards in operation order, and the ids of
+    the deleted cards.
+    """
+    with transaction.atomic():
+        return _apply_card_operations(user, operations)
+
+
+def _apply_card_operations(user, operations):
+    placements = Counter(
+        op.column_id for op in operations if op.op in ('create', 'move'))
+    column_ids = set(placements)
+    card_ids = {op.id for op in operations if op.op != 'create'}
+
+    # The target columns stay locked until the transaction ends, so
+    # concurrent operations on them cannot compute the same orders.
+    columns = Column.objects.filter(
+        id__in=column_ids, board__user=user).select_for_update(
+            of=('self',)).order_by('pk').in_bulk()
+    if len(columns) != len(column_ids):
+        raise Column.DoesNotExist
+
+    next_orders = _next_orders(column_ids)
+    # Columns without headroom for every card placed in them are respaced
+    # first, like `next_order` does for a single card. This happens before
+    # the cards are loaded so their orders are not stale.
+    crowded = [
+        column_id for column_id, count in placements.items()
+        if next_orders[column_id] + (count - 1) * ORDER_GAP > MAX_ORDER
+    ]
+    if crowded:
+        for column_id in crowded:
+            rebalance(Card.objects.filter(column_id=column_id))
+        next_orders.update(_next_orders(crowded))
+
+    cards = Card.objects.filter(id__in=card_ids, owner=user).in_bulk()
+    if len(cards) != len(card_ids):
+        raise Card.DoesNotExist
+
+    def take_order(column_id):
+        order = next_orders[column_id]
+        next_orders[column_id] = order + ORDER_GAP
+        return order
+
+    created, written, deleted, moved_from = [], {}, {}, {}
+    updated_fields = set()
+    board_ids = set()
+    for op in operations:
+        if op.op == 'create':
+            card = Card(
+                column=columns[op.column_id],
+                board_id=columns[op.column_id].board_id,
+                owner=user,
+                title=op.title,
+                body=op.body,
+                order=take_order(op.column_id),
+            )
+            if op.priority is not None:
+                card.priority = op.priority
+            created.append(card)
+            written[card.id] = card
+            board_ids.add(card.board_id)
+            continue
+
+        if op.id in deleted:
+            raise Card.DoesNotExist
+        card = cards[op.id]
+        board_ids.add(card.board_id)
+        if op.op == 'delete':
+            deleted[op.id] = card
+            written.pop(op.id, None)
+            continue
+        if op.op == 'update':
+            for field, value in op.dict(
+                    exclude_unset=True, exclude={'op', 'id'}).items():
+                setattr(card, field, value)
+                updated_fields.add(field)
+        elif op.op == 'move':
+            moved_from.setdefault(card.id, card.board_id)
+            card.column = columns[op.column_id]
+            card.board_id = card.column.board_id
+            card.order = take_order(op.column_id)
+            updated_fields.update(('column', 'board', 'order'))
+            board_ids.add(card.board_id)
+        written[card.id] = card
+
+    updated = [card for card in written.values() if card.id in cards]
+    Card.objects.bulk_create(created)
+    if updated and updated_fields:
+        now = timezone.now()
+        for card in updated:
+            card.updated_at = now
+        Card.objects.bulk_update(
+            updated, [*updated_fields, 'updated_at'])
+    if deleted:
+        # A raw delete skips the per-row order compaction signal; the
+        # remaining siblings keep their relative order.
+        queryset = Card.objects.filter(id__in=deleted)
+        queryset._raw_delete(queryset.db)
+    touch_boards(board_ids=board_ids)
+    for card in written.values():
+        publish_saved(card.board_id, 'card', card)
+    for card in deleted.values():
+        publish_change(
+            moved_from.get(card.id, card.board_id), 'card', 'deleted',
+            card.pk)
+    for card_id, board_id in moved_from.items():
+        if card_id in written and written[card_id].board_id != board_id:
+            publish_change(board_id, 'card', 'deleted', card_id)
+    return list(written.values()), [str(card_id) for card_id in deleted]
+
+
+def _next_orders(column_ids):
+    """Return the order after the last card of each column."""
+    next_orders = dict.fromkeys(column_ids, ORDER_GAP)
+    max_orders = Card.objects.filter(column_id__in=column_ids).values(
+        'column_id').annotate(max_order=Max('order'))
+    for row in max_orders:
+        next_orders[row['column_id']] = row['max_order'] + ORDER_GAP
+    return next_orders
@@ -0,0 +1,18 @@
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db.models import F
+
+from card.models import SEARCH_CONFIG, Card
+
+
+def search_cards(user, text):
+    """
+    Return the cards of `user` matching `text`, best matches first.
+
+    `text` follows web search syntax: quoted phrases, `or` and `-excluded`
+    words. Matches are ranked on the stored search vector, where titles
+    weigh more than bodies.
+    """
+    query = SearchQuery(text, search_type='websearch', config=SEARCH_CONFIG)
+    return Card.objects.filter(owner=user, search_vector=query).annotate(
+        rank=SearchRank(F('search_vector'), query),
+    ).order_by('-rank', 'id')
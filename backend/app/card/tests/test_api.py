@@ -1,15 +1,20 @@
 import json
 
 from django.contrib.auth import get_user_model
+from django.db import connection
 from django.test import Client, TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from board.models import Board, Column
 from card.models import Card
+from core.ordering import MAX_ORDER, ORDER_GAP
 
 
 User = get_user_model()
 CARDS_URL = reverse('api:cards')
+CARDS_BULK_URL = reverse('api:cards-bulk')
+CARDS_SEARCH_URL = reverse('api:cards-search')
 
 
 def card_detail_url(card_id) -> str:
@@ -22,6 +27,11 @@ def card_move_above_url(card_id) -> str:
     return reverse('api:card-move-above', args=[str(card_id)])
 
 
+def card_move_url(card_id) -> str:
+    """Return the URL to move a card into a column."""
+    return reverse('api:card-move', args=[str(card_id)])
+
+
 def card_move_bottom_url(card_id) -> str:
     """Return the URL to move a card to the bottom of its column."""
     return reverse('api:card-move-bottom', args=[str(card_id)])
@@ -57,6 +67,66 @@ class PrivateCardsApiTests(TestCase):
         ]
         self.assertEqual(content, expected)
 
+    def test_retrieve_card_single_lookup(self):
+        """Test retrieving a card reads only the card table."""
+        card = Card.objects.create(title='Card 1', column=self.column)
+        with CaptureQueriesContext(connection) as ctx:
+            res = self.client.get(card_detail_url(card.id))
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.json()['board_id'], str(self.board.id))
+        card_queries = [
+            q['sql'] for q in ctx.captured_queries
+            if 'card_card' in q['sql']]
+        self.assertEqual(len(card_queries), 1)
+        self.assertNotIn('JOIN', card_queries[0])
+
+    def test_list_cards_paginated(self):
+        """Test paging through cards with a cursor."""
+        cards = [
+            Card.objects.create(title=f'Card {i}', column=self.column)
+            for i in range(3)
+        ]
+        res = self.client.get(CARDS_URL, {'limit': 2})
+        self.assertEqual(
+            [card['id'] for card in res.json()],
+            [str(card.id) for card in cards[:2]],
+        )
+        res = self.client.get(
+            CARDS_URL, {'limit': 2, 'cursor': res.headers['X-Next-Cursor']})
+        self.assertEqual([card['id'] for card in res.json()],
+                         [str(cards[2].id)])
+        self.assertNotIn('X-Next-Cursor', res.headers)
+
+    def test_list_cards_sparse_fields(self):
+        """Test only the requested columns are loaded and returned."""
+        cards = [
+            Card.objects.create(title=f'Card {i}', column=self.column)
+            for i in range(5)
+        ]
+        # Session, user, cards version and cards.
+        with self.assertNumQueries(4), \
+                CaptureQueriesContext(connection) as ctx:
+            res = self.client.get(CARDS_URL, {'fields': 'title'})
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.json(), [{'title': card.title} for card in cards])
+        query = next(
+            q['sql'] for q in ctx.captured_queries
+            if 'FROM "card_card"' in q['sql'])
+        self.assertNotIn('"card_card"."body"', query)
+
+    def test_list_cards_not_modified(self):
+        """Test the card list answers 304 until a card changes."""
+        Card.objects.create(title='Card 1', column=self.column)
+        etag = self.client.get(CARDS_URL).headers['ETag']
+
+        res = self.client.get(CARDS_URL, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.status_code, 304)
+
+        Card.objects.create(title='Card 2', column=self.column)
+        res = self.client.get(CARDS_URL, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(len(res.json()), 2)
+
     def test_filter_cards_by_column(self):
         """Test filtering cards by column."""
         another_column = Column.objects.create(board=self.board, title='Done')
@@ -72,6 +142,68 @@ class PrivateCardsApiTests(TestCase):
         ]
         self.assertEqual(content, expected)
 
+    def test_search_cards(self):
+        """Test searching cards by title and body, titles ranked first."""
+        in_body = Card.objects.create(
+            title='Groceries', body='Buy coffee filters', column=self.column)
+        in_title = Card.objects.create(
+            title='Coffee machine', column=self.column)
+        Card.objects.create(title='Unrelated', column=self.column)
+        other_user = User.objects.create_user('anotheruser@example.com')
+        other_column = Column.objects.create(
+            board=Board.objects.create(title='Board', user=other_user),
+            title='To Do')
+        Card.objects.create(title='Coffee', column=other_column)
+
+        res = self.client.get(CARDS_SEARCH_URL, {'q': 'coffee'})
+
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(
+            [card['id'] for card in res.json()],
+            [str(in_title.id), str(in_body.id)],
+        )
+
+    def test_search_cards_stems_words(self):
+        """Test that search matches other forms of a word."""
+        card = Card.objects.create(title='Running shoes', column=self.column)
+        res = self.client.get(CARDS_SEARCH_URL, {'q': 'run'})
+        self.assertEqual([c['id'] for c in res.json()], [str(card.id)])
+
+    def test_search_follows_card_edits(self):
+        """Test that the search vector is kept up to date on writes."""
+        card = Card.objects.create(title='Draft', column=self.column)
+        card.title = 'Release notes'
+        card.save()
+        res = self.client.get(CARDS_SEARCH_URL, {'q': 'release'})
+        self.assertEqual([c['id'] for c in res.json()], [str(card.id)])
+        res = self.client.get(CARDS_SEARCH_URL, {'q': 'draft'})
+        self.assertEqual(res.json(), [])
+
+    def test_search_cards_paginated(self):
+        """Test paging through search results with a cursor."""
+        cards = [
+            Card.objects.create(title=f'Report {i}', column=self.column)
+            for i in range(3)
+        ]
+        res = self.client.get(CARDS_SEARCH_URL, {'q': 'report', 'limit': 2})
+        first_page = [card['id'] for card in res.json()]
+        self.assertEqual(len(first_page), 2)
+        res = self.client.get(CARDS_SEARCH_URL, {
+            'q': 'report', 'limit': 2,
+            'cursor': res.headers['X-Next-Cursor'],
+        })
+        self.assertNotIn('X-Next-Cursor', res.headers)
+        self.assertCountEqual(
+            first_page + [card['id'] for card in res.json()],
+            [str(card.id) for card in cards],
+        )
+
+    def test_search_cards_invalid_cursor(self):
+        """Test that a malformed cursor is rejected."""
+        res = self.client.get(
+            CARDS_SEARCH_URL, {'q': 'report', 'cursor': 'bogus'})
+        self.assertEqual(res.status_code, 400)
+
     def test_create_card_successful(self):
         """Test creating a new card."""
         payload = {
@@ -145,6 +277,27 @@ class PrivateCardsApiTests(TestCase):
         self.assertEqual(card.column.id, another_column.id)
         self.assertEqual(card.priority, payload['priority'])
 
+    def test_update_card_to_another_board_modifies_source_board(self):
+        """
+        Test that moving a card to another board changes the version of the
+        board it leaves.
+        """
+        card = Card.objects.create(title='Card', column=self.column)
+        other_board = Board.objects.create(title='Other', user=self.user)
+        other_column = Column.objects.create(board=other_board, title='Done')
+        snapshot_url = reverse('api:board-snapshot', args=[self.board.id])
+        etag = self.client.get(snapshot_url).headers['ETag']
+
+        res = self.client.patch(
+            card_detail_url(card.id),
+            {'column_id': str(other_column.id)},
+            content_type='application/json',
+        )
+        self.assertEqual(res.status_code, 200)
+        res = self.client.get(snapshot_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.json()['columns'][0]['cards'], [])
+
     def test_card_non_editable_fields_unchanged(self):
         """Test that non-editable fields of a card remain unchanged."""
         card = Card.objects.create(
@@ -230,3 +383,243 @@ class PrivateCardsApiTests(TestCase):
         card3.refresh_from_db()
         self.assertGreater(card1.order, card2.order)
         self.assertGreater(card1.order, card3.order)
+
+    def test_move_card_to_another_column_above_target(self):
+        """Test moving a card above a card of another column."""
+        another_column = Column.objects.create(board=self.board, title='Done')
+        card = Card.objects.create(title='Card 1', column=self.column)
+        target1 = Card.objects.create(title='Done 1', column=another_column)
+        target2 = Card.objects.create(title='Done 2', column=another_column)
+        payload = {
+            'column_id': str(another_column.id),
+            'target_card_id': str(target2.id),
+        }
+        res = self.client.post(
+            card_move_url(card.id),
+            json.dumps(payload),
+            content_type='application/json'
+        )
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.json()['column_id'], str(another_column.id))
+        self.assertEqual(
+            list(another_column.cards.values_list('id', flat=True)),
+            [target1.id, card.id, target2.id]
+        )
+        self.assertFalse(self.column.cards.exists())
+
+    def test_move_card_to_bottom_of_another_column(self):
+        """Test moving a card to the bottom of another column."""
+        another_column = Column.objects.create(board=self.board, title='Done')
+        card = Card.objects.create(title='Card 1', column=self.column)
+        existing = Card.objects.create(title='Done 1', column=another_column)
+        payload = {'column_id': str(another_column.id)}
+        res = self.client.post(
+            card_move_url(card.id),
+            json.dumps(payload),
+            content_type='application/json'
+        )
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(
+            list(another_column.cards.values_list('id', flat=True)),
+            [existing.id, card.id]
+        )
+
+    def test_move_card_to_another_board(self):
+        """Test moving a card to another board updates its board id."""
+        another_board = Board.objects.create(title='Other', user=self.user)
+        another_column = Column.objects.create(
+            board=another_board, title='Done')
+        card = Card.objects.create(title='Card 1', column=self.column)
+        res = self.client.post(
+            card_move_url(card.id),
+            json.dumps({'column_id': str(another_column.id)}),
+            content_type='application/json'
+        )
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.json()['board_id'], str(another_board.id))
+        card.refresh_from_db()
+        self.assertEqual(card.board_id, another_board.id)
+
+    def test_move_card_target_not_in_column(self):
+        """Test that the target card must belong to the target column."""
+        another_column = Column.objects.create(board=self.board, title='Done')
+        card = Card.objects.create(title='Card 1', column=self.column)
+        target = Card.objects.create(title='Card 2', column=self.column)
+        payload = {
+            'column_id': str(another_column.id),
+            'target_card_id': str(target.id),
+        }
+        res = self.client.post(
+            card_move_url(card.id),
+            json.dumps(payload),
+            content_type='application/json'
+        )
+        self.assertEqual(res.status_code, 404)
+        card.refresh_from_db()
+        self.assertEqual(card.column_id, self.column.id)
+
+    def test_move_card_to_column_not_owned(self):
+        """Test that a card cannot be moved into another user's column."""
+        another_user = User.objects.create_user('anotheruser@example.com')
+        another_board = Board.objects.create(
+            title='Another Board', user=another_user)
+        another_column = Column.objects.create(
+            board=another_board, title='In Progress')
+        card = Card.objects.create(title='Card 1', column=self.column)
+        payload = {'column_id': str(another_column.id)}
+        res = self.client.post(
+            card_move_url(card.id),
+            json.dumps(payload),
+            content_type='application/json'
+        )
+        self.assertEqual(res.status_code, 404)
+        card.refresh_from_db()
+        self.assertEqual(card.column_id, self.column.id)
+
+    def test_bulk_card_operations(self):
+        """Test applying create, update, move and delete in one request."""
+        done = Column.objects.create(board=self.board, title='Done')
+        card1 = Card.objects.create(title='Card 1', column=self.column)
+        card2 = Card.objects.create(title='Card 2', column=self.column)
+        card3 = Card.objects.create(title='Card 3', column=self.column)
+        Card.objects.create(title='Done 1', column=done)
+        payload = {'operations': [
+            {'op': 'create', 'title': 'New 1', 'column_id': str(done.id)},
+            {'op': 'create', 'title': 'New 2', 'priority': 'high',
+             'column_id': str(self.column.id)},
+            {'op': 'update', 'id': str(card1.id), 'title': 'Renamed'},
+            {'op': 'move', 'id': str(card2.id), 'column_id': str(done.id)},
+            {'op': 'delete', 'id': str(card3.id)},
+        ]}
+        res = self.client.post(
+            CARDS_BULK_URL,
+            json.dumps(payload),
+            content_type='application/json'
+        )
+        self.assertEqual(res.status_code, 200)
+        content = res.json()
+        self.assertEqual(content['deleted'], [str(card3.id)])
+        self.assertEqual(
+            [c['title'] for c in content['cards']],
+            ['New 1', 'New 2', 'Renamed', 'Card 2']
+        )
+        self.assertFalse(Card.objects.filter(id=card3.id).exists())
+        card1.refresh_from_db()
+        self.assertEqual(card1.title, 'Renamed')
+        self.assertEqual(
+            list(done.cards.values_list('title', flat=True)),
+            ['Done 1', 'New 1', 'Card 2']
+        )
+        self.assertEqual(
+            list(self.column.cards.values_list('title', flat=True)),
+            ['Renamed', 'New 2']
+        )
+        self.assertEqual(
+            Card.objects.get(title='New 2').priority, 'high')
+
+    def test_bulk_card_operations_touch_board(self):
+        """Test that a bulk request bumps the board's updated_at."""
+        self.board.refresh_from_db()
+        original_updated_at = self.board.updated_at
+        payload = {'operations': [
+            {'op': 'create', 'title': 'New', 'column_id': str(self.column.id)},
+        ]}
+        res = self.client.post(
+            CARDS_BULK_URL,
+            json.dumps(payload),
+            content_type='application/json'
+        )
+        self.assertEqual(res.status_code, 200)
+        self.board.refresh_from_db()
+        self.assertGreater(self.board.updated_at, original_updated_at)
+
+    def test_bulk_card_operations_query_count_is_constant(self):
+        """Test that the query count does not grow with the batch size."""
+        def run(count):
+            payload = {'operations': [
+                {'op': 'create', 'title': f'Card {i}',
+                 'column_id': str(self.column.id)}
+                for i in range(count)
+            ]}
+            with CaptureQueriesContext(connection) as queries:
+                res = self.client.post(
+                    CARDS_BULK_URL,
+                    json.dumps(payload),
+                    content_type='application/json'
+                )
+            self.assertEqual(res.status_code, 200)
+            return len(queries.captured_queries)
+
+        self.assertEqual(run(2), run(20))
+        self.assertEqual(self.column.cards.count(), 22)
+
+    def test_bulk_card_operations_lock_columns(self):
+        """
+        Test that the target columns are locked before the next orders are
+        read, so concurrent batches cannot reuse them.
+        """
+        payload = {'operations': [
+            {'op': 'create', 'title': 'New', 'column_id': str(self.column.id)},
+        ]}
+        with CaptureQueriesContext(connection) as queries:
+            res = self.client.post(
+                CARDS_BULK_URL,
+                json.dumps(payload),
+                content_type='application/json'
+            )
+        self.assertEqual(res.status_code, 200)
+        sql = [query['sql'] for query in queries.captured_queries]
+        lock = next(i for i, q in enumerate(sql) if 'FOR UPDATE' in q)
+        max_order = next(i for i, q in enumerate(sql) if 'MAX(' in q)
+        self.assertIn('"board_column"', sql[lock])
+        self.assertLess(lock, max_order)
+
+    def test_bulk_card_operations_rebalance_full_column(self):
+        """
+        Test that a column without headroom for the placed cards is respaced
+        instead of overflowing the order field.
+        """
+        done = Column.objects.create(board=self.board, title='Done')
+        card1 = Card.objects.create(title='Card 1', column=self.column)
+        card2 = Card.objects.create(title='Card 2', column=done)
+        Card.objects.filter(pk=card1.pk).update(order=MAX_ORDER - 1)
+        payload = {'operations': [
+            {'op': 'create', 'title': 'New 1',
+             'column_id': str(self.column.id)},
+            {'op': 'move', 'id': str(card2.id),
+             'column_id': str(self.column.id)},
+            {'op': 'create', 'title': 'New 2',
+             'column_id': str(self.column.id)},
+        ]}
+        res = self.client.post(
+            CARDS_BULK_URL,
+            json.dumps(payload),
+            content_type='application/json'
+        )
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(
+            list(self.column.cards.values_list('title', 'order')),
+            [('Card 1', ORDER_GAP), ('New 1', 2 * ORDER_GAP),
+             ('Card 2', 3 * ORDER_GAP), ('New 2', 4 * ORDER_GAP)]
+        )
+
+    def test_bulk_card_operations_not_owned(self):
+        """Test that a batch touching another user's card is rejected."""
+        another_user = User.objects.create_user('anotheruser@example.com')
+        another_board = Board.objects.create(
+            title='Another Board', user=another_user)
+        another_column = Column.objects.create(
+            board=another_board, title='In Progress')
+        card = Card.objects.create(title='Card', column=another_column)
+        payload = {'operations': [
+            {'op': 'create', 'title': 'New', 'column_id': str(self.column.id)},
+            {'op': 'delete', 'id': str(card.id)},
+        ]}
+        res = self.client.post(
+            CARDS_BULK_URL,
+            json.dumps(payload),
+            content_type='application/json'
+        )
+        self.assertEqual(res.status_code, 404)
+        self.assertTrue(Card.objects.filter(id=card.id).exists())
+        self.assertFalse(self.column.cards.exists())
@@ -0,0 +1,96 @@
+import json
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from board.models import Board, Column
+from card.models import Card
+
+User = get_user_model()
+CARDS_URL = reverse('async-api:cards')
+
+
+def card_detail_url(card_id) -> str:
+    """Return the async detail URL for a card."""
+    return reverse('async-api:card-detail', args=[str(card_id)])
+
+
+def card_move_url(card_id) -> str:
+    """Return the async URL to move a card into a column."""
+    return reverse('async-api:card-move', args=[str(card_id)])
+
+
+class AsyncCardsApiTests(TestCase):
+    """Test authenticated requests to the async cards API."""
+
+    def setUp(self):
+        self.user = User.objects.create_user('testuser@example.com')
+        self.async_client.force_login(self.user)
+        self.board = Board.objects.create(title='Test Board', user=self.user)
+        self.column = Column.objects.create(board=self.board, title='To Do')
+
+    async def test_list_cards(self):
+        """Test retrieving the user's cards."""
+        card = await Card.objects.acreate(title='Card 1', column=self.column)
+        res = await self.async_client.get(CARDS_URL)
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.json(), [
+            {'id': str(card.id), 'title': card.title,
+             'priority': card.priority},
+        ])
+
+    async def test_search_cards(self):
+        """Test searching the user's cards."""
+        card = await Card.objects.acreate(
+            title='Quarterly report', column=self.column)
+        await Card.objects.acreate(title='Card 2', column=self.column)
+        res = await self.async_client.get(
+            reverse('async-api:cards-search'), {'q': 'report'})
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual([c['id'] for c in res.json()], [str(card.id)])
+
+    async def test_create_card(self):
+        """Test creating a card."""
+        payload = {'title': 'Card', 'column_id': str(self.column.id),
+                   'priority': 'low'}
+        res = await self.async_client.post(
+            CARDS_URL, json.dumps(payload), content_type='application/json')
+        self.assertEqual(res.status_code, 201)
+        self.assertEqual(res.json()['board_id'], str(self.board.id))
+
+    async def test_update_card(self):
+        """Test updating a card."""
+        card = await Card.objects.acreate(title='Card 1', column=self.column)
+        res = await self.async_client.patch(
+            card_detail_url(card.id), json.dumps({'title': 'Renamed'}),
+            content_type='application/json')
+        self.assertEqual(res.status_code, 200)
+        await card.arefresh_from_db()
+        self.assertEqual(card.title, 'Renamed')
+
+    async def test_retrieve_card_not_owned(self):
+        """Test that cards of other users are not found."""
+        other = await User.objects.acreate(username='other@example.com')
+        board = await Board.objects.acreate(title='Other', user=other)
+        column = await Column.objects.acreate(board=board, title='To Do')
+        card = await Card.objects.acreate(title='Card', column=column)
+        res = await self.async_client.get(card_detail_url(card.id))
+        self.assertEqual(res.status_code, 404)
+
+    async def test_move_card(self):
+        """Test moving a card to the bottom of another column."""
+        done = await Column.objects.acreate(board=self.board, title='Done')
+        card = await Card.objects.acreate(title='Card 1', column=self.column)
+        res = await self.async_client.post(
+            card_move_url(card.id), json.dumps({'column_id': str(done.id)}),
+            content_type='application/json')
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.json()['column_id'], str(done.id))
+
+    async def test_delete_card(self):
+        """Test deleting a card."""
+        card = await Card.objects.acreate(title='Card 1', column=self.column)
+        res = await self.async_client.delete(card_detail_url(card.id))
+        self.assertEqual(res.status_code, 204)
+        self.assertFalse(await Card.objects.filter(id=card.id).aexists())
@@ -11,10 +11,10 @@ User = get_user_model()
 class CardModelTests(TestCase):
     def setUp(self):
         """Set up column for testing."""
-        user = User.objects.create_user(
+        self.user = User.objects.create_user(
             username='testuser', password='testpass'
         )
-        self.board = Board.objects.create(user=user, title='Test Board')
+        self.board = Board.objects.create(user=self.user, title='Test Board')
         self.column = Column.objects.create(
             board=self.board, title='Test Column')
 
@@ -32,6 +32,23 @@ class CardModelTests(TestCase):
         self.assertEqual(card.body, body)
         self.assertEqual(card.column, self.column)
 
+    def test_board_and_owner_copied_from_column(self):
+        """Test that board and owner are set from the card's column."""
+        card = Card.objects.create(title='Test Card', column=self.column)
+        card.refresh_from_db()
+        self.assertEqual(card.board_id, self.board.id)
+        self.assertEqual(card.owner_id, self.user.id)
+
+    def test_board_follows_column_change(self):
+        """Test that board is updated when a card moves to another board."""
+        other_board = Board.objects.create(user=self.user, title='Other')
+        other_column = Column.objects.create(board=other_board, title='Col')
+        card = Card.objects.create(title='Test Card', column=self.column)
+        card = Card.objects.get(pk=card.pk)
+        card.place_bottom(wrt={'column': other_column.pk})
+        card.refresh_from_db()
+        self.assertEqual(card.board_id, other_board.id)
+
     def test_created_at_is_auto_set(self):
         """Test that created_at is automatically set on creation."""
         start_time = timezone.now()
@@ -1,6 +1,15 @@
 from django.apps import AppConfig
+from django.core import checks
+from django.db.backends.signals import connection_created
 
 
 class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'core'
+
+    def ready(self):
+        from core.deletion import check_database_cascades
+        from core.timing import install_query_recorder
+
+        checks.register(check_database_cascades, checks.Tags.database)
+        connection_created.connect(install_query_recorder)
@@ -0,0 +1,35 @@
+from django.utils.cache import (
+    get_conditional_response,
+    patch_cache_control,
+    quote_etag,
+)
+from django.utils.http import http_date
+
+
+def version_etag(key, updated_at):
+    """Return a strong ETag for version `updated_at` of resource `key`."""
+    return quote_etag(f'{key}-{int(updated_at.timestamp() * 1000000)}')
+
+
+def conditional_response(request, response, key, updated_at):
+    """
+    Answer a conditional GET for a resource last changed at `updated_at`.
+
+    Returns a `304 Not Modified` response when the request's `If-None-Match`
+    header matches. Otherwise sets the `ETag` and `Last-Modified` headers on
+    the temporal `response` and returns None, so the view goes on to build
+    the body.
+
+    `If-Modified-Since` is not honoured: HTTP dates have a resolution of one
+    second, so it would hide a second change made in the same second.
+    """
+    etag = version_etag(key, updated_at)
+    last_modified = int(updated_at.timestamp())
+    not_modified = get_conditional_response(request, etag=etag)
+    if not_modified is not None:
+        patch_cache_control(not_modified, private=True, no_cache=True)
+        return not_modified
+    response.headers['ETag'] = etag
+    response.headers['Last-Modified'] = http_date(last_modified)
+    patch_cache_control(response, private=True, no_cache=True)
+    return None
@@ -0,0 +1,108 @@
+from django.apps import apps
+from django.core import checks
+from django.db import connections, models
+from django.db.models import CASCADE, DO_NOTHING, SET_NULL
+from django.db.models.deletion import get_candidate_relations_to_delete
+
+# Database vendors on which `CascadeForeignKey` constraints are declared
+# `ON DELETE CASCADE`.
+DATABASE_CASCADE_VENDORS = ('postgresql',)
+
+
+class CascadeForeignKey(models.ForeignKey):
+    """
+    ForeignKey whose constraint also cascades deletes inside the database.
+
+    Deleting the parent rows with a raw DELETE then removes the children
+    server-side. Django cannot declare the cascade, so the constraint is
+    replaced by a `RunSQL` migration operation, and schema changes that
+    recreate the constraint must add it again; the `core.W001` check warns
+    when one lacks it. The ORM collector keeps cascading in Python
+    everywhere.
+    """
+
+    db_cascade = True
+
+
+def cascades_in_database(field, using):
+    """Return whether the constraint of `field` cascades on `using`."""
+    return (
+        getattr(field, 'db_cascade', False)
+        and connections[using].vendor in DATABASE_CASCADE_VENDORS
+    )
+
+
+def _database_cascade_warnings(connection):
+    warnings = []
+    for model in apps.get_models():
+        for field in model._meta.local_fields:
+            if not getattr(field, 'db_cascade', False):
+                continue
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT c.conname, c.confdeltype FROM pg_constraint c "
+                    "JOIN pg_attribute a ON a.attrelid = c.conrelid "
+                    "AND a.attnum = ANY(c.conkey) "
+                    "WHERE c.contype = 'f' "
+                    "AND c.conrelid = to_regclass(%s) AND a.attname = %s",
+                    [connection.ops.quote_name(model._meta.db_table),
+                     field.column],
+                )
+                constraints = cursor.fetchall()
+            warnings.extend(
+                checks.Warning(
+                    f"The constraint {name} of {field} does not cascade "
+                    f"deletes in the database.",
+                    hint="Recreate it with ON DELETE CASCADE in a RunSQL "
+                         "migration operation.",
+                    obj=field,
+                    id='core.W001',
+                )
+                for name, on_delete in constraints if on_delete != 'c'
+            )
+    return warnings
+
+
+def check_database_cascades(app_configs=None, databases=None, **kwargs):
+    """
+    Warn about `CascadeForeignKey` constraints that lost `ON DELETE CASCADE`,
+    e.g. when an AlterField recreated them.
+    """
+    warnings = []
+    for alias in databases or ():
+        connection = connections[alias]
+        if connection.vendor in DATABASE_CASCADE_VENDORS:
+            warnings.extend(_database_cascade_warnings(connection))
+    return warnings
+
+
+def raw_delete(queryset):
+    """
+    Delete the rows of `queryset` and the rows cascading from them with one
+    set-based DELETE per table.
+
+    Unlike `QuerySet.delete()` no rows are loaded into memory and no signals
+    or model `delete()` overrides run. Each dependent table is filtered with
+    a subquery on its parent, so children are deleted before their parents.
+    Dependents whose constraint cascades in the database are left to it.
+    Returns the number of rows deleted by the issued statements.
+    """
+    deleted = 0
+    using = queryset.db
+    for related in get_candidate_relations_to_delete(queryset.model._meta):
+        on_delete = related.on_delete
+        if on_delete is DO_NOTHING or cascades_in_database(
+                related.field, using):
+            continue
+        related_queryset = related.related_model._base_manager.using(
+            using).filter(**{f'{related.field.name}__in': queryset})
+        if on_delete is CASCADE:
+            deleted += raw_delete(related_queryset)
+        elif on_delete is SET_NULL:
+            related_queryset.update(**{related.field.name: None})
+        else:
+            raise ValueError(
+                f"Cannot raw delete through {related.field!r} with "
+                f"on_delete={on_delete.__name__}."
+            )
+    return deleted + queryset._raw_delete(using)
@@ -0,0 +1,270 @@
+import math
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.test.utils import (
+    CaptureQueriesContext,
+    setup_test_environment,
+    teardown_test_environment,
+)
+from django.urls import reverse
+
+from board.models import Board, Column
+from card.models import Card
+from core.ordering import ORDER_GAP
+
+User = get_user_model()
+
+# Largest query count and p95 latency, in milliseconds, accepted per
+# scenario. Latency budgets are scaled by --budget-scale on slower hosts.
+# Query counts are those of the default settings: every authenticated
+# request reads its session from the database, and BEGIN and COMMIT count
+# as queries.
+BUDGETS = {
+    'guest_first_hit': {'queries': 14, 'p95_ms': 50},
+    'retrieve_board': {'queries': 3, 'p95_ms': 20},
+    'list_cards': {'queries': 4, 'p95_ms': 30},
+    'create_card': {'queries': 8, 'p95_ms': 25},
+    # Moves include the occasional rebalance of a crowded group.
+    'move_card_above': {'queries': 17, 'p95_ms': 100},
+    'move_column_before': {'queries': 17, 'p95_ms': 100},
+}
+
+
+def percentile(values, pct):
+    """Return the nearest-rank `pct` percentile of `values`."""
+    values = sorted(values)
+    return values[max(math.ceil(pct / 100 * len(values)) - 1, 0)]
+
+
+class Command(BaseCommand):
+    help = ("Seed boards and cards and measure latency, throughput and query "
+            "counts of the hot API endpoints")
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--users",
+            type=int,
+            default=100,
+            help="Number of users to seed",
+        )
+
+        parser.add_argument(
+            "--boards",
+            type=int,
+            default=3,
+            help="Number of boards to seed per user",
+        )
+
+        parser.add_argument(
+            "--columns",
+            type=int,
+            default=4,
+            help="Number of columns to seed per board",
+        )
+
+        parser.add_argument(
+            "--cards",
+            type=int,
+            default=25,
+            help="Number of cards to seed per column",
+        )
+
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=100,
+            help="Number of measured requests per scenario",
+        )
+
+        parser.add_argument(
+            "--budget-scale",
+            type=float,
+            default=1.0,
+            help="Multiply the latency budgets by this factor",
+        )
+
+        parser.add_argument(
+            "--skip-budgets",
+            action="store_true",
+            help="Report the measurements without enforcing budgets",
+        )
+
+        parser.add_argument(
+            "--no-test-db",
+            action="store_true",
+            help="Seed the configured database instead of a throwaway "
+                 "test database",
+        )
+
+    def handle(self, *args, **options):
+        if options["users"] < 1 or options["columns"] < 2 \
+                or options["cards"] < 2 or options["boards"] < 1:
+            raise CommandError(
+                "At least one user and board, two columns and two cards "
+                "per column are needed.")
+
+        try:
+            setup_test_environment()
+        except RuntimeError:
+            # Already set up, e.g. when run from the test suite.
+            environment_owner = False
+        else:
+            environment_owner = True
+
+        old_name = None
+        if not options["no_test_db"]:
+            old_name = connection.settings_dict["NAME"]
+            connection.creation.create_test_db(
+                verbosity=0, autoclobber=True, serialize=False)
+        try:
+            self.stdout.write("Seeding data...")
+            user = self._seed(options)
+            results = self._run(user, options["requests"])
+        finally:
+            if old_name is not None:
+                connection.creation.destroy_test_db(old_name, verbosity=0)
+            if environment_owner:
+                teardown_test_environment()
+
+        self._report(results)
+        if not options["skip_budgets"]:
+            self._check_budgets(results, options["budget_scale"])
+
+    def _seed(self, options):
+        """Bulk insert the dataset and return the user to benchmark with."""
+        users = User.objects.bulk_create([
+            User(username=f"benchmark-{i}@example.com")
+            for i in range(options["users"])
+        ])
+        boards = Board.objects.bulk_create([
+            Board(user=user, title=f"Board {i}")
+            for user in users
+            for i in range(options["boards"])
+        ])
+        columns = Column.objects.bulk_create([
+            Column(board=board, title=f"Column {i}",
+                   order=(i + 1) * ORDER_GAP)
+            for board in boards
+            for i in range(options["columns"])
+        ], batch_size=1000)
+        Card.objects.bulk_create([
+            Card(column=column, board_id=column.board_id,
+                 owner_id=column.board.user_id, title=f"Card {i}",
+                 body="Lorem ipsum dolor sit amet.",
+                 order=(i + 1) * ORDER_GAP)
+            for column in columns
+            for i in range(options["cards"])
+        ], batch_size=1000)
+        return users[0]
+
+    def _run(self, user, requests):
+        client = Client()
+        client.force_login(user)
+        board = Board.objects.filter(user=user).first()
+        column, other_column = Column.objects.filter(board=board)[:2]
+        card, other_card = Card.objects.filter(column=column)[:2]
+
+        def guest_first_hit(i):
+            return Client().get(
+                reverse('api:latest-board'), secure=True)
+
+        def retrieve_board(i):
+            return client.get(
+                reverse('api:board-detail', args=[board.id]), secure=True)
+
+        def list_cards(i):
+            return client.get(
+                reverse('api:cards'), {'column_id': str(column.id)},
+                secure=True)
+
+        def create_card(i):
+            return client.post(
+                reverse('api:cards'),
+                {'title': f'New card {i}', 'priority': 'medium',
+                 'column_id': str(column.id)},
+                content_type='application/json', secure=True)
+
+        def move_card_above(i):
+            moved, target = (card, other_card) if i % 2 \
+                else (other_card, card)
+            return client.post(
+                reverse('api:card-move-above', args=[moved.id]),
+                {'target_card_id': str(target.id)},
+                content_type='application/json', secure=True)
+
+        def move_column_before(i):
+            moved, target = (column, other_column) if i % 2 \
+                else (other_column, column)
+            return client.post(
+                reverse('api:column-move-before', args=[board.id, moved.id]),
+                {'target_column_id': str(target.id)},
+                content_type='application/json', secure=True)
+
+        scenarios = [
+            guest_first_hit,
+            retrieve_board,
+            list_cards,
+            create_card,
+            move_card_above,
+            move_column_before,
+        ]
+        return {
+            scenario.__name__: self._measure(scenario, requests)
+            for scenario in scenarios
+        }
+
+    def _measure(self, scenario, requests):
+        # One untimed request warms up URL resolution and lazy imports.
+        scenario(0)
+        durations = []
+        queries = 0
+        started = time.perf_counter()
+        for i in range(1, requests + 1):
+            with CaptureQueriesContext(connection) as captured:
+                request_started = time.perf_counter()
+                response = scenario(i)
+                durations.append(time.perf_counter() - request_started)
+            if response.status_code >= 300:
+                raise CommandError(
+                    f"{scenario.__name__} returned {response.status_code}: "
+                    f"{response.content[:200]!r}")
+            queries = max(queries, len(captured))
+        elapsed = time.perf_counter() - started
+        return {
+            'p50_ms': percentile(durations, 50) * 1000,
+            'p95_ms': percentile(durations, 95) * 1000,
+            'throughput': requests / elapsed,
+            'queries': queries,
+        }
+
+    def _report(self, results):
+        for name, result in results.items():
+            self.stdout.write(
+                f"{name:<20} "
+                f"p50 {result['p50_ms']:7.2f} ms  "
+                f"p95 {result['p95_ms']:7.2f} ms  "
+                f"{result['throughput']:8.1f} req/s  "
+                f"{result['queries']:3d} queries"
+            )
+
+    def _check_budgets(self, results, budget_scale):
+        failures = []
+        for name, result in results.items():
+            budget = BUDGETS[name]
+            if result['queries'] > budget['queries']:
+                failures.append(
+                    f"{name} ran {result['queries']} queries, budget is "
+                    f"{budget['queries']}")
+            p95_budget = budget['p95_ms'] * budget_scale
+            if result['p95_ms'] > p95_budget:
+                failures.append(
+                    f"{name} p95 is {result['p95_ms']:.2f} ms, budget is "
+                    f"{p95_budget:.2f} ms")
+        if failures:
+            raise CommandError(
+                "Performance budgets exceeded:\n" + "\n".join(failures))
+        self.stdout.write(self.style.SUCCESS("All budgets met"))
@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand
+
+from board.models import Column
+from card.models import Card
+from core.ordering import crowded_groups, rebalance
+
+
+class Command(BaseCommand):
+    help = "Respace column and card orders whose gaps are running out"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--min-gap",
+            type=int,
+            default=16,
+            help="Rebalance groups with neighbours closer than this",
+        )
+
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Show what would be rebalanced without making changes",
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options["dry_run"]
+        for model in (Column, Card):
+            group_field = model.order_with_respect_to
+            groups = crowded_groups(model, options["min_gap"])
+            if not dry_run:
+                for group_id in groups:
+                    rebalance(model.objects.filter(
+                        **{f'{group_field}_id': group_id}))
+
+            log = (f"Rebalanced {len(groups)} "
+                   f"{model._meta.verbose_name_plural}")
+            if dry_run:
+                self.stdout.write(self.style.WARNING(f"[DRY RUN] {log}"))
+            else:
+                self.stdout.write(self.style.SUCCESS(log))
@@ -0,0 +1,139 @@
+import os
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+from django.http import Http404, HttpResponse, HttpResponseForbidden
+from django.utils.crypto import constant_time_compare
+from django.views.decorators.http import require_GET
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+from core.timing import RequestTiming, instrument_connections
+
+REQUEST_LATENCY = Histogram(
+    'kanban_http_request_duration_seconds',
+    'Latency of HTTP requests by route.',
+    ['route', 'method', 'status'],
+)
+REQUEST_QUERIES = Histogram(
+    'kanban_http_request_db_queries',
+    'SQL queries run by HTTP requests by route.',
+    ['route'],
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89),
+)
+DB_POOL_CONNECTIONS = Gauge(
+    'kanban_db_pool_connections',
+    'Connections of the psycopg pools by state.',
+    ['alias', 'state'],
+    multiprocess_mode='livesum',
+)
+GUEST_USERS_CREATED = Counter(
+    'kanban_guest_users_created',
+    'Guest users persisted.',
+)
+GUEST_USERS_DELETED = Counter(
+    'kanban_guest_users_deleted',
+    'Users deleted by cleanup_guests by reason.',
+    ['reason'],
+)
+
+# psycopg_pool statistics exported by DB_POOL_CONNECTIONS.
+_POOL_STATES = {
+    'pool_size': 'open',
+    'pool_available': 'idle',
+    'requests_waiting': 'waiting',
+}
+
+
+def _observe_pools():
+    for connection in connections.all(initialized_only=True):
+        pool = getattr(connection, 'pool', None)
+        if pool is None:
+            continue
+        stats = pool.get_stats()
+        for key, state in _POOL_STATES.items():
+            DB_POOL_CONNECTIONS.labels(connection.alias, state).set(
+                stats.get(key, 0))
+
+
+class MetricsMiddleware:
+    """
+    Record the latency and query count of each request by route.
+
+    Routes are the namespaced url names, e.g. `api:board-detail`, so
+    unresolved paths do not create new series. Enabled with the
+    `METRICS` setting.
+    """
+    async_capable = True
+    sync_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        timing, started = RequestTiming(), time.perf_counter()
+        with instrument_connections(timing):
+            response = self.get_response(request)
+        return self._observe(request, response, timing, started)
+
+    async def __acall__(self, request):
+        timing, started = RequestTiming(), time.perf_counter()
+        with instrument_connections(timing):
+            response = await self.get_response(request)
+        return self._observe(request, response, timing, started)
+
+    def _observe(self, request, response, timing, started):
+        match = request.resolver_match
+        route = match.view_name if match else 'unresolved'
+        REQUEST_LATENCY.labels(
+            route, request.method, response.status_code,
+        ).observe(time.perf_counter() - started)
+        REQUEST_QUERIES.labels(route).observe(timing.queries)
+        _observe_pools()
+        return response
+
+
+def _registry():
+    # Gunicorn workers write their samples to PROMETHEUS_MULTIPROC_DIR,
+    # which is aggregated on every scrape.
+    if 'PROMETHEUS_MULTIPROC_DIR' not in os.environ:
+        return REGISTRY
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+
+@require_GET
+def metrics(request):
+    """
+    Expose the metrics in the Prometheus text format, when enabled by the
+    `METRICS` setting.
+
+    Scrapers must send `METRICS['TOKEN']` as a bearer token. Only with
+    `DEBUG` on are the metrics served without a token.
+    """
+    options = getattr(settings, 'METRICS', {})
+    if not options.get('ENABLED'):
+        raise Http404
+    token = options.get('TOKEN')
+    if not (token or settings.DEBUG):
+        raise Http404
+    if token and not constant_time_compare(
+            request.headers.get('Authorization', ''), f'Bearer {token}'):
+        return HttpResponseForbidden()
+    return HttpResponse(
+        generate_latest(_registry()), content_type=CONTENT_TYPE_LATEST)
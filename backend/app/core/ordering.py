@@ -0,0 +1,145 @@
+from django.db import models
+from django.db.models import F, Q, Window
+from django.db.models.functions import Lag
+from ordered_model.models import (  # type: ignore
+    OrderedModelManager,
+    OrderedModelQuerySet,
+)
+
+# Distance between neighbouring rows after a rebalance, and the largest value
+# a PositiveIntegerField holds on every supported database.
+ORDER_GAP = 1024
+MAX_ORDER = 2147483647
+
+
+class OrderedQuerySet(OrderedModelQuerySet):
+    """
+    Ordered queryset whose `bulk_create` keeps orders computed by the caller.
+
+    `OrderedModelQuerySet.bulk_create` always overwrites `order` with one
+    max-order query per group; when every object already carries an order the
+    objects are inserted as they are.
+    """
+
+    def bulk_create(self, objs, *args, **kwargs):
+        objs = list(objs)
+        order_field_name = self._get_order_field_name()
+        if all(getattr(obj, order_field_name) is not None for obj in objs):
+            return models.QuerySet.bulk_create(self, objs, *args, **kwargs)
+        return super().bulk_create(objs, *args, **kwargs)
+
+
+class OrderedManager(OrderedModelManager.from_queryset(OrderedQuerySet)):
+    pass
+
+
+def rebalance(queryset):
+    """Respace the rows of one ordering group `ORDER_GAP` apart."""
+    # `OrderedModel.__init__` reads the group field, so it must not be
+    # deferred.
+    group_field = f'{queryset.model.order_with_respect_to}_id'
+    rows = list(queryset.order_by('order', 'pk').only(
+        'pk', 'order', group_field))
+    for position, row in enumerate(rows, start=1):
+        row.order = position * ORDER_GAP
+    queryset.model._base_manager.bulk_update(rows, ['order'], batch_size=1000)
+
+
+def next_order(queryset):
+    """Return the order placing a new row `ORDER_GAP` below the last one."""
+    max_order = queryset.get_max_order()
+    if max_order is None:
+        return ORDER_GAP
+    if max_order + ORDER_GAP > MAX_ORDER:
+        rebalance(queryset)
+        max_order = queryset.get_max_order()
+    return max_order + ORDER_GAP
+
+
+def crowded_groups(model, min_gap):
+    """
+    Return the `order_with_respect_to` values of the groups of `model` where
+    two neighbours, or the first row and zero, are less than `min_gap` apart,
+    or where the last row leaves less than `ORDER_GAP` of headroom.
+    """
+    group_field = f'{model.order_with_respect_to}_id'
+    rows = model._base_manager.annotate(gap=F('order') - Window(
+        Lag('order'),
+        partition_by=[F(group_field)],
+        order_by=F('order').asc(),
+    )).filter(
+        Q(gap__lt=min_gap)
+        | Q(gap__isnull=True, order__lt=min_gap)
+        | Q(order__gt=MAX_ORDER - ORDER_GAP)
+    )
+    return set(rows.values_list(group_field, flat=True))
+
+
+class GapOrderedMixin:
+    """
+    Sparse ordering for `OrderedModel` subclasses.
+
+    Rows are spaced `ORDER_GAP` apart, so placing a row between two others
+    writes only that row instead of shifting every sibling in between. When
+    two neighbours run out of room their group is rebalanced first. Deletes
+    leave gaps behind instead of compacting the siblings that follow.
+
+    Must be listed before `OrderedModel` in the bases.
+    """
+
+    @classmethod
+    def _on_ordered_model_delete(cls, sender=None, instance=None, **kwargs):
+        """Skip the compaction `ordered_model` runs after queryset deletes."""
+
+    def save(self, *args, **kwargs):
+        if self.order is None or self._wrt_map() != self._original_wrt_map:
+            self.order = next_order(self.get_ordering_queryset())
+            self._original_wrt_map = self._wrt_map()
+        super().save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        self._was_deleted_via_delete_method = True
+        return models.Model.delete(self, *args, **kwargs)
+
+    def place_above(self, ref):
+        """Move this object right above `ref`, in `ref`'s group."""
+        if self.pk == ref.pk:
+            return
+        wrt = ref._wrt_map()
+        siblings = self.get_ordering_queryset(wrt=wrt).exclude(pk=self.pk)
+        previous = siblings.below(ref.order).get_max_order()
+        lower = -1 if previous is None else previous
+        if self._wrt_map() == wrt and lower < self.order < ref.order:
+            return
+        if ref.order - lower < 2:
+            rebalance(siblings)
+            ref.refresh_from_db(
+                fields=['order', *(f'{name}_id' for name in wrt)])
+            previous = siblings.below(ref.order).get_max_order()
+            lower = -1 if previous is None else previous
+        self._place((lower + ref.order) // 2, wrt)
+
+    def place_bottom(self, wrt=None):
+        """
+        Move this object to the bottom of its group, or of the group given
+        by `wrt`.
+        """
+        wrt = self._wrt_map() if wrt is None else wrt
+        siblings = self.get_ordering_queryset(wrt=wrt).exclude(pk=self.pk)
+        max_order = siblings.get_max_order()
+        if self._wrt_map() == wrt and (
+                max_order is None or self.order > max_order):
+            return
+        self._place(next_order(siblings), wrt)
+
+    def _place(self, order, wrt):
+        for name, value in wrt.items():
+            setattr(self, f'{name}_id', value)
+        self.order = order
+        self._original_wrt_map = self._wrt_map()
+        update_fields = ['order', *(f'{name}_id' for name in wrt)]
+        update_fields += [
+            field.name for field in self._meta.concrete_fields
+            if getattr(field, 'auto_now', False)
+        ]
+        self.save(update_fields=update_fields)
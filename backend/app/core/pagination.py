@@ -0,0 +1,176 @@
+import base64
+import functools
+import uuid
+from types import SimpleNamespace
+
+from django.db.models import Q
+from ninja import Field, Schema
+from pydantic import create_model
+
+# Largest page a client may request, and the response header carrying the
+# cursor of the next page.
+MAX_PAGE_SIZE = 500
+NEXT_CURSOR_HEADER = 'X-Next-Cursor'
+
+
+class ListQuery(Schema):
+    """
+    Query parameters for keyset pagination and sparse fieldsets.
+
+    Lists stay unbounded unless `limit` or `cursor` is given. `fields` is a
+    comma separated subset of the response schema fields.
+    """
+    cursor: str | None = None
+    limit: int | None = Field(None, ge=1, le=MAX_PAGE_SIZE)
+    fields: str | None = None
+
+
+@functools.cache
+def sparse_schema(schema):
+    """
+    Return a subclass of `schema` whose fields are all optional, so rows
+    carrying a subset of the fields validate. Pair it with
+    `exclude_unset=True` to leave the missing fields out of the response.
+    """
+    return create_model(
+        f'Sparse{schema.__name__}',
+        __base__=schema,
+        **{
+            name: (field.annotation | None, None)
+            for name, field in schema.model_fields.items()
+        },
+    )
+
+
+def parse_fields(fields, schema):
+    """
+    Split a `fields=` parameter into field names of `schema`.
+
+    Returns None when no fields were requested and raises ValueError on
+    unknown names.
+    """
+    if not fields:
+        return None
+    names = list(dict.fromkeys(
+        name.strip() for name in fields.split(',') if name.strip()))
+    unknown = [name for name in names if name not in schema.model_fields]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}.")
+    return names
+
+
+def encode_cursor(row):
+    """Return the cursor of the page following `row`."""
+    value = f'{row.order}:{row.pk}'.encode()
+    return base64.urlsafe_b64encode(value).decode()
+
+
+def decode_cursor(cursor):
+    """Return the `(order, pk)` pair of a cursor, or raise ValueError."""
+    try:
+        value = base64.urlsafe_b64decode(cursor.encode()).decode()
+        order, pk = value.split(':')
+        return int(order), uuid.UUID(pk)
+    except (ValueError, UnicodeError):
+        raise ValueError("Invalid cursor.")
+
+
+def paginate(queryset, query, fields=None):
+    """
+    Return one page of `queryset` ordered by `(order, id)` and the cursor of
+    the next page, or None on the last page.
+
+    Only the columns of `fields` are loaded when given, and the rows are
+    returned as plain objects holding just those attributes.
+    """
+    queryset, limit = _page_queryset(queryset, query, fields)
+    return _page(list(queryset), limit, fields)
+
+
+async def apaginate(queryset, query, fields=None):
+    """Async version of `paginate`."""
+    queryset, limit = _page_queryset(queryset, query, fields)
+    return _page([row async for row in queryset], limit, fields)
+
+
+def _page_queryset(queryset, query, fields):
+    queryset = queryset.order_by('order', 'id')
+    if fields:
+        # `OrderedModel.__init__` reads the group field, which would load
+        # each row again if deferred.
+        group_field = f'{queryset.model.order_with_respect_to}_id'
+        queryset = queryset.only(*fields, 'pk', 'order', group_field)
+    if query.cursor:
+        order, pk = decode_cursor(query.cursor)
+        queryset = queryset.filter(
+            Q(order__gt=order) | Q(order=order, id__gt=pk))
+    if not (query.limit or query.cursor):
+        return queryset, None
+    limit = query.limit or MAX_PAGE_SIZE
+    return queryset[:limit + 1], limit
+
+
+def _page(rows, limit, fields):
+    next_cursor = None
+    if limit is not None and len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1])
+    return select_fields(rows, fields), next_cursor
+
+
+def paginate_offset(queryset, query):
+    """
+    Return one page of the already ordered `queryset` and the cursor of the
+    next page, or None on the last page.
+
+    For orderings without a unique key to seek from, such as search rank;
+    the cursor carries the offset of the next page.
+    """
+    queryset, limit = _offset_queryset(queryset, query)
+    return _offset_page(list(queryset), limit, query)
+
+
+async def apaginate_offset(queryset, query):
+    """Async version of `paginate_offset`."""
+    queryset, limit = _offset_queryset(queryset, query)
+    return _offset_page([row async for row in queryset], limit, query)
+
+
+def _offset_queryset(queryset, query):
+    offset = decode_offset_cursor(query.cursor) if query.cursor else 0
+    return queryset[offset:offset + query.limit + 1], query.limit
+
+
+def _offset_page(rows, limit, query):
+    if len(rows) <= limit:
+        return rows, None
+    offset = decode_offset_cursor(query.cursor) if query.cursor else 0
+    return rows[:limit], encode_offset_cursor(offset + limit)
+
+
+def encode_offset_cursor(offset):
+    """Return the cursor of the page starting at `offset`."""
+    return base64.urlsafe_b64encode(f'offset:{offset}'.encode()).decode()
+
+
+def decode_offset_cursor(cursor):
+    """Return the offset of an offset cursor, or raise ValueError."""
+    try:
+        value = base64.urlsafe_b64decode(cursor.encode()).decode()
+        prefix, offset = value.split(':')
+        offset = int(offset)
+    except (ValueError, UnicodeError):
+        raise ValueError("Invalid cursor.")
+    if prefix != 'offset' or offset < 0:
+        raise ValueError("Invalid cursor.")
+    return offset
+
+
+def select_fields(rows, fields):
+    """Restrict `rows` to the attributes named in `fields`, if given."""
+    if not fields:
+        return rows
+    return [
+        SimpleNamespace(**{name: getattr(row, name) for name in fields})
+        for row in rows
+    ]
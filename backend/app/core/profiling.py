@@ -0,0 +1,145 @@
+import cProfile
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+import uuid
+
+from asgiref.sync import (
+    iscoroutinefunction,
+    markcoroutinefunction,
+    sync_to_async,
+)
+from django.conf import settings
+from django.core import signing
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = 'X-Profile'
+PROFILE_FILE_HEADER = 'X-Profile-File'
+_TOKEN_SALT = 'core.profiling'
+_TOKEN_VALUE = 'profile'
+
+# Held while a request is profiled. Since Python 3.12 only one profiler may
+# be active per process, so concurrent requests are served unprofiled.
+_profiler_lock = threading.Lock()
+
+
+def _options():
+    return getattr(settings, 'PROFILER', {})
+
+
+def make_profile_token():
+    """Return a token allowing one to profile requests for a while."""
+    return signing.TimestampSigner(salt=_TOKEN_SALT).sign(_TOKEN_VALUE)
+
+
+def _is_valid_token(token):
+    try:
+        value = signing.TimestampSigner(salt=_TOKEN_SALT).unsign(
+            token, max_age=_options().get('TOKEN_MAX_AGE', 3600))
+    except signing.BadSignature:
+        return False
+    return value == _TOKEN_VALUE
+
+
+def _enable_profiler():
+    """Return an enabled profiler, or None if another one is active."""
+    if not _profiler_lock.acquire(blocking=False):
+        return None
+    if sys.getprofile() is None:
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # Another profiling tool is active.
+            pass
+        else:
+            return profiler
+    _profiler_lock.release()
+    return None
+
+
+def _disable_profiler(profiler):
+    profiler.disable()
+    _profiler_lock.release()
+
+
+class ProfilerMiddleware:
+    """
+    Run single requests under cProfile on demand.
+
+    A request is profiled when it carries an `X-Profile` header and either
+    comes from a staff user, or the header holds a token from
+    `manage.py profile_token`. The stats are written to a `.prof` file in
+    the `PROFILER['DIRECTORY']` directory, named in the `X-Profile-File`
+    response header, for `pstats`, snakeviz or flameprof.
+
+    Since Python 3.12 cProfile records every thread of the process, so the
+    stats also cover the worker threads of async views and whatever other
+    requests the process serves meanwhile; run gthread workers with
+    `GUNICORN_THREADS=1` while profiling to keep them out. Older versions
+    only profile the thread serving the request. A request arriving while
+    another one is profiled is served unprofiled.
+    """
+    async_capable = True
+    sync_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not (PROFILE_HEADER in request.headers
+                and self._is_allowed(request)):
+            return self.get_response(request)
+        profiler = _enable_profiler()
+        if profiler is None:
+            logger.warning('Not profiling %s %s: another profiler is active',
+                           request.method, request.path)
+            return self.get_response(request)
+        try:
+            response = self.get_response(request)
+        finally:
+            _disable_profiler(profiler)
+        return self._save(request, response, profiler)
+
+    async def __acall__(self, request):
+        if not (PROFILE_HEADER in request.headers
+                and await sync_to_async(self._is_allowed)(request)):
+            return await self.get_response(request)
+        profiler = _enable_profiler()
+        if profiler is None:
+            logger.warning('Not profiling %s %s: another profiler is active',
+                           request.method, request.path)
+            return await self.get_response(request)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _disable_profiler(profiler)
+        return self._save(request, response, profiler)
+
+    def _is_allowed(self, request):
+        user = getattr(request, 'user', None)
+        if user is not None and user.is_staff:
+            return True
+        return _is_valid_token(request.headers[PROFILE_HEADER])
+
+    def _save(self, request, response, profiler):
+        directory = _options().get('DIRECTORY', os.path.join(
+            tempfile.gettempdir(), 'kanban-profiles'))
+        os.makedirs(directory, exist_ok=True)
+        match = request.resolver_match
+        route = match.view_name.replace(':', '.') if match else 'unresolved'
+        filename = (f"{time.strftime('%Y%m%dT%H%M%S')}-{route}-"
+                    f"{uuid.uuid4().hex[:8]}.prof")
+        profiler.dump_stats(os.path.join(directory, filename))
+        logger.info('Profiled %s %s to %s',
+                    request.method, request.path, filename)
+        response[PROFILE_FILE_HEADER] = filename
+        return response
@@ -0,0 +1,155 @@
+import asyncio
+import json
+import logging
+import threading
+from collections import defaultdict
+from contextlib import asynccontextmanager
+
+import psycopg
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.db import connections
+from django.utils.module_loading import import_string
+from psycopg import sql
+from psycopg.conninfo import make_conninfo
+
+logger = logging.getLogger(__name__)
+
+# NOTIFY payloads must be shorter than 8000 bytes by default.
+MAX_NOTIFY_PAYLOAD = 7999
+
+
+def _offer(queue, message):
+    try:
+        queue.put_nowait(message)
+    except asyncio.QueueFull:
+        # The subscriber is not keeping up; drop rather than buffer forever.
+        pass
+
+
+class LocalBroker:
+    """
+    In-process publish/subscribe of JSON-serializable messages.
+
+    Subscribers are asyncio queues bound to their event loop; publishing is
+    thread-safe, so sync views and async streams can share the broker.
+    Messages only reach subscribers of the current process.
+    """
+
+    def __init__(self, options):
+        self.max_queued = options.get('MAX_QUEUED', 100)
+        self._subscribers = defaultdict(set)
+        self._lock = threading.Lock()
+
+    def publish(self, channel, message):
+        self._deliver(channel, message)
+
+    def _deliver(self, channel, message):
+        with self._lock:
+            subscribers = list(self._subscribers.get(channel, ()))
+        for loop, queue in subscribers:
+            try:
+                loop.call_soon_threadsafe(_offer, queue, message)
+            except RuntimeError:
+                # The subscriber's loop is already closed.
+                pass
+
+    @asynccontextmanager
+    async def subscribe(self, channel):
+        """Yield a queue receiving the messages published on `channel`."""
+        subscriber = (
+            asyncio.get_running_loop(),
+            asyncio.Queue(maxsize=self.max_queued),
+        )
+        with self._lock:
+            self._subscribers[channel].add(subscriber)
+        try:
+            yield subscriber[1]
+        finally:
+            with self._lock:
+                self._subscribers[channel].discard(subscriber)
+                if not self._subscribers[channel]:
+                    del self._subscribers[channel]
+
+
+class PostgresBroker(LocalBroker):
+    """
+    Publish/subscribe across processes through PostgreSQL LISTEN/NOTIFY.
+
+    Messages are sent with `pg_notify` on the `DATABASE_ALIAS` connection
+    and every process relays the notifications of the `CHANNEL` channel to
+    its local subscribers from one listening connection per event loop.
+    Messages too large for a notification are sent without their `data`,
+    so subscribers fetch the object instead.
+    """
+
+    def __init__(self, options):
+        super().__init__(options)
+        self.database_alias = options.get('DATABASE_ALIAS', 'default')
+        self.channel = options.get('CHANNEL', 'kanban_events')
+        self._listeners = {}
+
+    def publish(self, channel, message):
+        payload = json.dumps({'channel': channel, 'message': message})
+        if len(payload) > MAX_NOTIFY_PAYLOAD and 'data' in message:
+            message = {k: v for k, v in message.items() if k != 'data'}
+            payload = json.dumps({'channel': channel, 'message': message})
+        with connections[self.database_alias].cursor() as cursor:
+            cursor.execute('SELECT pg_notify(%s, %s)', [self.channel, payload])
+
+    @asynccontextmanager
+    async def subscribe(self, channel):
+        loop = asyncio.get_running_loop()
+        listener = self._listeners.get(loop)
+        if listener is None or listener.done():
+            self._listeners[loop] = loop.create_task(self._listen())
+        async with super().subscribe(channel) as queue:
+            yield queue
+
+    async def _listen(self):
+        params = connections[self.database_alias].settings_dict
+        conninfo = make_conninfo(
+            dbname=params['NAME'],
+            user=params['USER'],
+            password=params['PASSWORD'],
+            host=params['HOST'],
+            port=params['PORT'] or None,
+        )
+        while True:
+            try:
+                async with await psycopg.AsyncConnection.connect(
+                        conninfo, autocommit=True) as connection:
+                    await connection.execute(
+                        sql.SQL('LISTEN {}').format(
+                            sql.Identifier(self.channel)))
+                    async for notify in connection.notifies():
+                        data = json.loads(notify.payload)
+                        self._deliver(data['channel'], data['message'])
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception('Event listener failed, reconnecting.')
+                await asyncio.sleep(1)
+
+
+_broker = None
+
+
+def get_broker():
+    """Return the broker configured by the `EVENT_BROKER` setting."""
+    global _broker
+    if _broker is None:
+        options = getattr(settings, 'EVENT_BROKER', {})
+        backend = import_string(
+            options.get('BACKEND', 'core.pubsub.LocalBroker'))
+        _broker = backend(options)
+    return _broker
+
+
+def _reset_broker(*, setting, **kwargs):
+    global _broker
+    if setting == 'EVENT_BROKER':
+        _broker = None
+
+
+setting_changed.connect(_reset_broker)
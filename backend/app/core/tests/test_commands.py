@@ -2,10 +2,13 @@
 from io import StringIO
 from unittest.mock import patch
 from django.core.management import call_command
-from django.test import TestCase
+from django.core.management.base import CommandError
+from django.test import TestCase, TransactionTestCase
 from django.db.utils import OperationalError
 from psycopg import OperationalError as PsycopgError
 
+from card.models import Card
+
 
 class WaitForDbCommandTests(TestCase):
     def setUp(self):
@@ -41,3 +44,52 @@ class WaitForDbCommandTests(TestCase):
         self.mock_check.side_effect = [PsycopgError] * 2 + [None]
         call_command("wait_for_db", stdout=self.out)
         self.assertEqual(self.mock_check.call_count, 3)
+
+
+class BenchmarkCommandTests(TestCase):
+    def setUp(self):
+        self.out = StringIO()
+        self.args = [
+            "benchmark", "--no-test-db", "--users", "2", "--boards", "1",
+            "--columns", "2", "--cards", "3", "--requests", "2",
+        ]
+
+    def test_benchmark_reports_every_scenario(self):
+        """Test that each scenario is measured against seeded data."""
+        call_command(*self.args, "--skip-budgets", stdout=self.out)
+        output = self.out.getvalue()
+        for scenario in ("guest_first_hit", "retrieve_board", "list_cards",
+                         "create_card", "move_card_above",
+                         "move_column_before"):
+            self.assertIn(scenario, output)
+        self.assertEqual(Card.objects.count(), 2 * 3 * 2 + 3)
+
+    def test_benchmark_fails_over_budget(self):
+        """Test that exceeding a query budget fails the command."""
+        budgets = {
+            "guest_first_hit": {"queries": 0, "p95_ms": 10 ** 6},
+            "retrieve_board": {"queries": 10 ** 3, "p95_ms": 10 ** 6},
+            "list_cards": {"queries": 10 ** 3, "p95_ms": 10 ** 6},
+            "create_card": {"queries": 10 ** 3, "p95_ms": 10 ** 6},
+            "move_card_above": {"queries": 10 ** 3, "p95_ms": 10 ** 6},
+            "move_column_before": {"queries": 10 ** 3, "p95_ms": 10 ** 6},
+        }
+        with patch.dict(
+                "core.management.commands.benchmark.BUDGETS", budgets):
+            with self.assertRaisesMessage(
+                    CommandError, "guest_first_hit ran"):
+                call_command(*self.args, stdout=self.out)
+
+
+class BenchmarkBudgetTests(TransactionTestCase):
+    def test_benchmark_meets_default_budgets(self):
+        """
+        Test that the default settings meet the query budgets, outside a
+        test transaction so BEGIN and COMMIT are counted.
+        """
+        out = StringIO()
+        call_command(
+            "benchmark", "--no-test-db", "--users", "2", "--boards", "1",
+            "--columns", "2", "--cards", "3", "--requests", "5",
+            "--budget-scale", "100", stdout=out)
+        self.assertIn("All budgets met", out.getvalue())
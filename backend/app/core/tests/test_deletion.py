@@ -0,0 +1,37 @@
+from django.db import connection
+from django.test import TestCase
+
+from board.models import Column
+from core.deletion import check_database_cascades
+
+
+class DatabaseCascadeCheckTests(TestCase):
+    databases = {'default'}
+
+    def test_cascade_foreign_keys_cascade_in_database(self):
+        """Test that the migrated constraints are ON DELETE CASCADE."""
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT conname FROM pg_constraint WHERE contype = 'f' "
+                "AND confdeltype = 'c' "
+                "AND conrelid IN ('board_board'::regclass, "
+                "'board_column'::regclass, 'card_card'::regclass)"
+            )
+            self.assertEqual(len(cursor.fetchall()), 5)
+        self.assertEqual(check_database_cascades(databases=['default']), [])
+
+    def test_constraint_without_cascade_is_reported(self):
+        """Test that a constraint recreated without cascade is flagged."""
+        field = Column._meta.get_field('board')
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'ALTER TABLE "board_column" DROP CONSTRAINT '
+                '"board_column_board_id_567562b6_fk_board_board_id", '
+                'ADD CONSTRAINT '
+                '"board_column_board_id_567562b6_fk_board_board_id" '
+                'FOREIGN KEY ("board_id") REFERENCES "board_board" ("id") '
+                'DEFERRABLE INITIALLY DEFERRED'
+            )
+        warnings = check_database_cascades(databases=['default'])
+        self.assertEqual([warning.id for warning in warnings], ['core.W001'])
+        self.assertIs(warnings[0].obj, field)
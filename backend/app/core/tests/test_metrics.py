@@ -0,0 +1,127 @@
+import asyncio
+from datetime import timedelta
+from io import StringIO
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from prometheus_client import REGISTRY
+
+from core.metrics import MetricsMiddleware
+from user.services import create_guest_user
+
+User = get_user_model()
+METRICS_URL = reverse('metrics')
+
+
+def sample(name, **labels):
+    """Return the current value of a metric sample, 0 if unset."""
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+@override_settings(METRICS={'ENABLED': True, 'TOKEN': None}, DEBUG=True)
+class MetricsEndpointTests(TestCase):
+    def test_metrics_are_exposed(self):
+        """Test that the Prometheus text format is served."""
+        res = self.client.get(METRICS_URL)
+        self.assertEqual(res.status_code, 200)
+        self.assertIn(b'kanban_guest_users_created_total', res.content)
+
+    @override_settings(DEBUG=False)
+    def test_metrics_require_token_outside_debug(self):
+        """Test that metrics are not served without a token in production."""
+        res = self.client.get(METRICS_URL)
+        self.assertEqual(res.status_code, 404)
+
+    @override_settings(METRICS={'ENABLED': False})
+    def test_metrics_disabled(self):
+        """Test that the endpoint does not exist unless enabled."""
+        res = self.client.get(METRICS_URL)
+        self.assertEqual(res.status_code, 404)
+
+    @override_settings(METRICS={'ENABLED': True, 'TOKEN': 'secret'})
+    def test_metrics_token(self):
+        """Test that a configured token is required as bearer token."""
+        res = self.client.get(METRICS_URL)
+        self.assertEqual(res.status_code, 403)
+
+        res = self.client.get(
+            METRICS_URL, headers={'Authorization': 'Bearer secret'})
+        self.assertEqual(res.status_code, 200)
+
+
+class MetricsTests(TestCase):
+    @override_settings(MIDDLEWARE=[
+        'core.metrics.MetricsMiddleware', *settings.MIDDLEWARE])
+    def test_requests_are_observed_by_route(self):
+        """Test that latency and query counts are recorded per route."""
+        user = User.objects.create_user(username='testuser@example.com')
+        self.client.force_login(user)
+        labels = {'route': 'api:boards', 'method': 'GET', 'status': '200'}
+        requests = sample(
+            'kanban_http_request_duration_seconds_count', **labels)
+        queries = sample(
+            'kanban_http_request_db_queries_sum', route='api:boards')
+
+        self.client.get(reverse('api:boards'))
+
+        self.assertEqual(
+            sample('kanban_http_request_duration_seconds_count', **labels),
+            requests + 1,
+        )
+        self.assertGreater(
+            sample('kanban_http_request_db_queries_sum', route='api:boards'),
+            queries,
+        )
+
+    def test_async_request_queries_are_observed(self):
+        """
+        Test that the queries async views run in `sync_to_async` threads
+        are recorded.
+        """
+        def query():
+            try:
+                with connection.cursor() as cursor:
+                    cursor.execute('SELECT 1')
+            finally:
+                connection.close()
+
+        async def view(request):
+            await sync_to_async(query, thread_sensitive=False)()
+            return HttpResponse()
+
+        queries = sample(
+            'kanban_http_request_db_queries_sum', route='unresolved')
+        asyncio.run(MetricsMiddleware(view)(RequestFactory().get('/')))
+        self.assertEqual(
+            sample('kanban_http_request_db_queries_sum', route='unresolved'),
+            queries + 1,
+        )
+
+    def test_guest_creations_are_counted(self):
+        """Test that persisted guests are counted once committed."""
+        created = sample('kanban_guest_users_created_total')
+        with self.captureOnCommitCallbacks(execute=True):
+            create_guest_user()
+        self.assertEqual(
+            sample('kanban_guest_users_created_total'), created + 1)
+
+    def test_cleaned_up_guests_are_counted(self):
+        """Test that users deleted by cleanup_guests are counted."""
+        create_guest_user()
+        User.objects.filter(is_guest=True).update(
+            last_login=timezone.now() - timedelta(days=30))
+        deleted = sample('kanban_guest_users_deleted_total', reason='stale')
+
+        call_command('cleanup_guests', stdout=StringIO())
+
+        self.assertEqual(
+            sample('kanban_guest_users_deleted_total', reason='stale'),
+            deleted + 1,
+        )
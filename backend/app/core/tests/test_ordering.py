@@ -0,0 +1,131 @@
+from io import StringIO
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+
+from board.models import Board, Column
+from card.models import Card
+from core.ordering import ORDER_GAP, crowded_groups, rebalance
+
+User = get_user_model()
+
+
+class GapOrderingTests(TestCase):
+    def setUp(self):
+        user = User.objects.create_user(username='testuser@example.com')
+        self.board = Board.objects.create(user=user, title='Test Board')
+        self.column = Column.objects.create(board=self.board, title='To Do')
+        self.cards = [
+            Card.objects.create(title=f'Card {i}', column=self.column)
+            for i in range(5)
+        ]
+
+    def _titles(self, column=None):
+        column = column or self.column
+        return list(column.cards.values_list('title', flat=True))
+
+    def test_new_rows_are_spaced(self):
+        """Test that new rows are created ORDER_GAP apart."""
+        self.assertEqual(
+            [card.order for card in self.cards],
+            [ORDER_GAP * i for i in range(1, 6)]
+        )
+
+    def test_place_above_writes_single_row(self):
+        """Test that placing a card above another leaves siblings intact."""
+        last, first = self.cards[-1], self.cards[0]
+        others = {c.id: c.order for c in self.cards[:-1]}
+        last.place_above(first)
+        self.assertEqual(
+            self._titles(),
+            ['Card 4', 'Card 0', 'Card 1', 'Card 2', 'Card 3']
+        )
+        for card in Card.objects.filter(id__in=others):
+            self.assertEqual(card.order, others[card.id])
+
+    def test_place_above_query_count_is_constant(self):
+        """Test that the cost of a move does not depend on column size."""
+        for i in range(5, 50):
+            Card.objects.create(title=f'Card {i}', column=self.column)
+        last = Card.objects.get(title='Card 49')
+        with self.assertNumQueries(3):
+            last.place_above(self.cards[0])
+
+    def test_rebalance_query_count_is_constant(self):
+        """Test that respacing a column does not query once per card."""
+        for i in range(5, 50):
+            Card.objects.create(title=f'Card {i}', column=self.column)
+        with self.assertNumQueries(2):
+            rebalance(Card.objects.filter(column=self.column))
+
+    def test_place_above_rebalances_when_out_of_room(self):
+        """Test that a crowded column is respaced before placing a card."""
+        for order, card in enumerate(self.cards):
+            Card.objects.filter(id=card.id).update(order=order)
+            card.order = order
+        self.cards[4].place_above(self.cards[1])
+        self.assertEqual(
+            self._titles(),
+            ['Card 0', 'Card 4', 'Card 1', 'Card 2', 'Card 3']
+        )
+        orders = list(self.column.cards.values_list('order', flat=True))
+        self.assertEqual(len(set(orders)), len(orders))
+
+    def test_place_above_in_another_group(self):
+        """Test placing a card above a card of another column."""
+        done = Column.objects.create(board=self.board, title='Done')
+        target = Card.objects.create(title='Done 0', column=done)
+        self.cards[2].place_above(target)
+        self.assertEqual(self._titles(done), ['Card 2', 'Done 0'])
+        self.assertEqual(
+            self._titles(), ['Card 0', 'Card 1', 'Card 3', 'Card 4'])
+
+    def test_place_bottom(self):
+        """Test moving a card to the bottom of its column."""
+        self.cards[0].place_bottom()
+        self.assertEqual(
+            self._titles(),
+            ['Card 1', 'Card 2', 'Card 3', 'Card 4', 'Card 0']
+        )
+
+    def test_delete_keeps_sibling_orders(self):
+        """Test that deleting a row does not renumber its siblings."""
+        orders = {c.id: c.order for c in self.cards[1:]}
+        with self.assertNumQueries(2):
+            self.cards[0].delete()
+        for card in self.column.cards.all():
+            self.assertEqual(card.order, orders[card.id])
+
+    def test_changing_group_appends_without_renumbering(self):
+        """Test that moving a card to another column appends it there."""
+        done = Column.objects.create(board=self.board, title='Done')
+        Card.objects.create(title='Done 0', column=done)
+        orders = {c.id: c.order for c in self.cards[1:]}
+        card = self.cards[0]
+        card.column = done
+        card.save()
+        self.assertEqual(self._titles(done), ['Done 0', 'Card 0'])
+        for sibling in self.column.cards.all():
+            self.assertEqual(sibling.order, orders[sibling.id])
+
+    def test_crowded_groups(self):
+        """Test finding the columns whose card orders ran out of room."""
+        done = Column.objects.create(board=self.board, title='Done')
+        Card.objects.create(title='Done 0', column=done)
+        self.assertEqual(crowded_groups(Card, 2), set())
+        Card.objects.filter(id=self.cards[1].id).update(
+            order=self.cards[0].order + 1)
+        self.assertEqual(crowded_groups(Card, 2), {self.column.id})
+
+    def test_rebalance_orders_command(self):
+        """Test that the command respaces crowded columns."""
+        for order, card in enumerate(self.cards):
+            Card.objects.filter(id=card.id).update(order=order)
+        out = StringIO()
+        call_command('rebalance_orders', stdout=out)
+        self.assertIn('Rebalanced 1 cards', out.getvalue())
+        self.assertEqual(
+            list(self.column.cards.values_list('order', flat=True)),
+            [ORDER_GAP * i for i in range(1, 6)]
+        )
+        self.assertEqual(crowded_groups(Card, 16), set())
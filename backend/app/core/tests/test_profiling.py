@@ -0,0 +1,110 @@
+import cProfile
+import os
+import pstats
+import tempfile
+from io import StringIO
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from board.models import Board
+from core.profiling import _profiler_lock, make_profile_token
+
+User = get_user_model()
+
+
+class ProfilerMiddlewareTests(TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        settings_override = override_settings(
+            PROFILER={'ENABLED': True, 'DIRECTORY': self.directory},
+            MIDDLEWARE=[
+                *settings.MIDDLEWARE, 'core.profiling.ProfilerMiddleware'],
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.user = User.objects.create_user(username='testuser@example.com')
+        self.board = Board.objects.create(user=self.user, title='Board')
+        self.url = reverse('api:board-detail', args=[self.board.id])
+
+    def test_staff_user_can_profile_a_request(self):
+        """Test that a staff request with the header writes its stats."""
+        self.user.is_staff = True
+        self.user.save()
+        self.client.force_login(self.user)
+
+        res = self.client.get(self.url, headers={'X-Profile': '1'})
+
+        self.assertEqual(res.status_code, 200)
+        filename = res['X-Profile-File']
+        self.assertIn('api.board-detail', filename)
+        stats = pstats.Stats(os.path.join(self.directory, filename))
+        self.assertTrue(stats.total_calls)
+
+    def test_profile_token_allows_profiling(self):
+        """Test that a token from the command enables profiling."""
+        out = StringIO()
+        call_command('profile_token', stdout=out)
+        self.client.force_login(self.user)
+
+        res = self.client.get(
+            self.url, headers={'X-Profile': out.getvalue().strip()})
+
+        self.assertIn('X-Profile-File', res)
+        self.assertEqual(os.listdir(self.directory), [res['X-Profile-File']])
+
+    def test_request_without_permission_is_not_profiled(self):
+        """Test that the header alone does not enable profiling."""
+        self.client.force_login(self.user)
+
+        res = self.client.get(self.url, headers={'X-Profile': 'forged'})
+
+        self.assertEqual(res.status_code, 200)
+        self.assertNotIn('X-Profile-File', res)
+        self.assertEqual(os.listdir(self.directory), [])
+
+    def test_request_is_served_unprofiled_under_another_profiler(self):
+        """Test that a request is not profiled if a profiler is active."""
+        self.client.force_login(self.user)
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            with self.assertLogs('core.profiling', 'WARNING'):
+                res = self.client.get(
+                    self.url, headers={'X-Profile': make_profile_token()})
+        finally:
+            profiler.disable()
+
+        self.assertEqual(res.status_code, 200)
+        self.assertNotIn('X-Profile-File', res)
+        self.assertEqual(os.listdir(self.directory), [])
+
+    def test_concurrent_request_is_served_unprofiled(self):
+        """Test that a request is not profiled while another one is."""
+        self.client.force_login(self.user)
+        with _profiler_lock, self.assertLogs('core.profiling', 'WARNING'):
+            res = self.client.get(
+                self.url, headers={'X-Profile': make_profile_token()})
+
+        self.assertEqual(res.status_code, 200)
+        self.assertNotIn('X-Profile-File', res)
+        res = self.client.get(
+            self.url, headers={'X-Profile': make_profile_token()})
+        self.assertIn('X-Profile-File', res)
+        self.assertFalse(_profiler_lock.locked())
+
+    async def test_async_request_can_be_profiled(self):
+        """Test that async API requests are profiled too."""
+        await self.async_client.aforce_login(self.user)
+        res = await self.async_client.get(
+            reverse('async-api:board-detail', args=[self.board.id]),
+            headers={'X-Profile': make_profile_token()})
+
+        self.assertEqual(res.status_code, 200)
+        self.assertIn('async-api.board-detail', res['X-Profile-File'])
@@ -0,0 +1,76 @@
+import asyncio
+import re
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import reverse
+
+from board.models import Board, Column
+from core.timing import ServerTimingMiddleware
+
+User = get_user_model()
+
+SERVER_TIMING_RE = re.compile(
+    r'db;desc="(\d+) queries";dur=[\d.]+, '
+    r'serialize;dur=[\d.]+, total;dur=[\d.]+'
+)
+
+
+@override_settings(MIDDLEWARE=[
+    'core.timing.ServerTimingMiddleware', *settings.MIDDLEWARE])
+class ServerTimingMiddlewareTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='testuser@example.com')
+        self.board = Board.objects.create(user=self.user, title='Board')
+        Column.objects.create(board=self.board, title='To Do')
+        self.client.force_login(self.user)
+
+    def test_response_carries_server_timing(self):
+        """Test that the query count and timings are sent in a header."""
+        res = self.client.get(
+            reverse('api:board-detail', args=[self.board.id]))
+        self.assertEqual(res.status_code, 200)
+        match = SERVER_TIMING_RE.fullmatch(res['Server-Timing'])
+        self.assertIsNotNone(match)
+        self.assertGreater(int(match.group(1)), 0)
+
+    def test_timings_are_logged_by_route(self):
+        """Test that a log line is keyed by the namespaced url name."""
+        with self.assertLogs('core.timing', 'INFO') as logs:
+            self.client.get(reverse('api:boards'))
+        self.assertEqual(logs.records[0].route, 'api:boards')
+        self.assertIn('route=api:boards method=GET status=200',
+                      logs.output[0])
+
+    async def test_async_requests_are_timed(self):
+        """Test that queries of async handlers are counted."""
+        await self.async_client.aforce_login(self.user)
+        res = await self.async_client.get(reverse('async-api:boards'))
+        match = SERVER_TIMING_RE.fullmatch(res['Server-Timing'])
+        self.assertIsNotNone(match)
+        self.assertGreater(int(match.group(1)), 0)
+
+    def test_queries_in_worker_threads_are_timed(self):
+        """
+        Test that the queries async views run in `sync_to_async` threads,
+        on the connections of those threads, are counted.
+        """
+        def query():
+            try:
+                with connection.cursor() as cursor:
+                    cursor.execute('SELECT 1')
+            finally:
+                connection.close()
+
+        async def view(request):
+            await sync_to_async(query, thread_sensitive=False)()
+            return HttpResponse()
+
+        middleware = ServerTimingMiddleware(view)
+        res = asyncio.run(middleware(RequestFactory().get('/')))
+        match = SERVER_TIMING_RE.fullmatch(res['Server-Timing'])
+        self.assertEqual(match.group(1), '1')
@@ -0,0 +1,178 @@
+import contextvars
+import functools
+import logging
+import time
+from contextlib import contextmanager
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.db import connections
+from ninja.operation import Operation
+
+logger = logging.getLogger(__name__)
+
+_current = contextvars.ContextVar('request_timing', default=None)
+# Timings recording the queries of the current context. Context variables
+# follow async views into their `sync_to_async` threads, unlike connections.
+_recorders = contextvars.ContextVar('query_recorders', default=())
+
+
+class RequestTiming:
+    """
+    Query count, database time and serialization time of one request.
+
+    Queries are recorded while the timing is installed by
+    `instrument_connections`. Queries made while serializing, e.g. to load
+    a relation, count as database time only.
+    """
+
+    def __init__(self):
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.serialize_seconds = 0.0
+
+
+def _record_queries(execute, sql, params, many, context):
+    recorders = _recorders.get()
+    if not recorders:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        elapsed = time.perf_counter() - started
+        for timing in recorders:
+            timing.db_seconds += elapsed
+            timing.queries += 1
+
+
+def install_query_recorder(connection, **kwargs):
+    """
+    Install the query recorder on `connection`.
+
+    Connected to `connection_created` when the app is ready: connections
+    are per thread, so every connection gets it wherever the queries of a
+    request end up running.
+    """
+    if _record_queries not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_record_queries)
+
+
+@contextmanager
+def instrument_connections(timing):
+    """Record the queries of the current context, in any thread."""
+    for connection in connections.all(initialized_only=True):
+        install_query_recorder(connection)
+    token = _recorders.set((*_recorders.get(), timing))
+    try:
+        yield timing
+    finally:
+        _recorders.reset(token)
+
+
+@contextmanager
+def serialization_timer():
+    """
+    Count the time spent in the block as serialization of the current
+    request, less the time of the queries it makes.
+    """
+    timing = _current.get()
+    if timing is None:
+        yield
+        return
+    started = time.perf_counter()
+    db_seconds = timing.db_seconds
+    try:
+        yield
+    finally:
+        timing.serialize_seconds += (
+            time.perf_counter() - started
+            - (timing.db_seconds - db_seconds))
+
+
+def _timed_result_to_response(result_to_response):
+    @functools.wraps(result_to_response)
+    def wrapper(self, request, result, temporal_response):
+        with serialization_timer():
+            return result_to_response(
+                self, request, result, temporal_response)
+    wrapper.timed = True
+    return wrapper
+
+
+def _install_serialization_timer():
+    # Operation._result_to_response validates and renders the result of
+    # every ninja operation, sync or async.
+    if not getattr(Operation._result_to_response, 'timed', False):
+        Operation._result_to_response = _timed_result_to_response(
+            Operation._result_to_response)
+
+
+class ServerTimingMiddleware:
+    """
+    Report the database and serialization cost of each request.
+
+    Adds a `Server-Timing` header with the query count, database time,
+    serialization time and total time, and logs the same figures keyed by
+    the namespaced url name of the view, e.g. `api:board-detail`.
+    Enabled with the `SERVER_TIMING` setting.
+    """
+    async_capable = True
+    sync_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+        _install_serialization_timer()
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        timing, token, started = self._start()
+        try:
+            with instrument_connections(timing):
+                response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self._finish(request, response, timing, started)
+
+    async def __acall__(self, request):
+        timing, token, started = self._start()
+        try:
+            with instrument_connections(timing):
+                response = await self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self._finish(request, response, timing, started)
+
+    def _start(self):
+        timing = RequestTiming()
+        return timing, _current.set(timing), time.perf_counter()
+
+    def _finish(self, request, response, timing, started):
+        total_ms = (time.perf_counter() - started) * 1000
+        db_ms = timing.db_seconds * 1000
+        serialize_ms = timing.serialize_seconds * 1000
+        response['Server-Timing'] = ', '.join([
+            f'db;desc="{timing.queries} queries";dur={db_ms:.2f}',
+            f'serialize;dur={serialize_ms:.2f}',
+            f'total;dur={total_ms:.2f}',
+        ])
+        match = request.resolver_match
+        route = match.view_name if match else None
+        logger.info(
+            'request_timing route=%s method=%s status=%s queries=%d '
+            'db_ms=%.2f serialize_ms=%.2f total_ms=%.2f',
+            route, request.method, response.status_code, timing.queries,
+            db_ms, serialize_ms, total_ms,
+            extra={
+                'route': route,
+                'method': request.method,
+                'status': response.status_code,
+                'queries': timing.queries,
+                'db_ms': db_ms,
+                'serialize_ms': serialize_ms,
+                'total_ms': total_ms,
+            },
+        )
+        return response
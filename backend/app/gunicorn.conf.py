@@ -0,0 +1,63 @@
+"""
+Gunicorn configuration, read from the environment.
+
+Set SERVER_INTERFACE=asgi to serve `app.asgi` with uvicorn workers, which
+is needed by the board event streams; `app.wsgi` is served with threaded
+workers otherwise. The settings read the same variable to close database
+connections after each request under ASGI.
+"""
+
+import multiprocessing
+import os
+
+
+def _int(name, default):
+    return int(os.environ.get(name, default))
+
+
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:8000')
+
+if os.environ.get('SERVER_INTERFACE', 'wsgi') == 'asgi':
+    wsgi_app = 'app.asgi:application'
+    worker_class = 'uvicorn_worker.UvicornWorker'
+else:
+    wsgi_app = 'app.wsgi:application'
+    worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'gthread')
+
+workers = _int('GUNICORN_WORKERS', multiprocessing.cpu_count() * 2 + 1)
+# Threads per worker for gthread workers. With DB_POOL=1 keep
+# DB_POOL_MAX_SIZE at least this high, as each thread holds a connection
+# for the length of its request.
+threads = _int('GUNICORN_THREADS', 4)
+
+# Restart workers after a number of requests, with jitter so they do not
+# all restart at once.
+max_requests = _int('GUNICORN_MAX_REQUESTS', 1000)
+max_requests_jitter = _int('GUNICORN_MAX_REQUESTS_JITTER', 100)
+
+timeout = _int('GUNICORN_TIMEOUT', 30)
+graceful_timeout = _int('GUNICORN_GRACEFUL_TIMEOUT', 30)
+keepalive = _int('GUNICORN_KEEPALIVE', 5)
+
+# Load the application before forking so workers share its memory.
+preload_app = bool(_int('GUNICORN_PRELOAD', 1))
+
+accesslog = os.environ.get('GUNICORN_ACCESS_LOG', '-')
+errorlog = '-'
+
+
+# With PROMETHEUS_MULTIPROC_DIR set, every worker writes its metrics there;
+# start from an empty directory and drop the live gauges of exited workers.
+def on_starting(server):
+    directory = os.environ.get('PROMETHEUS_MULTIPROC_DIR')
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+        for name in os.listdir(directory):
+            if name.endswith('.db'):
+                os.remove(os.path.join(directory, name))
+
+
+def child_exit(server, worker):
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        from prometheus_client import multiprocess
+        multiprocess.mark_process_dead(worker.pid)
@@ -1,18 +1,41 @@
+import uuid
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import IntegrityError
 from django.http import HttpRequest
 from ninja.security import django_auth
 from ninja.security.apikey import APIKeyCookie
 from django.contrib.auth import get_user_model
-from user.services import create_guest_user
+from user.cache import get_guest_user_cache
+from user.services import build_virtual_guest, create_guest_user
 
 User = get_user_model()
 
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+VIRTUAL_GUEST_COOKIE = 'guest_id'
+VIRTUAL_GUEST_SALT = 'user.auth.virtual-guest'
+
+
+def get_virtual_guest_id(request: HttpRequest):
+    """Return the virtual guest id of the request's signed cookie, if any."""
+    return request.get_signed_cookie(
+        VIRTUAL_GUEST_COOKIE, default=None, salt=VIRTUAL_GUEST_SALT,
+        max_age=settings.SESSION_COOKIE_AGE)
+
 
 class AuthHandler(APIKeyCookie):
     """
     Handles authentication for both registered users and guest users.
 
     Provides a fallback authentication system that creates a guest user for
-    unauthenticated requests.
+    unauthenticated requests. Resolved guests are cached by the guest user id
+    stored in the session, so repeat requests skip the user table.
+
+    With `LAZY_GUEST_USERS` enabled, read-only requests get an unsaved
+    virtual guest instead, and the guest is only persisted on its first
+    write. The virtual guest id is kept in a signed cookie, set by
+    `VirtualGuestCookieMiddleware`, so read-only visitors do not create a
+    session row.
     """
     def authenticate(self, request: HttpRequest, key: str | None = None):
         user = django_auth(request)
@@ -20,16 +43,73 @@ class AuthHandler(APIKeyCookie):
             return user
         return self._resolve_or_create_guest(request)
 
-    def _resolve_or_create_guest(self, request):
+    def get_existing_user(self, request: HttpRequest):
+        """
+        Return the user or guest of the request's session or virtual guest
+        cookie without creating a guest, or None if there is none.
+        """
+        user = django_auth(request)
+        if user:
+            return user
         guest_user_id = request.session.get('guest_user_id')
+        if guest_user_id:
+            return self._get_guest(guest_user_id)
+        virtual_guest_id = get_virtual_guest_id(request)
+        if virtual_guest_id:
+            return build_virtual_guest(virtual_guest_id)
+        return None
+
+    def _get_guest(self, guest_user_id):
+        cache = get_guest_user_cache()
+        user = cache.get(str(guest_user_id))
+        if user is not None:
+            return user
+        try:
+            user = User.objects.get(id=guest_user_id, is_guest=True)
+        except User.DoesNotExist:
+            return None
+        cache.set(str(guest_user_id), user)
+        return user
 
+    def _resolve_or_create_guest(self, request):
+        cache = get_guest_user_cache()
+        guest_user_id = request.session.get('guest_user_id')
         if guest_user_id:
-            try:
-                user = User.objects.get(id=guest_user_id, is_guest=True)
+            user = self._get_guest(guest_user_id)
+            if user is not None:
                 return user
-            except User.DoesNotExist:
-                pass
 
-        guest_user = create_guest_user()
+        virtual_guest_id = get_virtual_guest_id(request)
+        if settings.LAZY_GUEST_USERS and request.method in SAFE_METHODS:
+            if not virtual_guest_id:
+                virtual_guest_id = str(uuid.uuid4())
+                request.virtual_guest_id = virtual_guest_id
+            return build_virtual_guest(virtual_guest_id)
+
+        guest_user = self._create_guest(virtual_guest_id)
         request.session['guest_user_id'] = str(guest_user.id)
+        if virtual_guest_id:
+            # The session identifies the guest from now on.
+            request.virtual_guest_id = None
+        cache.set(str(guest_user.id), guest_user)
         return guest_user
+
+    def _create_guest(self, guest_user_id):
+        if guest_user_id is None:
+            return create_guest_user()
+        try:
+            return create_guest_user(guest_user_id)
+        except IntegrityError:
+            # A concurrent request materialized the same virtual guest.
+            return User.objects.get(id=guest_user_id, is_guest=True)
+
+
+class AsyncAuthHandler(AuthHandler):
+    """
+    `AuthHandler` for async operations.
+
+    The session user and guest are resolved in one worker thread hop, since
+    the social auth backends have no async `aget_user`.
+    """
+    async def authenticate(self, request: HttpRequest, key: str | None = None):
+        return await sync_to_async(super().authenticate)(request, key)
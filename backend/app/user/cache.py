@@ -0,0 +1,102 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.signals import setting_changed
+from django.utils.module_loading import import_string
+
+
+class LocalUserCache:
+    """
+    Per-process LRU cache of resolved users with a time-to-live.
+
+    Entries are evicted once `MAX_ENTRIES` is exceeded or `TIMEOUT` seconds
+    after they were stored. Invalidation only reaches the current process, so
+    deletes made elsewhere stay visible for at most `TIMEOUT` seconds.
+    """
+
+    def __init__(self, options):
+        self.timeout = options.get('TIMEOUT', 300)
+        self.max_entries = options.get('MAX_ENTRIES', 10000)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, user = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return copy.copy(user)
+
+    def set(self, key, user):
+        with self._lock:
+            self._entries[key] = (
+                time.monotonic() + self.timeout, copy.copy(user))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete_many(self, keys):
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+
+class DjangoUserCache:
+    """
+    Cache of resolved users stored in a Django cache backend.
+
+    Shared between processes when `CACHE_ALIAS` points to a shared backend
+    such as Redis, so invalidations reach every worker.
+    """
+
+    key_prefix = 'guest-user:'
+
+    def __init__(self, options):
+        self.timeout = options.get('TIMEOUT', 300)
+        self.cache = caches[options.get('CACHE_ALIAS', 'default')]
+
+    def get(self, key):
+        return self.cache.get(self.key_prefix + key)
+
+    def set(self, key, user):
+        self.cache.set(self.key_prefix + key, user, self.timeout)
+
+    def delete_many(self, keys):
+        self.cache.delete_many([self.key_prefix + key for key in keys])
+
+
+_guest_user_cache = None
+
+
+def get_guest_user_cache():
+    """Return the cache configured by the `GUEST_USER_CACHE` setting."""
+    global _guest_user_cache
+    if _guest_user_cache is None:
+        options = getattr(settings, 'GUEST_USER_CACHE', {})
+        backend = import_string(
+            options.get('BACKEND', 'user.cache.LocalUserCache'))
+        _guest_user_cache = backend(options)
+    return _guest_user_cache
+
+
+def invalidate_guest_users(user_ids):
+    """Drop the cached entries of the given guest user ids."""
+    get_guest_user_cache().delete_many([str(user_id) for user_id in user_ids])
+
+
+def _reset_guest_user_cache(*, setting, **kwargs):
+    global _guest_user_cache
+    if setting == 'GUEST_USER_CACHE':
+        _guest_user_cache = None
+
+
+setting_changed.connect(_reset_guest_user_cache)
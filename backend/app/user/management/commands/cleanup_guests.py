@@ -1,13 +1,18 @@
+import time
 from datetime import timedelta
+from importlib import import_module
+from django.conf import settings
 from django.utils import timezone
 from django.core.management.base import BaseCommand
 
+from core.metrics import GUEST_USERS_DELETED
 from user.services.cleanup_stale_guests import cleanup_stale_guests
 from user.services.cleanup_unused_guests import cleanup_unused_guests
 
 
 class Command(BaseCommand):
-    help = "Cleanup stale guest users and unused new accounts"
+    help = ("Cleanup stale guest users, unused new accounts and expired "
+            "sessions")
 
     def add_arguments(self, parser):
         parser.add_argument(
@@ -30,15 +35,47 @@ class Command(BaseCommand):
             help="Show what would be deleted without making changes",
         )
 
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Delete at most this many users per transaction",
+        )
+
+        parser.add_argument(
+            "--max-runtime",
+            type=float,
+            default=None,
+            help="Stop starting new batches after this many seconds",
+        )
+
+        parser.add_argument(
+            "--sleep-between",
+            type=float,
+            default=0,
+            help="Pause this many seconds between batches",
+        )
+
     def handle(self, *args, **options):
         dry_run = options["dry_run"]
         inactive_cutoff = timezone.now() - timedelta(
             days=options["inactive_days"]
         )
 
+        deadline = None
+        if options["max_runtime"] is not None:
+            deadline = time.monotonic() + options["max_runtime"]
+        batch_options = {
+            "batch_size": options["batch_size"],
+            "deadline": deadline,
+            "sleep_between": options["sleep_between"],
+        }
+
         deleted_stale = cleanup_stale_guests(
             cutoff=inactive_cutoff,
             dry_run=dry_run,
+            on_batch=self._progress("stale guests"),
+            **batch_options,
         )
 
         deleted_unused_new = cleanup_unused_guests(
@@ -46,8 +83,14 @@ class Command(BaseCommand):
                 hours=options["grace_period_new_accounts"]
             ),
             dry_run=dry_run,
+            on_batch=self._progress("unused new accounts"),
+            **batch_options,
         )
 
+        if not dry_run:
+            GUEST_USERS_DELETED.labels("stale").inc(deleted_stale)
+            GUEST_USERS_DELETED.labels("unused").inc(deleted_unused_new)
+
         log = (f"Deleted {deleted_stale} stale guests and "
                f"{deleted_unused_new} unused new accounts")
         if dry_run:
@@ -59,3 +102,18 @@ class Command(BaseCommand):
             self.stdout.write(self.style.SUCCESS(
                 f"{log}"
             ))
+        if not dry_run:
+            engine = import_module(settings.SESSION_ENGINE)
+            engine.SessionStore.clear_expired()
+            self.stdout.write("Cleared expired sessions")
+        if deadline is not None and time.monotonic() >= deadline:
+            self.stdout.write(self.style.WARNING(
+                "Max runtime reached, run again to resume"
+            ))
+
+    def _progress(self, label):
+        def on_batch(batch_count, total_count):
+            self.stdout.write(
+                f"Deleted {batch_count} {label} ({total_count} so far)")
+            self.stdout.flush()
+        return on_batch
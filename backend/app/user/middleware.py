@@ -0,0 +1,51 @@
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+from user.auth import VIRTUAL_GUEST_COOKIE, VIRTUAL_GUEST_SALT
+
+
+class VirtualGuestCookieMiddleware:
+    """
+    Store the id of a new virtual guest in a signed cookie, and delete the
+    cookie once the guest is persisted.
+
+    `AuthHandler` marks the request with `virtual_guest_id`; requests
+    without the mark pass through untouched.
+    """
+    async_capable = True
+    sync_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return self._store(request, self.get_response(request))
+
+    async def __acall__(self, request):
+        return self._store(request, await self.get_response(request))
+
+    def _store(self, request, response):
+        if not hasattr(request, 'virtual_guest_id'):
+            return response
+        if request.virtual_guest_id is None:
+            response.delete_cookie(
+                VIRTUAL_GUEST_COOKIE,
+                domain=settings.SESSION_COOKIE_DOMAIN,
+                samesite=settings.SESSION_COOKIE_SAMESITE,
+            )
+        else:
+            response.set_signed_cookie(
+                VIRTUAL_GUEST_COOKIE,
+                request.virtual_guest_id,
+                salt=VIRTUAL_GUEST_SALT,
+                max_age=settings.SESSION_COOKIE_AGE,
+                domain=settings.SESSION_COOKIE_DOMAIN,
+                secure=settings.SESSION_COOKIE_SECURE,
+                httponly=True,
+                samesite=settings.SESSION_COOKIE_SAMESITE,
+            )
+        return response
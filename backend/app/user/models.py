@@ -11,6 +11,9 @@ class User(AbstractUser):
     avatar_url = models.URLField(blank=True, null=True, max_length=500)
     is_guest = models.BooleanField(default=False)
 
+    # Set on unsaved guests served to read-only requests in lazy guest mode.
+    is_virtual = False
+
     class Meta:
         indexes = [
             models.Index(fields=['is_guest', 'date_joined']),
@@ -1,4 +1,8 @@
 from django.contrib.auth import get_user_model
+from django.db import transaction
+
+from core.deletion import raw_delete
+from .cache import invalidate_guest_users
 from .services import create_default_board, merge_guest_user
 
 User = get_user_model()
@@ -30,13 +34,21 @@ def handle_guest_user(strategy, backend, user=None, *args, **kwargs):
     if action == "merge":
         merge_guest_user(guest_user, user)
     elif action == "discard":
-        guest_user.delete()
+        # Boards, columns and cards are removed by database cascades.
+        with transaction.atomic():
+            raw_delete(User.objects.filter(pk=guest_user.pk))
+    else:
+        return
+    invalidate_guest_users([guest_user_id])
 
 
 def create_default_board_pipeline(
         strategy, user=None, is_new=False, *args, **kwargs):
-    action = strategy.request.session.get("guest_migration_action")
-    if is_new and action != "merge":
+    session = strategy.request.session
+    action = session.get("guest_migration_action")
+    # A virtual guest is not in the session and has no boards to merge.
+    merged = action == "merge" and bool(session.get("guest_user_id"))
+    if is_new and not merged:
         create_default_board(user)
 
 
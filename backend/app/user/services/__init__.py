@@ -1,15 +1,19 @@
 from .create_user_with_board import create_user_with_board
-from .create_guest_user import create_guest_user
-from .create_default_board import create_default_board
+from .create_guest_user import build_virtual_guest, create_guest_user
+from .create_default_board import build_default_board, create_default_board
 from .merge_guest_user import merge_guest_user
 from .cleanup_stale_guests import cleanup_stale_guests
 from .cleanup_unused_guests import cleanup_unused_guests
+from .delete_users_in_batches import delete_users_in_batches
 
 __all__ = [
     'create_user_with_board',
+    'build_virtual_guest',
     'create_guest_user',
+    'build_default_board',
     'create_default_board',
     'merge_guest_user',
     'cleanup_stale_guests',
     'cleanup_unused_guests',
+    'delete_users_in_batches',
 ]
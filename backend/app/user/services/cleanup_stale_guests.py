@@ -1,18 +1,23 @@
 from django.contrib.auth import get_user_model
 
+from .delete_users_in_batches import delete_users_in_batches
+
 User = get_user_model()
 
 
-def cleanup_stale_guests(cutoff, dry_run: bool = False) -> int:
-    """Delete guest users inactive since `cutoff`."""
+def cleanup_stale_guests(
+        cutoff, dry_run: bool = False, **batch_options) -> int:
+    """
+    Delete guest users inactive since `cutoff`.
+
+    Deletion runs in batches; `batch_options` are passed to
+    `delete_users_in_batches`.
+    """
     qs = User.objects.filter(
         is_guest=True,
         last_login__lt=cutoff,
     )
-    count = qs.count()
-    if dry_run or count == 0:
-        return count
-
-    qs.delete()
+    if dry_run:
+        return qs.count()
 
-    return count
+    return delete_users_in_batches(qs, **batch_options)
@@ -4,14 +4,20 @@ from django.db.models import Count, Exists, OuterRef
 from django.contrib.auth import get_user_model
 from card.models import Card
 
+from .delete_users_in_batches import delete_users_in_batches
+
 User = get_user_model()
 
 
 def cleanup_unused_guests(
-        grace_period: timedelta, dry_run: bool = False) -> int:
+        grace_period: timedelta, dry_run: bool = False,
+        **batch_options) -> int:
     """
     Delete guest users older than grace_period that have not meaningfully
     used their account.
+
+    Deletion runs in batches; `batch_options` are passed to
+    `delete_users_in_batches`.
     """
     cutoff = timezone.now() - grace_period
     base_query = User.objects.filter(
@@ -25,14 +31,12 @@ def cleanup_unused_guests(
     ).filter(board_count=1)
 
     has_cards = Exists(
-        Card.objects.filter(column__board=OuterRef('board'))
+        Card.objects.filter(board=OuterRef('board'))
     )
 
     users_to_delete = single_board_users.exclude(has_cards)
-    count = users_to_delete.count()
 
     if dry_run:
-        return count
+        return users_to_delete.count()
 
-    users_to_delete.delete()
-    return count
+    return delete_users_in_batches(users_to_delete, **batch_options)
@@ -1,15 +1,40 @@
+import uuid
 from django.contrib.auth import get_user_model
 from board.models import Board, Column
+from board.services import insert_board
 
 User = get_user_model()
 
+DEFAULT_BOARD_TITLE = "Kanban Board"
+DEFAULT_COLUMN_TITLES = ['To Do', 'In Progress', 'Done']
+
+
+def build_default_board(user):
+    """
+    Build the unsaved default Kanban board of the given user and its columns.
+
+    Ids are derived from the user id, so the board shown to a virtual guest
+    keeps its ids once the guest is materialized.
+    """
+    namespace = uuid.UUID(str(user.id))
+    board = Board(
+        id=uuid.uuid5(namespace, 'board'),
+        user=user,
+        title=DEFAULT_BOARD_TITLE,
+        is_default=True,
+    )
+    columns = [
+        Column(
+            id=uuid.uuid5(namespace, f'column:{position}'),
+            board=board,
+            title=column_title,
+        )
+        for position, column_title in enumerate(DEFAULT_COLUMN_TITLES)
+    ]
+    return board, columns
+
 
 def create_default_board(user):
     """ Create a default Kanban board for the given user. """
-    title = "Kanban Board"
-    column_titles = ['To Do', 'In Progress', 'Done']
-
-    board = Board.objects.create(user=user, title=title, is_default=True)
-    for column_title in column_titles:
-        Column.objects.create(board=board, title=column_title)
-    return board
+    board, columns = build_default_board(user)
+    return insert_board(board, columns)
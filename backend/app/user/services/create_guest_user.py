@@ -1,15 +1,61 @@
 import uuid
 from django.contrib.auth import get_user_model
+from django.db import transaction
 
+from core.metrics import GUEST_USERS_CREATED
+from .create_default_board import build_default_board
 from .create_user_with_board import create_user_with_board
 
 User = get_user_model()
 
 
-def create_guest_user():
-    """ Create a guest user with a default Kanban board. """
-    guest_username = f"user_{uuid.uuid4().hex[:10]}"
-    user = create_user_with_board(guest_username)
-    user.is_guest = True
-    user.save()
+def _guest_username(guest_user_id):
+    return f"user_{uuid.UUID(str(guest_user_id)).hex[:10]}"
+
+
+def create_guest_user(guest_user_id=None):
+    """
+    Create a guest user with a default Kanban board.
+
+    Passing the id of a virtual guest materializes it with the same user and
+    board ids it was shown.
+    """
+    guest_user_id = guest_user_id or uuid.uuid4()
+    with transaction.atomic():
+        user = create_user_with_board(
+            _guest_username(guest_user_id), id=guest_user_id, is_guest=True)
+        transaction.on_commit(GUEST_USERS_CREATED.inc)
     return user
+
+
+def build_virtual_guest(guest_user_id):
+    """
+    Build an unsaved guest user for read-only requests in lazy guest mode.
+
+    The guest carries its virtual default board in `default_board`; nothing
+    is persisted until `create_guest_user` materializes it.
+    """
+    user = User(
+        id=uuid.UUID(str(guest_user_id)),
+        username=_guest_username(guest_user_id),
+        is_guest=True,
+    )
+    user.is_virtual = True
+    board, columns = build_default_board(user)
+    board.created_at = board.updated_at = user.date_joined
+    board._prefetched_objects_cache = {
+        'columns': _prefetched(board.columns.all(), columns)
+    }
+    for column in columns:
+        column._prefetched_objects_cache = {
+            'cards': _prefetched(column.cards.all(), [])
+        }
+    user.default_board = board
+    return user
+
+
+def _prefetched(queryset, objs):
+    """Return `queryset` already evaluated to `objs`, as prefetching does."""
+    queryset._result_cache = objs
+    queryset._prefetch_done = True
+    return queryset
@@ -4,10 +4,9 @@ from .create_default_board import create_default_board
 User = get_user_model()
 
 
-def create_user_with_board(username: str):
+def create_user_with_board(username: str, **extra_fields):
     """ Create a new user and initialize a default Kanban board for them."""
-    user = User.objects.create_user(username=username)
-    user.set_unusable_password()
-    user.save()
+    # Without a password create_user already sets an unusable one.
+    user = User.objects.create_user(username=username, **extra_fields)
     create_default_board(user)
     return user
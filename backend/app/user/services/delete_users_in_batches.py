@@ -0,0 +1,41 @@
+import time
+from django.contrib.auth import get_user_model
+from django.db import transaction
+
+from core.deletion import raw_delete
+from user.cache import invalidate_guest_users
+
+User = get_user_model()
+
+
+def delete_users_in_batches(
+        queryset, batch_size: int = 1000, deadline: float | None = None,
+        sleep_between: float = 0, on_batch=None) -> int:
+    """
+    Delete the users matched by `queryset` in primary-key batches.
+
+    Each batch runs in its own short transaction using set-based cascaded
+    deletes, so locks stay bounded and an interrupted run resumes where it
+    stopped. Stops early once `time.monotonic()` passes `deadline`.
+    `on_batch(batch_count, total_count)` is called after every batch.
+    Returns the number of deleted users.
+    """
+    deleted = 0
+    last_pk = None
+    while deadline is None or time.monotonic() < deadline:
+        batch = queryset.order_by('pk')
+        if last_pk is not None:
+            batch = batch.filter(pk__gt=last_pk)
+        user_ids = list(batch.values_list('pk', flat=True)[:batch_size])
+        if not user_ids:
+            break
+        with transaction.atomic():
+            raw_delete(User.objects.filter(pk__in=user_ids))
+        invalidate_guest_users(user_ids)
+        deleted += len(user_ids)
+        last_pk = user_ids[-1]
+        if on_batch:
+            on_batch(len(user_ids), deleted)
+        if sleep_between:
+            time.sleep(sleep_between)
+    return deleted
@@ -1,13 +1,30 @@
 from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import F, Max, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
 from board.models import Board
+from card.models import Card
+from core.deletion import raw_delete
 
 User = get_user_model()
 
 
 def merge_guest_user(guest_user, registered_user):
-    """ Merge the data from a guest user into a registered user. """
-    guest_boards = Board.objects.filter(user=guest_user)
-    for board in guest_boards:
-        board.user = registered_user
-        board.save()
-    guest_user.delete()
+    """
+    Merge the data from a guest user into a registered user.
+
+    All guest boards are reassigned with a single UPDATE that also moves
+    their order past the registered user's last board, keeping their
+    relative order. A second UPDATE hands over the guest's cards.
+    """
+    last_order = Board.objects.filter(user=registered_user).values(
+        'user').annotate(last_order=Max('order')).values('last_order')
+    with transaction.atomic():
+        Board.objects.filter(user=guest_user).update(
+            user=registered_user,
+            order=F('order') + Coalesce(Subquery(last_order), Value(-1)) + 1,
+            updated_at=timezone.now(),
+        )
+        Card.objects.filter(owner=guest_user).update(owner=registered_user)
+        raw_delete(User.objects.filter(pk=guest_user.pk))
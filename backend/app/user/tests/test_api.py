@@ -1,12 +1,19 @@
-from django.test import Client, TestCase
+from django.conf import settings
+from django.test import Client, TestCase, override_settings
 from django.contrib.auth import get_user_model
+from django.contrib.sessions.models import Session
 from django.urls import reverse
 from social_django.models import UserSocialAuth
+from board.models import Board
+from user.auth import VIRTUAL_GUEST_COOKIE
 from user.pipeline import sync_user_details
 
 
 User = get_user_model()
 ME_URL = reverse('api:me')
+BOARDS_URL = reverse('api:boards')
+LATEST_BOARD_URL = reverse('api:latest-board')
+CARDS_URL = reverse('api:cards')
 LOGOUT_URL = reverse('api:logout')
 SET_GUEST_ACTION_URL = reverse('api:set_guest_action')
 
@@ -168,3 +175,83 @@ class SetGuestActionTests(TestCase):
         self.assertEqual(res.status_code, 204)
         self.assertEqual(
             self.client.session['guest_migration_action'], 'discard')
+
+
+@override_settings(LAZY_GUEST_USERS=True)
+class LazyGuestApiTests(TestCase):
+    """Test unauthenticated requests with lazy guest creation enabled."""
+
+    def setUp(self):
+        self.client = Client()
+
+    def test_read_requests_do_not_persist_guest(self):
+        """Test that read-only requests are served by a virtual guest."""
+        me = self.client.get(ME_URL)
+        boards = self.client.get(BOARDS_URL)
+        latest = self.client.get(LATEST_BOARD_URL)
+        board_id = latest.json()['id']
+        board = self.client.get(
+            reverse('api:board-detail', args=[board_id]))
+        snapshot = self.client.get(
+            reverse('api:board-snapshot', args=[board_id]))
+        cards = self.client.get(CARDS_URL)
+
+        self.assertEqual(me.status_code, 200)
+        self.assertTrue(me.json()['is_guest'])
+        self.assertEqual([b['id'] for b in boards.json()], [board_id])
+        self.assertEqual(board.status_code, 200)
+        self.assertEqual(
+            [c['title'] for c in board.json()['columns']],
+            ['To Do', 'In Progress', 'Done']
+        )
+        self.assertEqual(snapshot.status_code, 200)
+        self.assertEqual(cards.json(), [])
+        self.assertFalse(User.objects.exists())
+        self.assertFalse(Board.objects.exists())
+
+    def test_read_requests_do_not_create_session(self):
+        """Test that the virtual guest id is kept in a signed cookie."""
+        self.client.get(ME_URL)
+        self.client.get(BOARDS_URL)
+
+        self.assertNotIn(settings.SESSION_COOKIE_NAME, self.client.cookies)
+        self.assertFalse(Session.objects.exists())
+        self.assertIn(VIRTUAL_GUEST_COOKIE, self.client.cookies)
+
+    def test_tampered_virtual_guest_cookie_is_ignored(self):
+        """Test that an unsigned guest id does not pick the guest."""
+        guest = User.objects.create_user(username='guest', is_guest=True)
+        self.client.cookies[VIRTUAL_GUEST_COOKIE] = str(guest.id)
+
+        res = self.client.get(ME_URL)
+        self.assertNotEqual(res.json()['id'], str(guest.id))
+
+    def test_virtual_guest_is_stable_across_requests(self):
+        """Test that a session keeps the same virtual guest."""
+        first = self.client.get(ME_URL).json()
+        second = self.client.get(ME_URL).json()
+        self.assertEqual(first['id'], second['id'])
+
+    def test_first_write_materializes_virtual_guest(self):
+        """
+        Test that the first write persists the guest with the ids it was
+        shown.
+        """
+        guest_id = self.client.get(ME_URL).json()['id']
+        board = self.client.get(LATEST_BOARD_URL).json()
+        column_id = board['columns'][0]['id']
+
+        res = self.client.post(
+            CARDS_URL,
+            {'title': 'New Card', 'priority': 'low', 'column_id': column_id},
+            content_type='application/json'
+        )
+
+        self.assertEqual(res.status_code, 201)
+        guest = User.objects.get(id=guest_id)
+        self.assertTrue(guest.is_guest)
+        self.assertEqual(
+            str(Board.objects.get(user=guest).id), board['id'])
+        self.assertEqual(self.client.cookies[VIRTUAL_GUEST_COOKIE].value, '')
+        self.assertEqual(self.client.get(ME_URL).json()['id'], guest_id)
+        self.assertEqual(len(self.client.get(CARDS_URL).json()), 1)
@@ -5,6 +5,7 @@ from django.contrib.sessions.middleware import SessionMiddleware
 from unittest.mock import patch
 
 from user.auth import AuthHandler
+from user.cache import get_guest_user_cache
 from user.services import create_guest_user
 
 User = get_user_model()
@@ -82,6 +83,51 @@ class AuthHandlerTests(TestCase):
         self.assertTrue(result_user.is_guest)
         mock_django_auth.assert_called_once_with(request)
 
+    @patch('user.auth.django_auth')
+    def test_authenticate_resolves_cached_guest_without_queries(
+            self, mock_django_auth):
+        """
+        Test that a guest resolved once is served from the cache afterwards.
+        """
+        request = self.factory.get('/')
+        self._add_session_to_request(request)
+
+        guest_user = create_guest_user()
+        request.session['guest_user_id'] = str(guest_user.id)
+        mock_django_auth.return_value = None
+
+        self.auth_handler.authenticate(request)
+        with self.assertNumQueries(0):
+            result_user = self.auth_handler.authenticate(request)
+
+        self.assertEqual(result_user, guest_user)
+
+    @patch('user.auth.django_auth')
+    @patch('user.auth.create_guest_user')
+    def test_authenticate_ignores_invalidated_guest(
+            self, mock_create_guest, mock_django_auth):
+        """Test that an invalidated guest is looked up again."""
+        request = self.factory.get('/')
+        self._add_session_to_request(request)
+
+        guest_user = create_guest_user()
+        request.session['guest_user_id'] = str(guest_user.id)
+        mock_django_auth.return_value = None
+        self.auth_handler.authenticate(request)
+
+        guest_user_id = str(guest_user.id)
+        guest_user.delete()
+        get_guest_user_cache().delete_many([guest_user_id])
+        new_guest_user = User.objects.create_user(
+            username='guest_new',
+            is_guest=True
+        )
+        mock_create_guest.return_value = new_guest_user
+
+        result_user = self.auth_handler.authenticate(request)
+
+        self.assertEqual(result_user, new_guest_user)
+
     @patch('user.auth.django_auth')
     @patch('user.auth.create_guest_user')
     def test_authenticate_creates_new_guest_when_session_user_not_found(
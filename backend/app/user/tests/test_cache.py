@@ -0,0 +1,71 @@
+from unittest.mock import patch
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+
+from user.cache import (
+    DjangoUserCache,
+    LocalUserCache,
+    get_guest_user_cache,
+    invalidate_guest_users,
+)
+
+User = get_user_model()
+
+
+class LocalUserCacheTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='guest', is_guest=True)
+
+    def test_get_returns_copy_of_cached_user(self):
+        """Test that cached users are returned as independent copies."""
+        cache = LocalUserCache({})
+        cache.set('key', self.user)
+        cached = cache.get('key')
+        self.assertEqual(cached, self.user)
+        cached.username = 'changed'
+        self.assertEqual(cache.get('key').username, 'guest')
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test that the cache keeps at most MAX_ENTRIES entries."""
+        cache = LocalUserCache({'MAX_ENTRIES': 2})
+        cache.set('a', self.user)
+        cache.set('b', self.user)
+        cache.get('a')
+        cache.set('c', self.user)
+        self.assertIsNotNone(cache.get('a'))
+        self.assertIsNone(cache.get('b'))
+        self.assertIsNotNone(cache.get('c'))
+
+    @patch('user.cache.time.monotonic')
+    def test_entries_expire_after_timeout(self, mock_monotonic):
+        """Test that entries are dropped once their timeout has passed."""
+        cache = LocalUserCache({'TIMEOUT': 10})
+        mock_monotonic.return_value = 100
+        cache.set('key', self.user)
+        mock_monotonic.return_value = 109
+        self.assertIsNotNone(cache.get('key'))
+        mock_monotonic.return_value = 110
+        self.assertIsNone(cache.get('key'))
+
+    def test_delete_many(self):
+        """Test invalidating entries."""
+        cache = LocalUserCache({})
+        cache.set('a', self.user)
+        cache.delete_many(['a', 'missing'])
+        self.assertIsNone(cache.get('a'))
+
+
+class GuestUserCacheSettingsTests(TestCase):
+    @override_settings(GUEST_USER_CACHE={
+        'BACKEND': 'user.cache.DjangoUserCache',
+        'CACHE_ALIAS': 'default',
+    })
+    def test_django_cache_backend(self):
+        """Test that the backend is selected through settings."""
+        user = User.objects.create_user(username='guest', is_guest=True)
+        cache = get_guest_user_cache()
+        self.assertIsInstance(cache, DjangoUserCache)
+        cache.set(str(user.id), user)
+        self.assertEqual(cache.get(str(user.id)), user)
+        invalidate_guest_users([user.id])
+        self.assertIsNone(cache.get(str(user.id)))
@@ -4,6 +4,12 @@ from django.test import TestCase
 from django.utils import timezone
 from unittest.mock import patch
 from datetime import datetime, timedelta
+from django.contrib.auth import get_user_model
+from django.contrib.sessions.models import Session
+
+from user.services import create_guest_user
+
+User = get_user_model()
 
 
 class CleanupGuestsCommandTests(TestCase):
@@ -46,3 +52,62 @@ class CleanupGuestsCommandTests(TestCase):
             timedelta(hours=self.grace_period)
         )
         self.assertEqual(kwargs["dry_run"], self.dry_run)
+
+    @patch('user.management.commands.cleanup_guests.cleanup_stale_guests')
+    @patch('user.management.commands.cleanup_guests.cleanup_unused_guests')
+    def test_handle_passes_batch_options(
+            self, mock_cleanup_unused, mock_cleanup_stale):
+        mock_cleanup_stale.return_value = 0
+        mock_cleanup_unused.return_value = 0
+
+        call_command(
+            'cleanup_guests',
+            '--batch-size', '50',
+            '--sleep-between', '0.5',
+            stdout=self.out
+        )
+
+        for mock_cleanup in (mock_cleanup_stale, mock_cleanup_unused):
+            _, kwargs = mock_cleanup.call_args
+            self.assertEqual(kwargs["batch_size"], 50)
+            self.assertEqual(kwargs["sleep_between"], 0.5)
+            self.assertIsNone(kwargs["deadline"])
+
+    def test_handle_streams_batch_progress(self):
+        for _ in range(3):
+            create_guest_user()
+        User.objects.filter(is_guest=True).update(
+            last_login=timezone.now() - timedelta(days=30))
+
+        call_command('cleanup_guests', '--batch-size', '2', stdout=self.out)
+
+        output = self.out.getvalue()
+        self.assertIn("Deleted 2 stale guests (2 so far)", output)
+        self.assertIn("Deleted 1 stale guests (3 so far)", output)
+        self.assertIn("Deleted 3 stale guests", output)
+
+    def test_handle_clears_expired_sessions(self):
+        """Test that expired sessions are removed from the database."""
+        now = timezone.now()
+        Session.objects.create(session_key='expired', session_data='',
+                               expire_date=now - timedelta(days=1))
+        Session.objects.create(session_key='active', session_data='',
+                               expire_date=now + timedelta(days=1))
+
+        call_command('cleanup_guests', stdout=self.out)
+
+        self.assertEqual(
+            list(Session.objects.values_list('session_key', flat=True)),
+            ['active'],
+        )
+        self.assertIn("Cleared expired sessions", self.out.getvalue())
+
+    def test_dry_run_keeps_expired_sessions(self):
+        """Test that a dry run does not remove expired sessions."""
+        Session.objects.create(
+            session_key='expired', session_data='',
+            expire_date=timezone.now() - timedelta(days=1))
+
+        call_command('cleanup_guests', '--dry-run', stdout=self.out)
+
+        self.assertTrue(Session.objects.exists())
@@ -1,7 +1,11 @@
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.contrib.auth import get_user_model
 from unittest.mock import Mock
-from board.models import Board
+from board.models import Board, Column
+from card.models import Card
+from user.cache import get_guest_user_cache
 from user.pipeline import (
     create_default_board_pipeline,
     sync_user_details,
@@ -51,6 +55,19 @@ class CreateDefaultBoardPipelineTests(TestCase):
         )
         self.assertEqual(Board.objects.filter(user=self.user).count(), 0)
 
+    def test_create_default_board_pipeline_merge_virtual_guest(self):
+        """
+        Test that a board is created when merging a guest that was never
+        persisted.
+        """
+        self.strategy.request.session = {'guest_migration_action': 'merge'}
+        create_default_board_pipeline(
+            strategy=self.strategy,
+            user=self.user,
+            is_new=True
+        )
+        self.assertEqual(Board.objects.filter(user=self.user).count(), 1)
+
 
 class SyncUserDetailsPipelineTests(TestCase):
     def test_sync_user_details_google_oauth2(self):
@@ -111,6 +128,34 @@ class HandleGuestUserTests(TestCase):
 
     def test_handle_guest_user_discard_action(self):
         """Test discarding guest user when action is 'discard'."""
+        board = Board.objects.create(user=self.guest_user, title='Board')
+        column = Column.objects.create(board=board, title='To Do')
+        Card.objects.create(column=column, title='Card')
+        self.strategy.request.session.get.side_effect = lambda key: {
+            'guest_migration_action': 'discard',
+            'guest_user_id': str(self.guest_user.id)
+        }.get(key)
+
+        with CaptureQueriesContext(connection) as ctx:
+            handle_guest_user(
+                strategy=self.strategy,
+                backend=self.backend,
+                user=self.registered_user
+            )
+
+        self.assertFalse(User.objects.filter(
+            id=str(self.guest_user.id)).exists())
+        self.assertFalse(Board.objects.filter(id=board.id).exists())
+        self.assertFalse(Card.objects.filter(column=column).exists())
+        # The board tree is deleted by the database, without loading it.
+        self.assertFalse(any(
+            table in q['sql'] for q in ctx.captured_queries
+            for table in ('"board_board"', '"board_column"', '"card_card"')))
+
+    def test_handle_guest_user_invalidates_cached_guest(self):
+        """Test that a merged or discarded guest is dropped from the cache."""
+        cache = get_guest_user_cache()
+        cache.set(str(self.guest_user.id), self.guest_user)
         self.strategy.request.session.get.side_effect = lambda key: {
             'guest_migration_action': 'discard',
             'guest_user_id': str(self.guest_user.id)
@@ -122,8 +167,7 @@ class HandleGuestUserTests(TestCase):
             user=self.registered_user
         )
 
-        self.assertFalse(User.objects.filter(
-            id=str(self.guest_user.id)).exists())
+        self.assertIsNone(cache.get(str(self.guest_user.id)))
 
     def test_handle_guest_user_no_action(self):
         """Test that nothing happens when no action is set."""
@@ -4,12 +4,15 @@ from django.utils import timezone
 from datetime import timedelta
 
 from board.models import Board, Column
+from card.models import Card
+from user.cache import get_guest_user_cache
 from user.services import (
     create_guest_user,
     create_user_with_board,
     create_default_board,
     merge_guest_user,
-    cleanup_stale_guests
+    cleanup_stale_guests,
+    delete_users_in_batches,
 )
 
 User = get_user_model()
@@ -114,6 +117,36 @@ class MergeGuestUserTests(TestCase):
         self.assertEqual(Board.objects.filter(
             user_id=self.guest_user.id).count(), 0)
 
+    def test_merge_guest_user_orders_boards_after_existing(self):
+        """Test merged boards follow the registered user's boards."""
+        existing = Board.objects.create(
+            user=self.registered_user, title="Existing")
+        merge_guest_user(self.guest_user, self.registered_user)
+
+        boards = Board.objects.filter(
+            user=self.registered_user).order_by('order')
+        self.assertEqual(
+            [(board.title, board.order) for board in boards],
+            [(existing.title, 0), ("Guest Board 1", 1), ("Guest Board 2", 2)],
+        )
+
+    def test_merge_guest_user_query_count(self):
+        """Test the number of queries does not grow with guest boards."""
+        for i in range(10):
+            Board.objects.create(user=self.guest_user, title=f"Board {i}")
+        with self.assertNumQueries(9):
+            merge_guest_user(self.guest_user, self.registered_user)
+
+    def test_merge_guest_user_transfers_cards(self):
+        """Test that guest cards are owned by the registered user."""
+        column = Column.objects.create(
+            board=self.guest_board_1, title="To Do")
+        card = Card.objects.create(column=column, title="Card")
+        merge_guest_user(self.guest_user, self.registered_user)
+
+        card.refresh_from_db()
+        self.assertEqual(card.owner_id, self.registered_user.id)
+
     def test_merge_guest_user_deletes_guest_user(self):
         """Test that the guest user is deleted after merge."""
         guest_user_id = self.guest_user.id
@@ -209,6 +242,16 @@ class CleanupStaleGuestsTests(TestCase):
 
         self.assertFalse(Board.objects.filter(id=board_id).exists())
 
+    def test_cleanup_stale_guests_invalidates_cache(self):
+        """Test that deleted guests are dropped from the guest cache."""
+        cache = get_guest_user_cache()
+        cache.set(str(self.stale_guest.id), self.stale_guest)
+        cache.set(str(self.fresh_guest.id), self.fresh_guest)
+        cleanup_stale_guests(cutoff=self.cutoff)
+
+        self.assertIsNone(cache.get(str(self.stale_guest.id)))
+        self.assertIsNotNone(cache.get(str(self.fresh_guest.id)))
+
     def test_cleanup_stale_guests_edge_case_exact_cutoff(self):
         """Test user with last_login exactly at cutoff is not deleted."""
         exact_cutoff_guest = User.objects.create_user(
@@ -221,3 +264,44 @@ class CleanupStaleGuestsTests(TestCase):
 
         self.assertTrue(User.objects.filter(id=exact_cutoff_guest.id).exists())
         self.assertEqual(deleted_count, 2)
+
+
+class DeleteUsersInBatchesTests(TestCase):
+    def setUp(self):
+        self.guests = [
+            create_guest_user() for _ in range(5)
+        ]
+        column = self.guests[0].board_set.get().columns.first()
+        Card.objects.create(column=column, title="Card", priority="low")
+        self.queryset = User.objects.filter(is_guest=True)
+
+    def test_deletes_all_users_in_batches(self):
+        """Test users and their related rows are deleted batch by batch."""
+        batches = []
+        deleted = delete_users_in_batches(
+            self.queryset, batch_size=2,
+            on_batch=lambda count, total: batches.append((count, total)),
+        )
+
+        self.assertEqual(deleted, 5)
+        self.assertEqual(batches, [(2, 2), (2, 4), (1, 5)])
+        self.assertFalse(User.objects.filter(is_guest=True).exists())
+        self.assertFalse(Board.objects.exists())
+        self.assertFalse(Column.objects.exists())
+        self.assertFalse(Card.objects.exists())
+
+    def test_stops_at_deadline(self):
+        """Test no batch is started once the deadline has passed."""
+        deleted = delete_users_in_batches(
+            self.queryset, batch_size=2, deadline=0)
+
+        self.assertEqual(deleted, 0)
+        self.assertEqual(self.queryset.count(), 5)
+
+    def test_invalidates_cache(self):
+        """Test deleted users are dropped from the guest cache."""
+        cache = get_guest_user_cache()
+        cache.set(str(self.guests[0].id), self.guests[0])
+        delete_users_in_batches(self.queryset, batch_size=2)
+
+        self.assertIsNone(cache.get(str(self.guests[0].id)))
@@ -11,4 +11,4 @@ python manage.py collectstatic --noinput
 python manage.py migrate
 python manage.py check --deploy
 
-gunicorn app.wsgi:application --bind 0.0.0.0:8000
+gunicorn --config gunicorn.conf.py